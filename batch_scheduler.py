@@ -0,0 +1,89 @@
+"""
+Unattended batch scheduling.
+
+Replaces the "Press Enter to continue" prompt at batch boundaries with a
+checkpoint: the batch is logged, an optional cooldown runs, and the run waits
+for its time window (e.g. overnight only) before starting the next batch.
+Creating the stop file ends the run cleanly at the next entry or checkpoint.
+"""
+
+import logging
+import os
+import time
+from datetime import datetime, timedelta
+
+
+def parse_clock(value):
+    """'HH:MM' -> datetime.time"""
+    return datetime.strptime(value, "%H:%M").time()
+
+
+class BatchScheduler:
+    """Cooldowns, run window and stop file for unattended runs"""
+
+    def __init__(self, cooldown_seconds=0, run_window=None, stop_file=None, sleep=time.sleep, now=datetime.now):
+        self.cooldown_seconds = cooldown_seconds or 0
+        self.window = (parse_clock(run_window[0]), parse_clock(run_window[1])) if run_window else None
+        self.stop_file = stop_file
+        self.sleep = sleep
+        self.now = now
+
+    def in_window(self, moment=None):
+        """True when moment (default now) is inside the run window; windows may wrap midnight"""
+        if self.window is None:
+            return True
+        current = (moment or self.now()).time()
+        start, end = self.window
+        if start <= end:
+            return start <= current < end
+        return current >= start or current < end
+
+    def seconds_until_window(self, moment=None):
+        """Seconds until the run window next opens (0 when already inside it)"""
+        moment = moment or self.now()
+        if self.in_window(moment):
+            return 0.0
+        opens = datetime.combine(moment.date(), self.window[0])
+        if opens <= moment:
+            opens += timedelta(days=1)
+        return (opens - moment).total_seconds()
+
+    def stop_requested(self):
+        """True once the stop file exists"""
+        return bool(self.stop_file) and os.path.exists(self.stop_file)
+
+    def pause(self, seconds):
+        """Sleep in short steps so the stop file is noticed; False if a stop was requested"""
+        remaining = seconds
+        while remaining > 0:
+            if self.stop_requested():
+                return False
+            step = min(remaining, 30)
+            self.sleep(step)
+            remaining -= step
+        return not self.stop_requested()
+
+    def wait_for_window(self):
+        """Block until the run window is open; False if a stop was requested meanwhile"""
+        waiting = self.seconds_until_window()
+        if waiting > 0:
+            opens = self.now() + timedelta(seconds=waiting)
+            logging.info(f"🌙 Outside the run window - waiting until {opens:%H:%M}")
+        while waiting > 0:
+            if not self.pause(min(waiting, 60)):
+                return False
+            waiting = self.seconds_until_window()
+        return not self.stop_requested()
+
+    def checkpoint(self, batch_number, next_index):
+        """Batch boundary: cool down and wait for the run window; False means stop the run"""
+        logging.info(f"📌 Checkpoint after batch {batch_number} - next entry {next_index + 1}")
+        if self.stop_requested():
+            logging.info(f"🛑 Stop file {self.stop_file} found")
+            return False
+        if self.cooldown_seconds:
+            logging.info(f"😴 Cooling down for {self.cooldown_seconds}s before the next batch")
+            if not self.pause(self.cooldown_seconds):
+                logging.info(f"🛑 Stop file {self.stop_file} found")
+                return False
+        return self.wait_for_window()
@@ -0,0 +1,3 @@
+"""
+Benchmark harness: a local mock Google Form and a runner that measures the automation against it
+"""
@@ -0,0 +1,152 @@
+"""
+Local static replica of the DMSReg Google Form.
+
+Serves a ``viewform`` page with the 17 DMSReg text fields in the Google Forms
+DOM shape the automation looks for (``div[role='listitem']`` containers with a
+``div[role='heading']`` label, a text input and a ``div[role='button']``
+Submit), plus ``FB_PUBLIC_LOAD_DATA_`` for the HTTP engine. Submitting lands on
+a ``formResponse`` confirmation page with a "Submit another response" link.
+Every received submission is kept on ``server.submissions``.
+"""
+
+import html
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs
+
+FORM_PATH = "/forms/d/e/BENCHMARK/viewform"
+RESPONSE_PATH = "/forms/d/e/BENCHMARK/formResponse"
+
+FORM_LABELS = [
+    "Registration Number",
+    "Name",
+    "Email Address",
+    "Middle Initial",
+    "Blood Group",
+    "Age",
+    "Mobile Number",
+    "Weight in Kgs.",
+    "Gender",
+    "Degree",
+    "Institute",
+    "Stream",
+    "Register joining code",
+    "Age in Company (Years)",
+    "Work Experience",
+    "Current City",
+    "Region",
+]
+
+FIRST_ENTRY_ID = 1000001
+
+
+def entry_id(position):
+    """entry.<id> of the field at position in FORM_LABELS"""
+    return FIRST_ENTRY_ID + position
+
+
+def render_form_page():
+    """viewform page: 17 listitem fields, a Submit button and FB_PUBLIC_LOAD_DATA_"""
+    items = []
+    for position, label in enumerate(FORM_LABELS):
+        items.append(
+            '<div role="listitem"><div class="field">'
+            f'<div role="heading">{html.escape(label)}<span aria-label="Required question"> *</span></div>'
+            f'<input type="text" name="entry.{entry_id(position)}" aria-label="Your answer">'
+            '</div></div>'
+        )
+    load_data = [None, [None, [
+        [position, label, None, 0, [[entry_id(position), None, 1]]] for position, label in enumerate(FORM_LABELS)
+    ]], "/forms", "DMSReg benchmark"]
+    return (
+        "<!DOCTYPE html><html><head><title>DMSReg benchmark form</title></head><body>"
+        f'<div role="main"><form id="mG61Hd" method="POST" action="{RESPONSE_PATH}">'
+        '<input type="hidden" name="fbzx" value="-424242">'
+        + "".join(items) +
+        '<div role="button" data-value="Submit" tabindex="0" '
+        "onclick=\"document.getElementById('mG61Hd').submit()\"><span>Submit</span></div>"
+        "</form></div>"
+        f"<script>var FB_PUBLIC_LOAD_DATA_ = {json.dumps(load_data)};</script>"
+        "</body></html>"
+    )
+
+
+def render_confirmation_page():
+    """formResponse page shown after a submission"""
+    return (
+        "<!DOCTYPE html><html><head><title>DMSReg benchmark form</title></head><body>"
+        '<div role="main"><div>Your response has been recorded.</div>'
+        f'<a href="{FORM_PATH}">Submit another response</a></div>'
+        "</body></html>"
+    )
+
+
+class MockFormHandler(BaseHTTPRequestHandler):
+    """Serve the viewform and formResponse pages"""
+
+    protocol_version = "HTTP/1.1"
+    # Headers and body are written separately - without TCP_NODELAY every keep-alive
+    # response waits for a delayed ACK and the benchmark measures the stub, not the client
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        pass
+
+    def reply(self, status, body):
+        data = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        if self.path.split("?", 1)[0] == FORM_PATH:
+            self.reply(200, render_form_page())
+        else:
+            self.reply(404, "not found")
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        fields = parse_qs(self.rfile.read(length).decode("utf-8"))
+        if self.path.split("?", 1)[0] == RESPONSE_PATH:
+            with self.server.lock:
+                self.server.submissions.append({name: values[0] for name, values in fields.items()})
+            self.reply(200, render_confirmation_page())
+        else:
+            self.reply(404, "not found")
+
+
+class MockFormServer:
+    """Run the mock form on a local port in a background thread"""
+
+    def __init__(self, host="127.0.0.1", port=0):
+        self.server = ThreadingHTTPServer((host, port), MockFormHandler)
+        self.server.submissions = []
+        self.server.lock = threading.Lock()
+        self.thread = None
+
+    @property
+    def form_url(self):
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}{FORM_PATH}"
+
+    @property
+    def submissions(self):
+        return self.server.submissions
+
+    def start(self):
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
@@ -0,0 +1,249 @@
+"""
+Benchmark RobustAutomation against the local mock Google Form.
+
+Usage:
+    python benchmarks/run_benchmark.py --rows 50 --strategy js_batch
+    python benchmarks/run_benchmark.py --rows 50 --update-baseline
+    python benchmarks/run_benchmark.py --engine http --rows 500
+
+Reports entries/sec, per-phase latency (p50/p95/p99) and WebDriver commands per
+entry, and compares them with benchmarks/baseline.json. Exits with status 1 when
+throughput drops or command counts grow by more than --tolerance.
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from unittest.mock import patch
+
+import pandas as pd
+
+# Allow running as a script from the repository root
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import robust_automation
+from benchmarks.mock_form import FORM_LABELS, MockFormServer
+from config import MANUAL_FIELD_MAPPING
+from command_profiler import CommandProfiler
+from entry_metrics import percentile
+from http_engine import HttpFormEngine
+from robust_automation import FILL_STRATEGIES, RobustAutomation
+from tab_pool import FormTabPool
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+FIRST_NAMES = ["Aarav", "Diya", "Kabir", "Meera", "Rohan", "Sara", "Vivaan", "Anika"]
+CITIES = ["Pune", "Mumbai", "Delhi", "Chennai", "Kolkata", "Bengaluru"]
+
+
+def synthetic_rows(count, seed=42):
+    """Deterministic DMSReg-shaped rows keyed by the Excel column names"""
+    rng = random.Random(seed)
+    rows = []
+    for number in range(count):
+        name = rng.choice(FIRST_NAMES)
+        values = {
+            "Registration Number": f"REG{100000 + number}",
+            "Name": f"{name} {chr(65 + number % 26)}",
+            "Email Address": f"{name.lower()}.{number}@example.com",
+            "Middle Initial": chr(65 + rng.randrange(26)),
+            "Blood Group": rng.choice(["A+", "B+", "O+", "AB-"]),
+            "Age": str(rng.randint(21, 58)),
+            "Mobile Number": f"9{rng.randint(100000000, 999999999)}",
+            "Weight in Kgs.": str(rng.randint(45, 95)),
+            "Gender": rng.choice(["Male", "Female"]),
+            "Degree": rng.choice(["B.Tech", "M.Tech", "MBA", "B.Sc"]),
+            "Institute": rng.choice(["IIT", "NIT", "BITS", "VIT"]),
+            "Stream": rng.choice(["CSE", "ECE", "ME", "Civil"]),
+            "Register joining code": f"J{rng.randint(1000, 9999)}",
+            "Age in Company (Years)": str(rng.randint(0, 20)),
+            "Work Experience": str(rng.randint(0, 30)),
+            "Current City": rng.choice(CITIES),
+            "Region": rng.choice(["North", "South", "East", "West"]),
+        }
+        rows.append({MANUAL_FIELD_MAPPING[label]: values[label] for label in FORM_LABELS})
+    return pd.DataFrame(rows)
+
+
+def run_browser_benchmark(form_url, data, strategy, tabs=1):
+    """Submit data through headless Chrome; returns the result dict"""
+    # The automation reads the form URL from its config - point it at the mock form for this run only
+    with patch.object(robust_automation, "GOOGLE_FORM_URL", form_url):
+        automation = RobustAutomation()
+        automation.pacer.sleep = lambda seconds: None  # measure the engine, not the pacing delays
+        if not automation.setup_driver(headless=True):
+            raise RuntimeError("Could not launch headless Chrome")
+
+        try:
+            automation.load_form_page()
+            automation.wait_for_form_ready()
+            automation.build_form_index()
+            if tabs > 1:
+                automation.tab_pool = FormTabPool(automation.driver, form_url, tabs)
+                automation.tab_pool.open()
+
+            profiler = CommandProfiler().attach(automation.driver)
+            successful = 0
+            start = time.perf_counter()
+            for index, row_data in data.iterrows():
+                automation.metrics.start_entry(index)
+                profiler.start_entry(index)
+                submitted = automation.fill_form(row_data, index, strategy)
+                if submitted:
+                    successful += 1
+                    if index + 1 < len(data):
+                        automation.ensure_form_loaded(index + 1, interactive=False)
+                automation.metrics.finish_entry(submitted)
+                profiler.finish_entry()
+            elapsed = time.perf_counter() - start
+
+            report = automation.metrics.batch_report()
+            return {
+                "engine": "browser",
+                "strategy": strategy,
+                "tabs": tabs,
+                "rows": len(data),
+                "successful": successful,
+                "seconds": elapsed,
+                "entries_per_second": len(data) / elapsed if elapsed > 0 else 0.0,
+                "commands_per_entry": profiler.total_commands() / len(data) if len(data) else 0.0,
+                "commands": profiler.command_counts(),
+                "methods": profiler.breakdown()[:15],
+                "phases": report["phases"],
+            }
+        finally:
+            automation.driver.quit()
+
+
+def run_http_benchmark(form_url, data):
+    """Submit data through the browserless HTTP engine; returns the result dict"""
+    engine = HttpFormEngine(form_url, MANUAL_FIELD_MAPPING)
+    if not engine.resolve_entry_ids():
+        raise RuntimeError("Could not resolve entry IDs from the mock form")
+
+    successful = 0
+    latencies = []
+    start = time.perf_counter()
+    for index, row_data in data.iterrows():
+        submit_start = time.perf_counter()
+        if engine.submit_row(row_data, index):
+            successful += 1
+        latencies.append(time.perf_counter() - submit_start)
+    elapsed = time.perf_counter() - start
+
+    return {
+        "engine": "http",
+        "strategy": "http",
+        "tabs": 1,
+        "rows": len(data),
+        "successful": successful,
+        "seconds": elapsed,
+        "entries_per_second": len(data) / elapsed if elapsed > 0 else 0.0,
+        "commands_per_entry": 0.0,
+        "commands": {},
+        "phases": {"total": {f"p{percent}": percentile(latencies, percent) for percent in (50, 95, 99)}} if latencies else {},
+    }
+
+
+def baseline_key(result):
+    """Baseline entries are kept per engine/strategy/tab count"""
+    return f"{result['engine']}:{result['strategy']}:{result['tabs']}"
+
+
+def load_baseline(path=BASELINE_PATH):
+    """Read the baseline file ({} if there is none yet)"""
+    if not os.path.exists(path):
+        return {}
+    with open(path, "r", encoding="utf-8") as baseline_file:
+        return json.load(baseline_file)
+
+
+def save_baseline(result, path=BASELINE_PATH):
+    """Store result as the baseline for its engine/strategy/tab count"""
+    baseline = load_baseline(path)
+    baseline[baseline_key(result)] = {
+        "entries_per_second": round(result["entries_per_second"], 3),
+        "commands_per_entry": round(result["commands_per_entry"], 2),
+        "total_p95": round(result["phases"].get("total", {}).get("p95", 0.0), 4),
+    }
+    with open(path, "w", encoding="utf-8") as baseline_file:
+        json.dump(baseline, baseline_file, indent=2, sort_keys=True)
+        baseline_file.write("\n")
+
+
+def compare_to_baseline(result, baseline, tolerance=0.2):
+    """List of regression messages (empty when result is within tolerance of its baseline)"""
+    reference = baseline.get(baseline_key(result))
+    if not reference:
+        return []
+    regressions = []
+    if result["entries_per_second"] < reference["entries_per_second"] * (1 - tolerance):
+        regressions.append(f"throughput {result['entries_per_second']:.2f} entries/s vs baseline {reference['entries_per_second']:.2f}")
+    if reference.get("commands_per_entry") and result["commands_per_entry"] > reference["commands_per_entry"] * (1 + tolerance):
+        regressions.append(f"{result['commands_per_entry']:.1f} WebDriver commands/entry vs baseline {reference['commands_per_entry']:.1f}")
+    total_p95 = result["phases"].get("total", {}).get("p95")
+    if total_p95 and reference.get("total_p95") and total_p95 > reference["total_p95"] * (1 + tolerance):
+        regressions.append(f"p95 entry time {total_p95 * 1000:.0f}ms vs baseline {reference['total_p95'] * 1000:.0f}ms")
+    return regressions
+
+
+def print_result(result):
+    """Human readable benchmark report"""
+    print(f"\n🏁 Benchmark: {result['engine']} / {result['strategy']} / {result['tabs']} tab(s)")
+    print(f"   Rows: {result['rows']} ({result['successful']} confirmed, {result.get('received', '?')} received by the mock form)")
+    print(f"   Time: {result['seconds']:.2f}s - {result['entries_per_second']:.2f} entries/sec")
+    if result["commands"]:
+        print(f"   WebDriver commands per entry: {result['commands_per_entry']:.1f}")
+        for command, count in list(result["commands"].items())[:8]:
+            print(f"      {command:<28} {count}")
+        for row in result.get("methods", [])[:8]:
+            print(f"      {row['method']:<28} {row['command']:<24} {row['count']:>6} x {row['seconds'] * 1000:7.0f}ms")
+    for name, values in result["phases"].items():
+        print(f"   {name:<18} p50 {values['p50'] * 1000:7.0f}ms   p95 {values['p95'] * 1000:7.0f}ms   p99 {values['p99'] * 1000:7.0f}ms")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the form automation against a local mock Google Form")
+    parser.add_argument("--rows", type=int, default=20, help="synthetic rows to submit")
+    parser.add_argument("--engine", choices=["browser", "http"], default="browser")
+    parser.add_argument("--strategy", choices=FILL_STRATEGIES, default="typed", help="fill strategy (browser engine)")
+    parser.add_argument("--tabs", type=int, default=1, help="pre-loaded tabs (browser engine)")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="baseline file to compare against")
+    parser.add_argument("--update-baseline", action="store_true", help="store this run as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed relative regression")
+    parser.add_argument("--json", help="also write the full result to this file")
+    args = parser.parse_args(argv)
+
+    data = synthetic_rows(args.rows)
+    with MockFormServer() as server:
+        if args.engine == "http":
+            result = run_http_benchmark(server.form_url, data)
+        else:
+            result = run_browser_benchmark(server.form_url, data, args.strategy, args.tabs)
+        result["received"] = len(server.submissions)
+
+    print_result(result)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as result_file:
+            json.dump(result, result_file, indent=2)
+
+    if args.update_baseline:
+        save_baseline(result, args.baseline)
+        print(f"💾 Baseline updated: {args.baseline}")
+        return 0
+
+    regressions = compare_to_baseline(result, load_baseline(args.baseline), args.tolerance)
+    if result["received"] != result["rows"]:
+        regressions.append(f"mock form received {result['received']} of {result['rows']} submissions")
+    for regression in regressions:
+        print(f"❌ Regression: {regression}")
+    if not regressions:
+        print("✅ No regression against the baseline")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,109 @@
+"""
+Managed Chrome launch: a trimmed headless profile and a cached chromedriver path.
+
+``build_launch_options`` starts Chrome with the background services, extensions
+and image decoding turned off, and ``block_resources`` drops images, fonts,
+media and analytics through the DevTools ``Network.setBlockedURLs`` command, so
+a form page loads only the HTML, CSS and JavaScript it needs to be filled.
+``resolve_driver_path`` remembers where ``ChromeDriverManager().install()`` put
+chromedriver, so later runs (and offline runners) start without a lookup.
+"""
+
+import json
+import logging
+import os
+from datetime import datetime
+
+from selenium.webdriver.chrome.options import Options
+from webdriver_manager.chrome import ChromeDriverManager
+
+from config import CHROMEDRIVER_PATH, DRIVER_PATH_CACHE
+
+# Flags that cut memory and background work without affecting how forms render
+LAUNCH_ARGUMENTS = [
+    "--disable-gpu",
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-background-timer-throttling",
+    "--disable-backgrounding-occluded-windows",
+    "--disable-renderer-backgrounding",
+    "--disable-component-update",
+    "--disable-default-apps",
+    "--disable-sync",
+    "--disable-translate",
+    "--disable-features=Translate,MediaRouter,OptimizationHints",
+    "--metrics-recording-only",
+    "--mute-audio",
+    "--no-first-run",
+    "--no-default-browser-check",
+    "--blink-settings=imagesEnabled=false",
+]
+
+# Content settings: 2 = block
+PROFILE_PREFERENCES = {
+    "profile.managed_default_content_settings.images": 2,
+    "profile.default_content_setting_values.notifications": 2,
+    "profile.default_content_setting_values.geolocation": 2,
+    "profile.default_content_setting_values.media_stream": 2,
+}
+
+
+def build_launch_options(headless=True, window_size="1920,1080", user_data_dir=None):
+    """Chrome options for a browser started (and owned) by the automation"""
+    options = Options()
+    if headless:
+        options.add_argument("--headless=new")
+    options.add_argument(f"--window-size={window_size}")
+    for argument in LAUNCH_ARGUMENTS:
+        options.add_argument(argument)
+    if user_data_dir:
+        options.add_argument(f"--user-data-dir={user_data_dir}")
+    options.add_experimental_option("prefs", PROFILE_PREFERENCES)
+    # Nothing waits for images or late subresources - return from driver.get at DOMContentLoaded
+    options.page_load_strategy = "eager"
+    return options
+
+
+def block_resources(driver, patterns):
+    """Block URL patterns (images, fonts, analytics...) for the driver's current browser"""
+    if not patterns:
+        return False
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": list(patterns)})
+        logging.info(f"🚫 Blocking {len(patterns)} resource patterns")
+        return True
+    except Exception as e:
+        logging.warning(f"⚠️ Could not block resources: {e}")
+        return False
+
+
+def resolve_driver_path(explicit_path=CHROMEDRIVER_PATH, cache_path=DRIVER_PATH_CACHE, refresh=False):
+    """chromedriver path: explicit setting, then the cached install, then ChromeDriverManager
+
+    ``refresh=True`` skips the cache (e.g. after Chrome auto-updated past the
+    cached chromedriver) and stores the freshly installed path.
+    """
+    if explicit_path:
+        return explicit_path
+
+    if cache_path and not refresh and os.path.exists(cache_path):
+        try:
+            with open(cache_path, "r", encoding="utf-8") as cache_file:
+                cached = json.load(cache_file).get("path")
+            if cached and os.path.exists(cached):
+                return cached
+            logging.info("🔎 Cached chromedriver is gone - resolving it again")
+        except (OSError, ValueError) as e:
+            logging.warning(f"⚠️ Ignoring unreadable chromedriver cache {cache_path}: {e}")
+
+    path = ChromeDriverManager().install()
+    if cache_path:
+        try:
+            with open(cache_path, "w", encoding="utf-8") as cache_file:
+                json.dump({"path": path, "resolved_at": datetime.now().isoformat(timespec="seconds")}, cache_file)
+        except OSError as e:
+            logging.warning(f"⚠️ Could not cache the chromedriver path: {e}")
+    return path
@@ -0,0 +1,326 @@
+"""
+Asyncio engine that drives Chrome over the DevTools Protocol directly.
+
+Instead of one blocking chromedriver HTTP round trip per Selenium call, every
+tab gets a CDP websocket on the debug port Chrome was started with
+(``start_chrome_debug.sh``). Commands are pipelined by id on that socket, the
+next entry's payload is staged while the current confirmation page is still
+loading, and several tabs are driven concurrently from one event loop.
+
+Requires the optional ``websockets`` package (``pip install websockets``).
+"""
+
+import asyncio
+import itertools
+import json
+import logging
+import time
+import urllib.parse
+import urllib.request
+
+from choice_fields import build_option_index, option_texts, resolve_choice
+from form_scripts import (
+    CONFIRMATION_CHECK_SCRIPT,
+    FIELD_COUNT_SCRIPT,
+    FORM_CHOICES_SCRIPT,
+    FORM_LABELS_SCRIPT,
+    LABELLED_FILL_SCRIPT,
+    SUBMIT_CLICK_SCRIPT,
+    as_expression,
+)
+from label_resolver import assign_labels
+from row_source import format_cell_value
+
+try:
+    import websockets
+except ImportError:  # optional dependency
+    websockets = None
+
+
+class CDPError(Exception):
+    """A CDP command returned an error"""
+
+
+class CDPSession:
+    """One websocket to a page target; commands are matched to replies by id so they can be pipelined"""
+    
+    def __init__(self, websocket):
+        self.websocket = websocket
+        self.ids = itertools.count(1)
+        self.pending = {}  # command id -> future
+        self.event_waiters = {}  # event method -> [future]
+        self.reader = asyncio.ensure_future(self.read_loop())
+    
+    async def read_loop(self):
+        """Dispatch replies and events as they arrive"""
+        try:
+            async for message in self.websocket:
+                payload = json.loads(message)
+                if "id" in payload:
+                    future = self.pending.pop(payload["id"], None)
+                    if future is None or future.done():
+                        continue
+                    if "error" in payload:
+                        future.set_exception(CDPError(payload["error"].get("message", str(payload["error"]))))
+                    else:
+                        future.set_result(payload.get("result", {}))
+                elif "method" in payload:
+                    for future in self.event_waiters.pop(payload["method"], []):
+                        if not future.done():
+                            future.set_result(payload.get("params", {}))
+        except Exception as e:
+            error = e
+        else:
+            error = CDPError("CDP connection closed")
+        for future in list(self.pending.values()) + [f for waiters in self.event_waiters.values() for f in waiters]:
+            if not future.done():
+                future.set_exception(error)
+    
+    def send_nowait(self, method, params=None):
+        """Send a command without waiting; returns the future of its result"""
+        command_id = next(self.ids)
+        future = asyncio.get_running_loop().create_future()
+        self.pending[command_id] = future
+        asyncio.ensure_future(self.websocket.send(json.dumps({"id": command_id, "method": method, "params": params or {}})))
+        return future
+    
+    async def send(self, method, params=None, timeout=30):
+        """Send a command and wait for its result"""
+        return await asyncio.wait_for(self.send_nowait(method, params), timeout)
+    
+    def expect_event(self, method):
+        """Future resolved by the next occurrence of an event (register before triggering it)"""
+        future = asyncio.get_running_loop().create_future()
+        self.event_waiters.setdefault(method, []).append(future)
+        return future
+    
+    async def evaluate(self, script, *args, timeout=30):
+        """Run an execute_script-style body in the page and return its value"""
+        result = await self.send("Runtime.evaluate", {
+            "expression": as_expression(script, *args),
+            "returnByValue": True,
+            "awaitPromise": True,
+        }, timeout=timeout)
+        if "exceptionDetails" in result:
+            raise CDPError(result["exceptionDetails"].get("text", "script error"))
+        return result.get("result", {}).get("value")
+    
+    async def close(self):
+        """Close the websocket and stop the reader"""
+        await self.websocket.close()
+        self.reader.cancel()
+
+
+class CDPFormEngine:
+    """Fill and submit rows in K tabs of the attached Chrome over CDP"""
+    
+    def __init__(self, debugger_address, form_url, field_mapping, tabs=2,
+                 form_load_timeout=10, confirm_timeout=10, poll_interval=0.05, connect=None, label_threshold=0.75):
+        self.debugger_address = debugger_address
+        self.form_url = form_url
+        self.field_mapping = field_mapping
+        self.tabs = tabs
+        self.form_load_timeout = form_load_timeout
+        self.confirm_timeout = confirm_timeout
+        self.poll_interval = poll_interval
+        self.connect = connect or self.connect_websocket
+        self.expected_field_count = None
+        self.label_threshold = label_threshold
+        self.label_map = None  # mapping label -> form label, compiled once from the first loaded tab
+        self.choice_options = {}  # mapping label -> (kind, options, option index) for radio/checkbox/dropdown fields
+        self.started_tabs = 0  # tabs of the current run() that loaded the form
+    
+    async def connect_websocket(self, websocket_url):
+        """Open the CDP websocket of a tab"""
+        if websockets is None:
+            raise ImportError("The CDP engine requires the websockets package: pip install websockets")
+        return await websockets.connect(websocket_url, max_size=None)
+    
+    def debug_endpoint(self, path, method="GET"):
+        """Call Chrome's /json HTTP endpoint (blocking - run in an executor)"""
+        request = urllib.request.Request(f"http://{self.debugger_address}{path}", method=method)
+        with urllib.request.urlopen(request, timeout=10) as response:
+            return json.loads(response.read().decode("utf-8") or "null")
+    
+    async def open_tab(self):
+        """Create a new tab on the form and return (target, session)"""
+        loop = asyncio.get_running_loop()
+        target = await loop.run_in_executor(
+            None, self.debug_endpoint, "/json/new?" + urllib.parse.quote(self.form_url, safe=""), "PUT"
+        )
+        try:
+            session = CDPSession(await self.connect(target["webSocketDebuggerUrl"]))
+            await asyncio.gather(session.send("Page.enable"), session.send("Runtime.enable"))
+        except Exception:
+            # The tab exists already - do not leave it behind in the user's browser
+            try:
+                await loop.run_in_executor(None, self.debug_endpoint, f"/json/close/{target['id']}")
+            except Exception:
+                pass
+            raise
+        return target, session
+    
+    async def close_tab(self, target, session):
+        """Close a tab opened by open_tab"""
+        try:
+            await session.close()
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, self.debug_endpoint, f"/json/close/{target['id']}")
+        except Exception:
+            pass
+    
+    async def poll(self, session, script, timeout, description, accept=bool):
+        """Poll a script until accept(value) is true (or time out)"""
+        start = time.perf_counter()
+        deadline = start + timeout
+        while time.perf_counter() < deadline:
+            value = await session.evaluate(script)
+            if accept(value):
+                logging.info(f"⏱️ [cdp] Waited {time.perf_counter() - start:.2f}s for {description}")
+                return value
+            await asyncio.sleep(self.poll_interval)
+        logging.warning(f"⚠️ [cdp] Timed out after {timeout}s waiting for {description}")
+        return None
+    
+    async def wait_for_form(self, session):
+        """Wait until all field containers have rendered"""
+        expected = self.expected_field_count
+        count = await self.poll(
+            session, FIELD_COUNT_SCRIPT, self.form_load_timeout, "form to load",
+            accept=lambda value: bool(value) and (expected is None or value == expected)
+        )
+        if count and self.expected_field_count is None:
+            self.expected_field_count = count
+        return bool(count)
+    
+    async def navigate_to_form(self, session):
+        """Load a fresh form in the tab"""
+        loaded = session.expect_event("Page.loadEventFired")
+        await session.send("Page.navigate", {"url": self.form_url})
+        try:
+            await asyncio.wait_for(loaded, self.form_load_timeout)
+        except asyncio.TimeoutError:
+            pass
+        return await self.wait_for_form(session)
+    
+    async def compile_labels(self, session):
+        """Match the mapping labels one-to-one against the form's labels (once per run)"""
+        if self.label_map is None:
+            form_labels = await session.evaluate(FORM_LABELS_SCRIPT) or []
+            assignment = assign_labels(list(self.field_mapping), form_labels, self.label_threshold)
+            self.label_map = {label: form_label for label, (form_label, _) in assignment.items()}
+            unmatched = [label for label in self.field_mapping if label not in self.label_map]
+            if unmatched:
+                logging.warning(f"⚠️ [cdp] No form field matches {unmatched}")
+            
+            choice_fields = {field["label"]: field for field in await session.evaluate(FORM_CHOICES_SCRIPT) or []}
+            self.choice_options = {}
+            for label, form_label in self.label_map.items():
+                field = choice_fields.get(form_label)
+                if field and field["options"]:
+                    self.choice_options[label] = (field["kind"], field["options"], build_option_index(field["options"]))
+        return self.label_map
+    
+    def stage_values(self, row_data):
+        """{label: value string, or option indexes for a choice field} for one row - computed ahead of time
+        
+        Returns None when a choice value matches none of the field's options.
+        """
+        values = {}
+        for label, excel_column in self.field_mapping.items():
+            if excel_column in row_data:
+                value = format_cell_value(row_data[excel_column])
+                if not value:
+                    continue
+                if label not in self.choice_options:
+                    values[label] = value
+                    continue
+                kind, options, option_index = self.choice_options[label]
+                selected = resolve_choice(option_index, value, kind)
+                if not selected:
+                    logging.error(f"❌ [cdp] '{value}' is not an option of '{label}' ({option_texts(options)})")
+                    return None
+                values[label] = [option["index"] for option in selected]
+        return values
+    
+    async def submit_entry(self, session, index, values):
+        """Fill one staged entry, submit it, and return True once the confirmation shows"""
+        if values is None:
+            # A choice value matched no option, so the form would only reject the entry
+            return False
+        result = await session.evaluate(LABELLED_FILL_SCRIPT, values, self.label_map or {}) or {}
+        if result.get("missing"):
+            logging.warning(f"⚠️ [cdp] Entry {index + 1}: no matching field for {result['missing']}")
+        if not await session.evaluate(SUBMIT_CLICK_SCRIPT):
+            logging.error(f"❌ [cdp] Entry {index + 1}: submit button not found")
+            return False
+        return bool(await self.poll(session, CONFIRMATION_CHECK_SCRIPT, self.confirm_timeout, "confirmation page"))
+    
+    async def tab_worker(self, tab_id, rows, on_result):
+        """Drive one tab: take staged rows off the shared iterator until it is exhausted"""
+        target, session = await self.open_tab()
+        try:
+            if not await self.wait_for_form(session):
+                logging.error(f"❌ [cdp] Tab {tab_id}: form did not load")
+                return
+            await self.compile_labels(session)
+            self.started_tabs += 1
+            
+            item = next(rows, None)
+            staged = (item[0], self.stage_values(item[1])) if item else None
+            while staged is not None:
+                index, values = staged
+                submission = asyncio.ensure_future(self.submit_entry(session, index, values))
+                
+                # Stage the next entry while this one is submitting and its confirmation loads
+                item = next(rows, None)
+                staged = (item[0], self.stage_values(item[1])) if item else None
+                
+                try:
+                    success = await submission
+                except Exception as e:
+                    logging.error(f"❌ [cdp] Entry {index + 1} failed: {e}")
+                    success = False
+                on_result(index, success)
+                
+                if staged is None:
+                    break
+                try:
+                    loaded = await self.navigate_to_form(session)
+                except Exception as e:
+                    logging.error(f"❌ [cdp] Tab {tab_id}: navigation failed: {e}")
+                    loaded = False
+                if not loaded:
+                    logging.error(f"❌ [cdp] Tab {tab_id}: fresh form did not load")
+                    on_result(staged[0], False)
+                    staged = None
+        finally:
+            await self.close_tab(target, session)
+    
+    async def run(self, rows, on_result=None):
+        """Submit (index, row) pairs across all tabs; returns {row index: success}
+
+        Raises CDPError when not a single tab could be started.
+        """
+        if self.connect == self.connect_websocket and websockets is None:
+            raise ImportError("The CDP engine requires the websockets package: pip install websockets")
+        results = {}
+        self.started_tabs = 0
+        
+        def record(index, success):
+            results[index] = success
+            if on_result:
+                on_result(index, success)
+        
+        # A plain iterator shared by all tab workers on one event loop: each row is taken exactly once
+        rows = iter(rows)
+        outcomes = await asyncio.gather(
+            *(self.tab_worker(tab_id, rows, record) for tab_id in range(self.tabs)),
+            return_exceptions=True
+        )
+        for tab_id, outcome in enumerate(outcomes):
+            if isinstance(outcome, Exception):
+                logging.error(f"❌ [cdp] Tab {tab_id} stopped: {outcome}")
+        if not self.started_tabs:
+            raise CDPError(f"None of the {self.tabs} tabs could be started")
+        return dict(sorted(results.items()))
@@ -0,0 +1,90 @@
+"""
+Append-only, fsync'd checkpoint journal of row states.
+
+Each line is one JSON record ``{"row", "state", "hash", "ts"}``. The journal is
+replayed on open, so the latest state of every row is known without rewriting
+the file, and a torn last line from a crash is simply ignored.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+
+from preflight import match_columns, normalize_header, normalize_value
+
+ROW_STATES = ("pending", "filled", "submitted", "failed")
+
+
+def row_content_hash(row_data, columns, compact_columns=()):
+    """Stable hash of the mapped column values of a row
+
+    Values are hashed in their preflight-normalized form (trimmed, single-spaced,
+    no ``_x000D_``, ``26.0`` -> ``26``; spaces removed in compact_columns) and
+    columns are looked up with the preflight header matching, so a raw row and
+    its preflighted copy - from pandas or a streaming source - hash the same.
+    """
+    columns = list(columns)
+    matched = match_columns(list(row_data.keys()), columns)
+    values = []
+    for column in columns:
+        value = row_data[matched[column]] if column in matched else None
+        values.append([normalize_header(column), normalize_value(value, column in compact_columns)])
+    return hashlib.sha256(json.dumps(values, ensure_ascii=False).encode("utf-8")).hexdigest()
+
+
+class CheckpointJournal:
+    """Crash-safe record of which rows were filled, submitted or failed"""
+    
+    def __init__(self, path):
+        self.path = path
+        self.states = {}  # row index -> {"state", "hash"}
+        self.lock = threading.Lock()
+        self.replay()
+        self.file = open(path, "a", encoding="utf-8")
+    
+    def replay(self):
+        """Load the latest state of every row from the journal file"""
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, "r", encoding="utf-8") as journal_file:
+            for line in journal_file:
+                try:
+                    record = json.loads(line)
+                    self.states[record["row"]] = {"state": record["state"], "hash": record["hash"]}
+                except (ValueError, KeyError):
+                    # Torn write from a crash - everything before it is still valid
+                    continue
+        
+        in_doubt = [row for row, entry in self.states.items() if entry["state"] in ("pending", "filled")]
+        if in_doubt:
+            logging.warning(f"⚠️ Journal: {len(in_doubt)} rows were in flight at the last stop and will be retried: {sorted(in_doubt)[:10]}")
+        logging.info(f"📒 Journal replayed: {len(self.states)} rows, {self.submitted_count()} submitted")
+    
+    def record(self, row, state, row_hash):
+        """Append a state change and fsync it before returning"""
+        if state not in ROW_STATES:
+            raise ValueError(f"Unknown row state '{state}' (expected one of {ROW_STATES})")
+        line = json.dumps({"row": int(row), "state": state, "hash": row_hash, "ts": round(time.time(), 3)})
+        with self.lock:
+            self.file.write(line + "\n")
+            self.file.flush()
+            os.fsync(self.file.fileno())
+            self.states[int(row)] = {"state": state, "hash": row_hash}
+    
+    def is_submitted(self, row, row_hash):
+        """True if this exact row content was already confirmed submitted"""
+        entry = self.states.get(int(row))
+        return entry is not None and entry["state"] == "submitted" and entry["hash"] == row_hash
+    
+    def submitted_count(self):
+        """Number of rows whose latest state is submitted"""
+        return sum(1 for entry in self.states.values() if entry["state"] == "submitted")
+    
+    def close(self):
+        """Close the journal file"""
+        with self.lock:
+            if not self.file.closed:
+                self.file.close()
@@ -0,0 +1,61 @@
+"""
+Option index for choice fields (radio buttons, checkboxes and dropdowns).
+
+The options of every choice field are read once, together with the rest of the
+form schema, and indexed by normalized text and ``data-value``. Filling a
+choice field is then a dictionary lookup plus one scripted click, instead of
+scanning the options on every entry - and a value that matches no option fails
+before anything is sent to the browser.
+"""
+
+import re
+
+CHOICE_KINDS = ("radio", "checkbox", "listbox")
+
+# Separators between several ticked values in one checkbox cell ("Python, SQL")
+MULTI_VALUE_PATTERN = re.compile(r"\s*[,;|]\s*")
+
+
+def normalize_option(text):
+    """Case-, whitespace- and trailing-punctuation-insensitive form of an option text"""
+    text = re.sub(r"\s+", " ", str(text or "")).strip().casefold()
+    return text.rstrip(".:")
+
+
+def build_option_index(options):
+    """{normalized text or data-value: option} for one field; the first option wins on clashes"""
+    index = {}
+    for option in options:
+        for key in (option.get("text"), option.get("value")):
+            key = normalize_option(key)
+            if key and key not in index:
+                index[key] = option
+    return index
+
+
+def resolve_choice(option_index, value, kind):
+    """Options to select for a cell value; None when any part of it matches no option"""
+    option = option_index.get(normalize_option(value))
+    if option is not None:
+        return [option]
+    if kind != "checkbox":
+        return None
+
+    # Several ticked boxes in one cell
+    selected = []
+    for part in MULTI_VALUE_PATTERN.split(str(value)):
+        if not part:
+            continue
+        option = option_index.get(normalize_option(part))
+        if option is None:
+            return None
+        if option not in selected:
+            selected.append(option)
+    return selected or None
+
+
+def option_texts(options, limit=8):
+    """Short, printable list of a field's options for error messages"""
+    texts = [option.get("text") for option in options if option.get("text")]
+    shown = ", ".join(texts[:limit])
+    return shown + (f", ... (+{len(texts) - limit})" if len(texts) > limit else "")
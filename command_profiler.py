@@ -0,0 +1,136 @@
+"""
+Opt-in WebDriver command profiler.
+
+Every Selenium round trip - including the ones made by WebElement methods such
+as ``.text``, ``is_displayed()`` and ``get_attribute()`` - goes through
+``driver.execute``. The profiler wraps it, times each command and attributes it
+to the nearest calling method defined in ``robust_automation.py`` (or any other
+file passed as ``attribution_files``), so the breakdown shows which automation
+method spends the round trips.
+"""
+
+import json
+import logging
+import os
+import sys
+import threading
+import time
+
+
+class CommandProfiler:
+    """Count and time WebDriver commands per calling method, per entry and per run"""
+
+    def __init__(self, attribution_files=("robust_automation.py",)):
+        self.attribution_files = tuple(attribution_files)
+        self.run_stats = {}  # (method, command) -> [count, seconds]
+        self.entry_stats = {}
+        self.entry_index = None
+        self.driver = None
+        self.original_execute = None
+        self.file = None
+        self.lock = threading.Lock()
+
+    def attach(self, driver):
+        """Start profiling every command sent through driver"""
+        self.detach()
+        self.driver = driver
+        self.original_execute = driver.execute
+
+        def profiled_execute(driver_command, params=None):
+            method = self.calling_method()
+            start = time.perf_counter()
+            try:
+                return self.original_execute(driver_command, params)
+            finally:
+                self.add(method, driver_command, time.perf_counter() - start)
+
+        driver.execute = profiled_execute
+        logging.info("🔬 WebDriver command profiling enabled")
+        return self
+
+    def detach(self):
+        """Restore the driver's own execute"""
+        if self.driver is not None and self.original_execute is not None:
+            self.driver.execute = self.original_execute
+        self.driver = None
+        self.original_execute = None
+
+    def open(self, path):
+        """Append one JSON line per finished entry to path"""
+        self.close()
+        self.file = open(path, "a", encoding="utf-8")
+
+    def calling_method(self):
+        """Name of the innermost attributed function on the call stack"""
+        frame = sys._getframe(2)
+        while frame is not None:
+            if os.path.basename(frame.f_code.co_filename) in self.attribution_files and not frame.f_code.co_name.startswith("<"):
+                return frame.f_code.co_name
+            frame = frame.f_back
+        return "<other>"
+
+    def add(self, method, command, seconds):
+        """Record one command in the entry and run totals"""
+        with self.lock:
+            for stats in (self.entry_stats, self.run_stats):
+                counter = stats.setdefault((method, command), [0, 0.0])
+                counter[0] += 1
+                counter[1] += seconds
+
+    def start_entry(self, index):
+        """Begin a per-entry breakdown"""
+        with self.lock:
+            self.entry_index = index
+            self.entry_stats = {}
+
+    def finish_entry(self):
+        """Close the per-entry breakdown and append it to the profile file"""
+        with self.lock:
+            breakdown = self.breakdown(self.entry_stats)
+            record = {
+                "entry": self.entry_index,
+                "commands": sum(row["count"] for row in breakdown),
+                "seconds": round(sum(row["seconds"] for row in breakdown), 4),
+                "breakdown": breakdown,
+            }
+            self.entry_stats = {}
+        if self.file is not None:
+            self.file.write(json.dumps(record) + "\n")
+            self.file.flush()
+        return record
+
+    def breakdown(self, stats=None):
+        """Rows of {method, command, count, seconds}, most expensive first"""
+        stats = self.run_stats if stats is None else stats
+        rows = [
+            {"method": method, "command": command, "count": count, "seconds": round(seconds, 4)}
+            for (method, command), (count, seconds) in stats.items()
+        ]
+        return sorted(rows, key=lambda row: (-row["seconds"], -row["count"]))
+
+    def command_counts(self):
+        """Total count per WebDriver command for the run"""
+        counts = {}
+        for (method, command), (count, seconds) in self.run_stats.items():
+            counts[command] = counts.get(command, 0) + count
+        return dict(sorted(counts.items(), key=lambda item: -item[1]))
+
+    def total_commands(self):
+        """Number of WebDriver commands sent during the run"""
+        return sum(count for count, seconds in self.run_stats.values())
+
+    def print_summary(self, limit=15):
+        """Print the per-run breakdown by method and command"""
+        rows = self.breakdown()
+        if not rows:
+            return
+        total_seconds = sum(row["seconds"] for row in rows)
+        print(f"\n🔬 WebDriver commands: {self.total_commands()} in {total_seconds:.2f}s")
+        for row in rows[:limit]:
+            print(f"   {row['method']:<28} {row['command']:<28} {row['count']:>6} x  {row['seconds'] * 1000:8.0f}ms")
+
+    def close(self):
+        """Close the profile file"""
+        if self.file is not None:
+            self.file.close()
+            self.file = None
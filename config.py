@@ -2,7 +2,7 @@
 # Update these values according to your setup
 
 # File paths
-EXCEL_FILE_PATH = "SAMPLE.xlsx"  # Path to your Excel file with data (or rename to "DMSReg V 5.1 - 2K.xlsx")
+EXCEL_FILE_PATH = "SAMPLE.xlsx"  # Path to your Excel file with data (or rename to "DMSReg V 5.1 - 2K.xlsx") - .xlsx, .csv or .parquet
 GOOGLE_FORM_URL = "https://docs.google.com/forms/d/e/1FAIpQLSfBzhW78iVBmU8t55ZTy_570J2ECyKrgrx51BRgeSRHaCLfGw/viewform?pli=1"  # Your Google Form URL
 
 # Automation settings
@@ -10,15 +10,102 @@ START_INDEX = 1941  # Start from this entry (0-based indexing) - RESET FOR REAL
 END_INDEX = None  # End at this entry (None = process all entries)
 BATCH_SIZE = 59  # Process entries in batches of 50
 
+# Unattended scheduling - no prompts; batch boundaries become checkpoints
+UNATTENDED_MODE = False  # True = never wait for Enter (batch boundaries and failed form reloads recover automatically)
+BATCH_COOLDOWN_SECONDS = 0  # Pause between batches in unattended mode
+RUN_WINDOW = None  # Only submit between these local times, e.g. ("22:00", "06:00"); None = any time
+STOP_FILE_PATH = "STOP"  # Create this file to stop an unattended run cleanly at the next entry
+FORM_RECOVERY_ATTEMPTS = 3  # Unattended: form reload attempts (2s, 4s, 8s backoff) before an entry is given up
+
+# Row data loading
+ROW_SOURCE_MODE = "stream"  # "stream" = read only the mapped columns lazily from START_INDEX, "pandas" = load the whole file up front
+DATASET_CACHE_ENABLED = True  # Stream mode: convert the mapped columns once and memory-map them on later runs
+DATASET_CACHE_DIR = ".dataset_cache"  # Rebuilt automatically whenever the data file changes
+
+# Preflight - normalize and validate every row before the browser starts
+PREFLIGHT_ENABLED = True
+PREFLIGHT_REPORT_PATH = "rejected_rows.csv"  # Rows that failed validation, with the reason
+PREFLIGHT_CHUNK_SIZE = 1000  # Rows validated at a time when streaming (the sheet is never held in memory whole)
+# Excel column -> rule ("pattern" regex, "min"/"max" numeric range, "required", "remove_whitespace")
+VALIDATION_RULES = {
+    "Email Address": {"pattern": r"[^@\s]+@[^@\s]+\.[^@\s]+", "remove_whitespace": True, "required": True},
+    "Mobile Number": {"pattern": r"[0-9*+\-]{10,15}", "remove_whitespace": True},
+    "Age ": {"min": 14, "max": 100},
+    "Weight in Kgs.": {"min": 20, "max": 300},
+}
+
+# Checkpoint journal - remembers every row's state across crashes and restarts
+JOURNAL_ENABLED = True  # Append each row's state (pending/filled/submitted/failed) to the journal
+JOURNAL_FILE_PATH = "automation_journal.jsonl"
+AUTO_RESUME = True  # Skip rows the journal confirms as submitted instead of hand-editing START_INDEX
+DEDUP_ENABLED = True  # Never submit the same mapped row content twice to one form (across runs and within the sheet)
+DEDUP_INDEX_PATH = "submitted_rows.jsonl"  # Content hashes of submitted rows, keyed by form URL
+DEDUP_REPORT_PATH = "duplicate_rows.csv"  # Rows skipped as duplicates, with the entry they repeat
+
+# Per-entry phase timing (detection, label resolution, fill, submit click, confirmation wait, reload)
+METRICS_ENABLED = True  # Append one JSON line per entry and print p50/p95/p99 + entries/min after each batch
+METRICS_FILE_PATH = "entry_metrics.jsonl"
+PROFILE_WEBDRIVER = False  # Count and time every WebDriver command per calling method (adds a little overhead)
+PROFILE_FILE_PATH = "webdriver_profile.jsonl"  # Per-entry command breakdown, one JSON line per entry
+
 # Timing settings (in seconds) - MAXIMUM SPEED - NO MISTAKES
 DELAY_BETWEEN_FIELDS = 0.05  # Ultra-fast field filling (50ms)
 DELAY_BETWEEN_SUBMISSIONS_MIN = 0.5  # Ultra-fast submissions (500ms)
 DELAY_BETWEEN_SUBMISSIONS_MAX = 1.0  # Ultra-fast submissions (1s)
 DELAY_AFTER_SUBMISSION = 0.5  # Ultra-fast post-submission (500ms)
+ADAPTIVE_PACING = True  # Adjust the delays above at runtime: faster while submissions confirm cleanly,
+                        # slower on confirmation timeouts, missing fields and rate-limit pages
+PACING_STEP = 0.05  # Seconds taken off the delay between submissions after each clean submission
+PACING_BACKOFF = 2.0  # Delay multiplier on trouble (squared for a rate-limit page)
+PACING_MAX_DELAY = 30  # Ceiling for the delay between submissions while backing off
+
+# Wait settings (in seconds) - explicit waits return as soon as the page is ready,
+# these are only upper bounds
+FORM_LOAD_TIMEOUT = 10  # Fresh form / "Submit another response" until all fields render
+SUBMISSION_CONFIRM_TIMEOUT = 10  # Submit click until the confirmation page shows
+ELEMENT_WAIT_TIMEOUT = 5  # Single element waits (clickable buttons, field containers)
+WAIT_POLL_INTERVAL = 0.1  # How often wait conditions are re-checked
+
+# Fill strategy - how values are written into text fields
+# "typed" = character by character, "send_keys_whole" = one send_keys per field,
+# "js_batch" = every field of an entry in one execute_script (input/change events dispatched)
+FILL_STRATEGY = "typed"
 
 # Browser settings
 HEADLESS_MODE = False  # Set to True to run browser in background
 BROWSER_WINDOW_SIZE = "1920,1080"  # Browser window size
+CHROME_DEBUGGER_ADDRESS = "127.0.0.1:9222"  # Chrome started with start_chrome_debug.bat/.sh
+PRELOADED_TABS = 1  # Keep this many tabs of the form loaded and rotate through them after each submission (1 = single tab)
+BROWSER_LAUNCH_MODE = "attach"  # "attach" = use the Chrome on CHROME_DEBUGGER_ADDRESS, "launch" = start a trimmed Chrome ourselves
+                                # (always used when HEADLESS_MODE is True; only suits forms that need no sign-in,
+                                # unless CHROME_USER_DATA_DIR points at a signed-in profile)
+CHROME_USER_DATA_DIR = None  # Profile directory for launched Chrome (None = fresh temporary profile)
+BLOCKED_RESOURCE_PATTERNS = [  # Never downloaded by a launched Chrome - forms need none of these
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico",
+    "*.woff", "*.woff2", "*.ttf",
+    "*://fonts.gstatic.com/*", "*://www.google-analytics.com/*", "*://www.googletagmanager.com/*",
+]
+CHROMEDRIVER_PATH = None  # Fixed chromedriver binary (None = ChromeDriverManager, cached in DRIVER_PATH_CACHE)
+DRIVER_PATH_CACHE = ".chromedriver_path.json"  # Remembers where ChromeDriverManager installed chromedriver (refreshed when Chrome outgrows it)
+
+# Session health monitor - checks chromedriver/Chrome in the background instead of before every scan
+HEALTH_MONITOR_ENABLED = True
+HEALTH_CHECK_INTERVAL = 5  # Seconds between background checks
+HUNG_ENTRY_TIMEOUT = 120  # No entry finished for this long = hung tab/driver, the session is restarted
+SESSION_RECOVERY_ATTEMPTS = 3  # Reconnect attempts before the run stops
+CHROME_LAUNCH_COMMAND = None  # Relaunch Chrome if it died, e.g. ["/usr/bin/google-chrome", "--remote-debugging-port=9222", "--user-data-dir=/home/me/.config/chrome-debug"]
+
+# Submission engine
+SUBMISSION_ENGINE = "browser"  # "browser" = fill the form in Chrome, "http" = POST entry.<id> fields directly (no browser),
+                               # "cdp" = asyncio engine over Chrome DevTools Protocol (pip install websockets)
+CDP_TABS = 2  # Tabs driven concurrently by the CDP engine
+HTTP_POOL_SIZE = 4  # Keep-alive connections kept open by the HTTP engine
+HTTP_TIMEOUT = 15  # Seconds per HTTP request
+
+# Parallel worker pool settings
+PARALLEL_WORKERS = 1  # Number of browsers submitting in parallel (1 = single browser mode; >1 needs SUBMISSION_ENGINE = "browser")
+WORKER_DEBUG_PORTS = []  # Attach workers to these debug ports, e.g. [9222, 9223] (one worker per port); empty = launch headless Chrome per worker
+MAX_SUBMISSIONS_PER_MINUTE = 60  # Global submission rate limit shared by all workers
 
 # Logging settings
 LOG_LEVEL = "INFO"  # DEBUG, INFO, WARNING, ERROR
@@ -49,14 +136,24 @@ MANUAL_FIELD_MAPPING = {
     "Region": "Region"
 }
 
+# Form detection settings
+FORM_INTROSPECTION_MODE = "js"  # "js" = whole form schema in one execute_script, "selenium" = selector scan only
+LABEL_MATCH_THRESHOLD = 0.75  # Minimum similarity (0-1) for a MANUAL_FIELD_MAPPING label to take a differently worded form label
+FORM_SCHEMA_CACHE_ENABLED = True  # Remember the form's layout between runs (validated by a fingerprint on start)
+FORM_SCHEMA_CACHE_PATH = "form_schema_cache.json"  # Schema cache file, keyed by form URL
+
 # Form field selectors (advanced - only change if needed)
 FORM_FIELD_SELECTORS = {
     "text_input": "input[type='text'], input[type='email'], input[type='number'], textarea",
-    "choice_options": "div[role='radio'], div[role='checkbox']",
+    "choice_options": "div[role='radio'], div[role='checkbox'], div[role='option']",
+    "dropdown": "div[role='listbox']",
     "submit_button": "div[role='button'][data-value='Submit'], span[data-value='Submit']",
     "form_container": "div[role='main']"
 }
 
 # Retry settings
 RETRY_FAILED_ENTRIES = True  # Whether to retry failed entries
-MAX_RETRIES = 1  # Maximum number of retries per failed entry 
\ No newline at end of file
+MAX_RETRIES = 1  # Maximum number of retries per failed entry 
+RETRY_BASE_DELAY = 5  # Seconds before the first retry; doubles on every further attempt
+DEAD_LETTER_PATH = "dead_letter_rows.jsonl"  # Rows that still fail after MAX_RETRIES, with the reason
+REPLAY_DEAD_LETTERS = False  # True = submit the rows in DEAD_LETTER_PATH instead of the Excel range
@@ -0,0 +1,146 @@
+"""
+Pre-converted dataset cache for fast restarts.
+
+The mapped columns of the data file are converted once into a 2D numpy array
+of already-stringified cell values (see ``format_cell_value``) and saved as
+``.npy`` next to a small JSON key file. Later runs memory-map the array
+instead of re-parsing the workbook. The cache is keyed on the source file's
+absolute path, mtime, size and SHA-256, so any edit to the file rebuilds it.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import time
+
+import numpy as np
+
+from row_source import RowSource, open_row_source, format_cell_value
+
+CACHE_FORMAT_VERSION = 1
+
+
+def file_sha256(path, chunk_size=1024 * 1024):
+    """SHA-256 of a file's content"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as source_file:
+        for chunk in iter(lambda: source_file.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class CachedRowSource(RowSource):
+    """Row source over a memory-mapped array of stringified values"""
+    
+    def __init__(self, path, columns, values):
+        super().__init__(path, columns)
+        self.positions = [(name, position) for position, name in enumerate(columns)]
+        self.values = values
+    
+    def __len__(self):
+        return self.values.shape[0]
+    
+    def rows(self, start_index=0, end_index=None):
+        end_index = len(self) if end_index is None else min(end_index, len(self))
+        for index in range(start_index, end_index):
+            # Empty strings are empty cells - hand them back as None so they are skipped
+            yield index, {name: (str(value) if value else None) for (name, _), value in zip(self.positions, self.values[index])}
+
+
+class DatasetCache:
+    """Build and load the cached, stringified copy of a data file"""
+    
+    def __init__(self, cache_dir):
+        self.cache_dir = cache_dir
+    
+    def cache_paths(self, source_path):
+        """(.npy path, .json key path) for a source file"""
+        absolute = os.path.abspath(source_path)
+        stem = os.path.splitext(os.path.basename(absolute))[0]
+        name = f"{stem}-{hashlib.sha256(absolute.encode('utf-8')).hexdigest()[:12]}"
+        return os.path.join(self.cache_dir, name + ".npy"), os.path.join(self.cache_dir, name + ".json")
+    
+    def source_key(self, source_path, columns, with_hash=True):
+        """Identity of the source file and the cached columns"""
+        stat = os.stat(source_path)
+        key = {
+            "version": CACHE_FORMAT_VERSION,
+            "path": os.path.abspath(source_path),
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "columns": list(columns),
+        }
+        if with_hash:
+            key["sha256"] = file_sha256(source_path)
+        return key
+    
+    def load(self, source_path, columns):
+        """Return a CachedRowSource if a valid cache exists, else None"""
+        array_path, key_path = self.cache_paths(source_path)
+        if not (os.path.exists(array_path) and os.path.exists(key_path)):
+            return None
+        
+        with open(key_path, "r", encoding="utf-8") as key_file:
+            cached = json.load(key_file)
+        
+        current = self.source_key(source_path, columns, with_hash=False)
+        unchanged = all(cached.get(field) == current[field] for field in ("version", "path", "mtime_ns", "size"))
+        if not unchanged:
+            # mtime/size moved - the content may still be identical (e.g. a copy or touch)
+            if cached.get("version") != CACHE_FORMAT_VERSION or cached.get("sha256") != file_sha256(source_path):
+                return None
+            cached.update(mtime_ns=current["mtime_ns"], size=current["size"])
+            self.write_key(key_path, cached)
+        
+        # Compare with the columns the cache was built for - mapped columns missing from the file are never cached
+        if not set(current["columns"]) <= set(cached.get("requested_columns", cached["columns"])):
+            return None
+        
+        values = np.load(array_path, mmap_mode="r")
+        return CachedRowSource(source_path, cached["columns"], values)
+    
+    def build(self, source_path, columns):
+        """Convert the mapped columns of the source file into the cache"""
+        source = open_row_source(source_path, columns=columns)
+        try:
+            cached_columns = source.columns
+            rows = [[format_cell_value(row.get(name)) for name in cached_columns] for _, row in source.rows()]
+        finally:
+            source.close()
+        
+        values = np.array(rows, dtype=str).reshape(len(rows), len(cached_columns))
+        array_path, key_path = self.cache_paths(source_path)
+        os.makedirs(self.cache_dir, exist_ok=True)
+        np.save(array_path, values)
+        
+        key = self.source_key(source_path, columns)
+        key["requested_columns"] = key["columns"]
+        key["columns"] = cached_columns
+        self.write_key(key_path, key)
+        return CachedRowSource(source_path, cached_columns, np.load(array_path, mmap_mode="r"))
+    
+    def write_key(self, key_path, key):
+        """Write the key file atomically so a crash never leaves a half-written key"""
+        temp_path = key_path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as key_file:
+            json.dump(key, key_file, indent=2)
+        os.replace(temp_path, key_path)
+    
+    def load_or_build(self, source_path, columns):
+        """Load the cache, rebuilding it first if the source file changed"""
+        columns = list(columns)
+        start = time.perf_counter()
+        source = self.load(source_path, columns)
+        if source is not None:
+            logging.info(f"⚡ Loaded {len(source)} cached entries in {(time.perf_counter() - start) * 1000:.0f}ms")
+            return source
+        
+        source = self.build(source_path, columns)
+        logging.info(f"🗃️ Built dataset cache for {source_path} ({len(source)} entries) in {time.perf_counter() - start:.2f}s")
+        return source
+
+
+def load_cached_row_source(source_path, columns, cache_dir):
+    """Convenience wrapper: cached row source for source_path"""
+    return DatasetCache(cache_dir).load_or_build(source_path, columns)
@@ -0,0 +1,89 @@
+"""
+Duplicate-submission guard.
+
+Every confirmed submission appends ``{"form", "hash", "row", "ts"}`` to an
+fsync'd JSONL file, where ``hash`` is ``row_content_hash`` of the mapped
+columns. On open the records of the current form are loaded into a dict, so
+checking a row before filling it is one dictionary lookup - across restarts
+(a wrong ``START_INDEX``) as well as within a sheet that repeats rows. Rows
+still being submitted are claimed in memory so pipelined engines cannot send
+the same content twice either.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+
+from schema_cache import form_key
+
+
+class DedupIndex:
+    """Content hashes of the rows already submitted to one form"""
+
+    def __init__(self, path, form_url):
+        self.path = path
+        self.form = form_key(form_url)
+        self.submitted = {}  # row hash -> row index of the first submission
+        self.claimed = {}  # row hash -> row index currently being submitted
+        self.duplicates = []  # report rows: {"entry", "duplicate_of", "source", "hash"}
+        self.lock = threading.Lock()
+        self.replay()
+        self.file = open(path, "a", encoding="utf-8")
+
+    def replay(self):
+        """Load the hashes submitted to this form by earlier runs"""
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, "r", encoding="utf-8") as index_file:
+            for line in index_file:
+                try:
+                    record = json.loads(line)
+                    if record["form"] == self.form:
+                        self.submitted.setdefault(record["hash"], record["row"])
+                except (ValueError, KeyError):
+                    # Torn write from a crash - everything before it is still valid
+                    continue
+        logging.info(f"🧬 Dedup index: {len(self.submitted)} rows already submitted to this form")
+
+    def __len__(self):
+        return len(self.submitted)
+
+    def check(self, row, row_hash):
+        """Claim row_hash for row; returns the earlier row with the same content, or None if it is new"""
+        with self.lock:
+            if row_hash in self.submitted:
+                earlier, source = self.submitted[row_hash], "submitted before"
+            elif row_hash in self.claimed and self.claimed[row_hash] != int(row):
+                earlier, source = self.claimed[row_hash], "in flight"
+            else:
+                self.claimed[row_hash] = int(row)
+                return None
+            self.duplicates.append({"entry": int(row) + 1, "duplicate_of": earlier + 1, "source": source, "hash": row_hash})
+        if earlier == int(row):
+            logging.info(f"🧬 Entry {int(row) + 1} was already submitted to this form - skipping")
+        else:
+            logging.info(f"🧬 Entry {int(row) + 1} has the same content as entry {earlier + 1} ({source}) - skipping")
+        return earlier
+
+    def add(self, row, row_hash):
+        """Record a confirmed submission and fsync it before returning"""
+        line = json.dumps({"form": self.form, "hash": row_hash, "row": int(row), "ts": round(time.time(), 3)})
+        with self.lock:
+            self.file.write(line + "\n")
+            self.file.flush()
+            os.fsync(self.file.fileno())
+            self.submitted.setdefault(row_hash, int(row))
+            self.claimed.pop(row_hash, None)
+
+    def release(self, row_hash):
+        """The claimed row was not submitted - its content may be sent again"""
+        with self.lock:
+            self.claimed.pop(row_hash, None)
+
+    def close(self):
+        """Close the index file"""
+        with self.lock:
+            if not self.file.closed:
+                self.file.close()
@@ -0,0 +1,140 @@
+"""
+Per-entry phase timing.
+
+Hot-path methods run inside ``phase(name)`` blocks (or the ``timed_phase``
+decorator). Timing is exclusive: while a nested phase runs the outer one is
+paused, so time spent resolving labels inside ``fill_field`` counts as label
+resolution, not as filling. Each finished entry is appended to a JSONL metrics
+file and the batch report prints p50/p95/p99 per phase and entries/min.
+"""
+
+import functools
+import json
+import logging
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+PHASES = ("detection", "label_resolution", "fill", "submit_click", "confirmation_wait", "reload")
+
+
+def percentile(values, percent):
+    """Nearest-rank percentile of values (0.0 for an empty list)"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, -(-len(ordered) * percent // 100))
+    return ordered[int(rank) - 1]
+
+
+def timed_phase(name):
+    """Method decorator: run the method inside self.metrics.phase(name)"""
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            with self.metrics.phase(name):
+                return method(self, *args, **kwargs)
+        return wrapper
+    return decorator
+
+
+class EntryMetrics:
+    """Collect exclusive phase durations per entry and write them to a JSONL file"""
+
+    def __init__(self, path=None):
+        self.path = path
+        self.file = None
+        self.entry_index = None
+        self.entry_start = None
+        self.phases = {}
+        self.stack = []  # [name, started_at] of the running phases, innermost last
+        self.batch_entries = []
+        self.batch_start = time.perf_counter()
+
+    def open(self, path):
+        """Start appending finished entries to path"""
+        self.close()
+        self.path = path
+        self.file = open(path, "a", encoding="utf-8")
+        logging.info(f"📏 Writing per-entry phase timings to {path}")
+
+    def add(self, name, seconds):
+        """Add seconds to a phase of the current entry"""
+        self.phases[name] = self.phases.get(name, 0.0) + seconds
+
+    @contextmanager
+    def phase(self, name):
+        """Time the enclosed block as phase name, pausing the enclosing phase"""
+        now = time.perf_counter()
+        if self.stack:
+            outer = self.stack[-1]
+            self.add(outer[0], now - outer[1])
+        self.stack.append([name, now])
+        try:
+            yield
+        finally:
+            now = time.perf_counter()
+            _, started = self.stack.pop()
+            self.add(name, now - started)
+            if self.stack:
+                self.stack[-1][1] = now
+
+    def start_entry(self, index):
+        """Begin timing a new entry"""
+        self.entry_index = index
+        self.entry_start = time.perf_counter()
+        self.phases = {}
+
+    def finish_entry(self, success):
+        """Close the current entry, append it to the metrics file and the batch"""
+        if self.entry_start is None:
+            return None
+        record = {
+            "entry": self.entry_index,
+            "success": bool(success),
+            "total": round(time.perf_counter() - self.entry_start, 4),
+            "phases": {name: round(seconds, 4) for name, seconds in self.phases.items()},
+            "finished_at": datetime.now().isoformat(timespec="seconds"),
+        }
+        self.batch_entries.append(record)
+        if self.file is not None:
+            self.file.write(json.dumps(record) + "\n")
+            self.file.flush()
+        self.entry_start = None
+        return record
+
+    def batch_report(self):
+        """Percentiles per phase and throughput for the entries finished in this batch"""
+        elapsed = time.perf_counter() - self.batch_start
+        entries = self.batch_entries
+        report = {
+            "entries": len(entries),
+            "entries_per_minute": len(entries) / elapsed * 60 if elapsed > 0 else 0.0,
+            "phases": {},
+        }
+        names = list(PHASES) + sorted({name for entry in entries for name in entry["phases"]} - set(PHASES)) + ["total"]
+        for name in names:
+            if name == "total":
+                values = [entry["total"] for entry in entries]
+            else:
+                values = [entry["phases"].get(name, 0.0) for entry in entries if name in entry["phases"]]
+            if values:
+                report["phases"][name] = {f"p{percent}": percentile(values, percent) for percent in (50, 95, 99)}
+        return report
+
+    def print_batch_report(self):
+        """Print the batch report and start a new batch"""
+        report = self.batch_report()
+        if report["entries"]:
+            print(f"\n📏 Phase timings ({report['entries']} entries, {report['entries_per_minute']:.1f} entries/min):")
+            for name, values in report["phases"].items():
+                print(f"   {name:<18} p50 {values['p50'] * 1000:7.0f}ms   p95 {values['p95'] * 1000:7.0f}ms   p99 {values['p99'] * 1000:7.0f}ms")
+        self.batch_entries = []
+        self.batch_start = time.perf_counter()
+        return report
+
+    def close(self):
+        """Close the metrics file"""
+        if self.file is not None:
+            self.file.close()
+            self.file = None
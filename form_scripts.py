@@ -0,0 +1,226 @@
+"""
+JavaScript snippets run inside the Google Form page.
+
+They are written as ``execute_script`` bodies (``return ...``, ``arguments[0]``)
+and are shared by the Selenium code in ``robust_automation.py`` and the CDP
+engine, which wraps them in a function call.
+"""
+
+import json
+
+# Single round trip form introspection: returns the whole form schema as one JSON payload
+# (element references are serialized by WebDriver and come back as WebElements)
+FORM_INTROSPECTION_SCRIPT = """
+const clean = (text) => (text || '').replace(/\\s+/g, ' ').trim();
+const items = Array.from(document.querySelectorAll("div[role='listitem']"));
+return items.map((container) => {
+    const heading = container.querySelector("div[role='heading']");
+    let label = heading ? clean(heading.innerText) : '';
+    if (!label) {
+        const text = container.innerText || '';
+        label = clean(text.includes('Your answer') ? text.split('Your answer')[0] : text.split('\\n')[0]);
+    }
+    if (!label) {
+        label = clean(container.getAttribute('aria-label') || container.getAttribute('title'));
+    }
+    const required = !!container.querySelector("[aria-label='Required question']") ||
+        !!container.querySelector("[aria-required='true'], [required]") || /\\*$/.test(label);
+    label = label.replace(/\\s*\\*$/, '');
+
+    let kind = 'unknown';
+    let input = container.querySelector("input[type='text'], input[type='email'], input[type='number'], textarea, div[contenteditable='true']");
+    let options = [];
+    if (input) {
+        kind = input.tagName === 'TEXTAREA' ? 'textarea' :
+            (input.getAttribute('contenteditable') === 'true' ? 'contenteditable' : (input.type || 'text'));
+    } else {
+        const choices = Array.from(container.querySelectorAll("div[role='radio'], div[role='checkbox'], div[role='option']"));
+        const listbox = container.querySelector("div[role='listbox']");
+        if (listbox) {
+            kind = 'listbox';
+            input = listbox;
+        } else if (choices.length) {
+            kind = choices[0].getAttribute('role');
+        }
+        options = choices.map((option, index) => ({
+            text: clean(option.getAttribute('data-value') || option.getAttribute('data-answer-value') ||
+                option.getAttribute('aria-label') || option.innerText),
+            value: option.getAttribute('data-value') || option.getAttribute('data-answer-value'),
+            element: option,
+            index: index
+        })).filter((option) => option.text);
+    }
+    return {container: container, input: input, label: label, kind: kind, required: required, options: options,
+        heading: heading ? clean(heading.innerText) : ''};
+});
+"""
+
+# Schema cache fingerprint: the heading text of every field container, in page order
+FORM_FINGERPRINT_SCRIPT = """
+return Array.from(document.querySelectorAll("div[role='listitem']")).map((container) => {
+    const heading = container.querySelector("div[role='heading']");
+    return heading ? (heading.innerText || '').replace(/\\s+/g, ' ').trim() : '';
+});
+"""
+
+# Elements of a form whose schema is cached: arguments = ([[position, kind], ...], expected container count).
+# Returns null when the page no longer has the cached layout.
+CACHED_INDEX_SCRIPT = """
+const [fields, expectedCount] = arguments;
+const items = document.querySelectorAll("div[role='listitem']");
+if (items.length !== expectedCount) return null;
+return fields.map(([position, kind]) => {
+    const container = items[position];
+    if (!container) return null;
+    if (['radio', 'checkbox', 'listbox'].includes(kind)) {
+        return {
+            container: container,
+            input: kind === 'listbox' ? container.querySelector("div[role='listbox']") : null,
+            options: Array.from(container.querySelectorAll("div[role='radio'], div[role='checkbox'], div[role='option']"))
+        };
+    }
+    const input = container.querySelector("input[type='text'], input[type='email'], input[type='number'], textarea, div[contenteditable='true']");
+    return {container: container, input: input, options: []};
+});
+"""
+
+# Batch value injection: sets every (element, value) pair of an entry in one execute_script and
+# dispatches input/change events so Google Forms registers the new values
+JS_BATCH_FILL_SCRIPT = """
+const pairs = arguments[0];
+let filled = 0;
+for (const [element, value] of pairs) {
+    if (!element) continue;
+    if (element.isContentEditable) {
+        element.textContent = value;
+    } else {
+        const proto = element.tagName === 'TEXTAREA' ? HTMLTextAreaElement.prototype : HTMLInputElement.prototype;
+        Object.getOwnPropertyDescriptor(proto, 'value').set.call(element, value);
+    }
+    element.dispatchEvent(new Event('input', {bubbles: true}));
+    element.dispatchEvent(new Event('change', {bubbles: true}));
+    filled++;
+}
+return filled;
+"""
+
+# Select the options of one choice field in one call: arguments = (kind, control, [option elements]).
+# Dropdowns are opened first; radios/checkboxes already ticked are left alone. Returns the number selected.
+CHOICE_SELECT_SCRIPT = """
+const [kind, control, options] = arguments;
+let selected = 0;
+if (kind === 'listbox' && control && control.getAttribute('aria-expanded') !== 'true') {
+    control.click();
+}
+for (const option of options) {
+    if (!option) continue;
+    const state = kind === 'listbox' ? option.getAttribute('aria-selected') : option.getAttribute('aria-checked');
+    if (state !== 'true') option.click();
+    selected++;
+}
+return selected;
+"""
+
+# Click the form's Submit button; returns true when one was found
+SUBMIT_CLICK_SCRIPT = """
+const buttons = Array.from(document.querySelectorAll("div[role='button'], button, input[type='submit']"));
+const submit = buttons.find((button) => (button.innerText || button.value || '').trim().toLowerCase() === 'submit') ||
+    buttons.find((button) => (button.innerText || button.value || '').toLowerCase().includes('submit'));
+if (!submit) return false;
+submit.click();
+return true;
+"""
+
+# True once the post-submit confirmation page is showing
+CONFIRMATION_CHECK_SCRIPT = """
+return location.href.includes('formResponse') &&
+    /response has been recorded|another response|submit another/i.test(document.body ? document.body.innerText : '');
+"""
+
+# Number of rendered field containers
+FIELD_COUNT_SCRIPT = """
+return document.querySelectorAll("div[role='listitem']").length;
+"""
+
+# Unique CSS path of arguments[0] (id anchor or tag/role/nth-of-type chain) - used by the locator cache
+ELEMENT_SELECTOR_SCRIPT = """
+let node = arguments[0];
+const parts = [];
+while (node && node.nodeType === 1 && node !== document.body) {
+    if (node.id && document.querySelectorAll('#' + CSS.escape(node.id)).length === 1) {
+        parts.unshift('#' + CSS.escape(node.id));
+        return parts.join(' > ');
+    }
+    let part = node.tagName.toLowerCase();
+    const role = node.getAttribute('role');
+    if (role) part += `[role="${role}"]`;
+    const parent = node.parentElement;
+    if (parent) {
+        const siblings = Array.from(parent.children).filter((child) => child.tagName === node.tagName);
+        if (siblings.length > 1) part += `:nth-of-type(${siblings.indexOf(node) + 1})`;
+    }
+    parts.unshift(part);
+    node = parent;
+}
+parts.unshift('body');
+return parts.join(' > ');
+"""
+
+
+def as_expression(script, *args):
+    """Wrap an execute_script body into a self-invoking expression (for CDP Runtime.evaluate)"""
+    arguments = ", ".join(json.dumps(arg) for arg in args)
+    return f"(function() {{{script}}})({arguments})"
+
+
+# Labels of the form's fields, for compiling the label map the CDP engine passes to LABELLED_FILL_SCRIPT
+FORM_LABELS_SCRIPT = """
+const schema = (function() {""" + FORM_INTROSPECTION_SCRIPT + """})();
+return schema.map((field) => field.label).filter((label) => label);
+"""
+
+# Choice fields of the form with their options, for resolving cell values to options ahead of time (CDP engine)
+FORM_CHOICES_SCRIPT = """
+const schema = (function() {""" + FORM_INTROSPECTION_SCRIPT + """})();
+return schema.filter((field) => field.label && ['radio', 'checkbox', 'listbox'].includes(field.kind)).map((field) => ({
+    label: field.label,
+    kind: field.kind,
+    options: field.options.map((option) => ({text: option.text, value: option.value, index: option.index}))
+}));
+"""
+
+# Fill an entry given ({label: value or [option indexes]}, {label: form label}): introspect, look each label
+# up through the precompiled one-to-one map, batch-set the text inputs and select the resolved options of
+# choice fields in the same evaluation. Returns {filled, missing}.
+LABELLED_FILL_SCRIPT = """
+const values = arguments[0];
+const labelMap = arguments[1] || {};
+const schema = (function() {""" + FORM_INTROSPECTION_SCRIPT + """})();
+const byLabel = {};
+for (const field of schema) {
+    if (field.label && !(field.label in byLabel)) byLabel[field.label] = field;
+}
+const pairs = [];
+const choices = [];
+const missing = [];
+for (const [label, value] of Object.entries(values)) {
+    const field = byLabel[label in labelMap ? labelMap[label] : label];
+    const isChoice = field && ['radio', 'checkbox', 'listbox'].includes(field.kind);
+    if (isChoice && Array.isArray(value)) {
+        const options = value.map((index) => field.options.find((option) => option.index === index));
+        if (options.every((option) => option)) {
+            choices.push([field.kind, field.input, options.map((option) => option.element)]);
+            continue;
+        }
+    } else if (field && field.input && !isChoice && !Array.isArray(value)) {
+        pairs.push([field.input, value]);
+        continue;
+    }
+    missing.push(label);
+}
+let filled = (function() {""" + JS_BATCH_FILL_SCRIPT + """})(pairs);
+for (const [kind, control, options] of choices) {
+    if ((function() {""" + CHOICE_SELECT_SCRIPT + """})(kind, control, options)) filled++;
+}
+return {filled: filled, missing: missing};
+"""
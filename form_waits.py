@@ -0,0 +1,44 @@
+"""
+Explicit wait conditions for Google Form pages.
+
+Each condition follows the selenium ``expected_conditions`` convention: it is a
+callable taking the driver and returning a truthy value once the page is ready,
+so it can be passed straight to ``WebDriverWait.until``.
+"""
+
+from selenium.webdriver.common.by import By
+
+FIELD_CONTAINER_SELECTOR = "div[role='listitem']"
+
+CONFIRMATION_PHRASES = ["another response", "submit another", "response has been recorded"]
+
+RATE_LIMIT_PHRASES = ["unusual traffic", "too many requests", "try again later", "rate limit"]
+
+
+def form_fields_present(expected_count=None):
+    """Form fields are rendered: listitem count == expected_count (or at least one if unknown)"""
+    def _predicate(driver):
+        fields = driver.find_elements(By.CSS_SELECTOR, FIELD_CONTAINER_SELECTOR)
+        if expected_count is None:
+            return fields if fields else False
+        return fields if len(fields) == expected_count else False
+    return _predicate
+
+
+def confirmation_page_visible():
+    """The post-submit confirmation page is showing"""
+    def _predicate(driver):
+        if "formResponse" not in driver.current_url:
+            return False
+        body_text = driver.find_element(By.TAG_NAME, "body").text.lower()
+        return any(phrase in body_text for phrase in CONFIRMATION_PHRASES)
+    return _predicate
+
+
+def rate_limit_page_visible():
+    """The form answered with a throttling / unusual-traffic page"""
+    def _predicate(driver):
+        body_text = driver.find_element(By.TAG_NAME, "body").text.lower()
+        return any(phrase in body_text for phrase in RATE_LIMIT_PHRASES)
+    return _predicate
+
@@ -0,0 +1,193 @@
+"""
+Browserless submission engine for Google Forms.
+
+A Google Form submission is a POST of ``entry.<id>`` fields to the form's
+``formResponse`` URL. The entry IDs are read once from the ``viewform`` page
+(``FB_PUBLIC_LOAD_DATA_``), mapped to the labels in ``MANUAL_FIELD_MAPPING``,
+and every row is then submitted over a pooled keep-alive HTTP connection.
+"""
+
+import json
+import logging
+import re
+import time
+
+import pandas as pd
+import urllib3
+
+from choice_fields import CHOICE_KINDS, build_option_index, resolve_choice, option_texts
+from config import HTTP_POOL_SIZE, HTTP_TIMEOUT, LABEL_MATCH_THRESHOLD
+from form_waits import CONFIRMATION_PHRASES, RATE_LIMIT_PHRASES
+from label_resolver import assign_labels
+from row_source import format_cell_value
+
+FB_LOAD_DATA_PATTERN = re.compile(r"FB_PUBLIC_LOAD_DATA_\s*=\s*(.*?);\s*</script>", re.DOTALL)
+FBZX_PATTERN = re.compile(r'name="fbzx"\s+value="([^"]+)"')
+
+# Google Forms item type codes from FB_PUBLIC_LOAD_DATA_
+ITEM_TYPES = {
+    0: "text",
+    1: "textarea",
+    2: "radio",
+    3: "listbox",
+    4: "checkbox",
+    5: "scale",
+    9: "date",
+    10: "time",
+}
+
+
+def form_response_url(form_url):
+    """Turn a .../viewform?... URL into the matching .../formResponse URL"""
+    base = form_url.split("?", 1)[0]
+    if base.endswith("/viewform"):
+        return base[:-len("/viewform")] + "/formResponse"
+    return base.rstrip("/") + "/formResponse"
+
+
+def parse_form_fields(html):
+    """Extract [{label, entry_id, kind, required, options}] from a viewform page"""
+    match = FB_LOAD_DATA_PATTERN.search(html)
+    if not match:
+        raise ValueError("FB_PUBLIC_LOAD_DATA_ not found in form page")
+    
+    data = json.loads(match.group(1))
+    fields = []
+    for item in data[1][1] or []:
+        answers = item[4] if len(item) > 4 else None
+        if not answers:
+            # Section headers, images and descriptions carry no answer
+            continue
+        answer = answers[0]
+        fields.append({
+            "label": (item[1] or "").strip(),
+            "entry_id": answer[0],
+            "kind": ITEM_TYPES.get(item[3], "unknown"),
+            "required": bool(answer[2]) if len(answer) > 2 else False,
+            "options": [option[0] for option in (answer[1] or []) if option and option[0]],
+        })
+    return fields
+
+
+class HttpFormEngine:
+    """Submit spreadsheet rows to a Google Form over HTTP, without a browser"""
+    
+    def __init__(self, form_url, field_mapping, http=None):
+        self.form_url = form_url
+        self.response_url = form_response_url(form_url)
+        self.field_mapping = field_mapping
+        self.http = http or urllib3.PoolManager(
+            maxsize=HTTP_POOL_SIZE,
+            timeout=urllib3.Timeout(total=HTTP_TIMEOUT),
+            retries=False,
+            headers={"User-Agent": "Mozilla/5.0 (intelligent-form-automation)"}
+        )
+        self.entry_ids = {}  # form label -> entry id
+        self.choice_options = {}  # form label -> (kind, options, option index) for radio/checkbox/dropdown fields
+        self.fbzx = None
+        self.last_seconds = None  # duration of the last POST
+        self.last_rejection = None  # why the last row was not accepted
+    
+    def resolve_entry_ids(self):
+        """Read the viewform page once and map MANUAL_FIELD_MAPPING labels to entry IDs"""
+        try:
+            response = self.http.request("GET", self.form_url)
+            if response.status != 200:
+                logging.error(f"❌ Form page returned HTTP {response.status}")
+                return False
+            html = response.data.decode("utf-8", errors="replace")
+            fields = parse_form_fields(html)
+            
+            fbzx = FBZX_PATTERN.search(html)
+            self.fbzx = fbzx.group(1) if fbzx else None
+            
+            # One-to-one label assignment, so "Age" can never take "Age in Company (Years)"
+            by_label = {}
+            for field in fields:
+                by_label.setdefault(field["label"], field)
+            assignment = assign_labels(list(self.field_mapping), list(by_label), LABEL_MATCH_THRESHOLD)
+            
+            self.entry_ids = {}
+            self.choice_options = {}
+            for label in self.field_mapping:
+                if label in assignment:
+                    field = by_label[assignment[label][0]]
+                    self.entry_ids[label] = field["entry_id"]
+                    if field["kind"] in CHOICE_KINDS and field["options"]:
+                        options = [{"text": option, "value": option} for option in field["options"]]
+                        self.choice_options[label] = (field["kind"], options, build_option_index(options))
+                else:
+                    logging.warning(f"⚠️ No form entry found for '{label}'")
+            
+            logging.info(f"✅ Resolved {len(self.entry_ids)}/{len(self.field_mapping)} entry IDs from {len(fields)} form fields")
+            return len(self.entry_ids) > 0
+        except Exception as e:
+            logging.error(f"❌ Error resolving form entry IDs: {e}")
+            return False
+    
+    def build_payload(self, row_data):
+        """Build the entry.<id> POST fields for one spreadsheet row as (name, value) pairs
+        
+        A checkbox cell with several ticked values repeats its entry.<id>, the
+        way the browser posts it. Returns None when a choice value matches no option.
+        """
+        payload = []
+        for label, excel_column in self.field_mapping.items():
+            entry_id = self.entry_ids.get(label)
+            if entry_id is None or excel_column not in row_data:
+                continue
+            value = row_data[excel_column]
+            if not pd.notna(value):
+                continue
+            value_str = format_cell_value(value)
+            if label not in self.choice_options:
+                payload.append((f"entry.{entry_id}", value_str))
+                continue
+            
+            # Post the options' own texts - Google rejects choice answers it does not list
+            kind, options, option_index = self.choice_options[label]
+            selected = resolve_choice(option_index, value_str, kind)
+            if not selected:
+                self.last_rejection = f"'{value_str}' is not an option of '{label}'"
+                logging.error(f"❌ '{value_str}' is not an option of '{label}' ({option_texts(options)})")
+                return None
+            payload.extend((f"entry.{entry_id}", option["text"]) for option in selected)
+        
+        payload.append(("fvv", "1"))
+        payload.append(("pageHistory", "0"))
+        if self.fbzx:
+            payload.append(("fbzx", self.fbzx))
+        return payload
+    
+    def submit_row(self, row_data, entry_num):
+        """POST one row to formResponse; True when the confirmation page comes back"""
+        self.last_rejection = None
+        payload = self.build_payload(row_data)
+        if payload is None:
+            return False
+        try:
+            start = time.perf_counter()
+            response = self.http.request(
+                "POST",
+                self.response_url,
+                fields=payload,
+                encode_multipart=False
+            )
+            self.last_seconds = time.perf_counter() - start
+            elapsed_ms = self.last_seconds * 1000
+            
+            body = response.data.decode("utf-8", errors="replace").lower()
+            if response.status == 200 and any(phrase in body for phrase in CONFIRMATION_PHRASES):
+                logging.info(f"✅ Entry {entry_num + 1} submitted over HTTP in {elapsed_ms:.0f}ms")
+                return True
+            
+            if response.status == 429 or any(phrase in body for phrase in RATE_LIMIT_PHRASES):
+                self.last_rejection = "rate limited"
+            else:
+                self.last_rejection = f"rejected over HTTP (status {response.status})"
+            logging.error(f"❌ Entry {entry_num + 1} rejected over HTTP (status {response.status})")
+            return False
+        except Exception as e:
+            logging.error(f"❌ Error submitting entry {entry_num + 1} over HTTP: {e}")
+            self.last_rejection = f"HTTP error: {e}"
+            return False
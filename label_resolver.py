@@ -0,0 +1,125 @@
+"""
+Label resolver: wanted field labels -> labels detected on the form.
+
+The mapping is compiled once per form. Exact labels are assigned first, then
+labels that are equal after normalization (case, whitespace, punctuation and
+the required-field asterisk), and only then the remaining labels are paired by
+a similarity score, best pairs first. Every form label is assigned at most
+once, so "Age" can never take "Age in Company (Years)" away from its own
+mapping. Per-entry lookups are a dictionary access.
+"""
+
+import difflib
+import logging
+import re
+
+
+def normalize_label(text):
+    """Lower-case label with punctuation and repeated whitespace removed"""
+    text = str(text or "").casefold().replace("*", " ")
+    text = re.sub(r"[^\w\s]", " ", text)
+    return re.sub(r"\s+", " ", text).strip()
+
+
+def label_similarity(wanted, form_label):
+    """Score in [0, 1]: the better of character similarity and token overlap"""
+    wanted, form_label = normalize_label(wanted), normalize_label(form_label)
+    if not wanted or not form_label:
+        return 0.0
+    ratio = difflib.SequenceMatcher(None, wanted, form_label).ratio()
+    wanted_tokens, form_tokens = set(wanted.split()), set(form_label.split())
+    overlap = len(wanted_tokens & form_tokens) / len(wanted_tokens | form_tokens)
+    return max(ratio, overlap)
+
+
+def assign_labels(wanted_labels, form_labels, threshold=0.75):
+    """One-to-one {wanted label: (form label, score)}; wanted labels with no match are left out"""
+    assignment = {}
+    free = list(dict.fromkeys(form_labels))
+
+    # 1. Identical labels
+    for wanted in wanted_labels:
+        if wanted in free:
+            assignment[wanted] = (wanted, 1.0)
+            free.remove(wanted)
+
+    # 2. Labels that differ only in case, spacing or punctuation
+    for wanted in wanted_labels:
+        if wanted in assignment:
+            continue
+        key = normalize_label(wanted)
+        for form_label in free:
+            if normalize_label(form_label) == key:
+                assignment[wanted] = (form_label, 1.0)
+                free.remove(form_label)
+                break
+
+    # 3. Best-scoring remaining pairs above the threshold
+    remaining = [wanted for wanted in wanted_labels if wanted not in assignment]
+    pairs = []
+    for wanted_position, wanted in enumerate(remaining):
+        for form_position, form_label in enumerate(free):
+            score = label_similarity(wanted, form_label)
+            if score >= threshold:
+                pairs.append((-score, wanted_position, form_position, wanted, form_label))
+    taken = set()
+    for negative_score, _, _, wanted, form_label in sorted(pairs):
+        if wanted in assignment or form_label in taken:
+            continue
+        assignment[wanted] = (form_label, -negative_score)
+        taken.add(form_label)
+    return assignment
+
+
+class LabelResolver:
+    """Compiled wanted-label -> form-label map, rebuilt only when the form's labels change"""
+
+    def __init__(self, wanted_labels, threshold=0.75):
+        self.wanted_labels = list(wanted_labels)
+        self.threshold = threshold
+        self.compiled_for = None  # form index the map was last checked against
+        self.form_labels = None  # labels the map was compiled from
+        self.label_map = {}  # wanted label -> form label (None = no match)
+        self.compilations = 0
+
+    def compile(self, form_index):
+        """Match every wanted label against the form's labels (skipped when the labels are unchanged)"""
+        self.compiled_for = form_index
+        form_labels = tuple(form_index)
+        if form_labels == self.form_labels:
+            return self.label_map
+
+        self.form_labels = form_labels
+        self.compilations += 1
+        assignment = assign_labels(self.wanted_labels, form_labels, self.threshold)
+        self.label_map = {}
+        for wanted in self.wanted_labels:
+            form_label, score = assignment.get(wanted, (None, 0.0))
+            self.label_map[wanted] = form_label
+            if form_label is None:
+                logging.warning(f"⚠️ No form field matches '{wanted}'")
+            elif score < 1.0:
+                logging.info(f"🔗 '{wanted}' matched form field '{form_label}' (score {score:.2f})")
+        return self.label_map
+
+    def restore(self, form_labels, label_map):
+        """Reuse a map compiled in an earlier run (schema cache); False if it lacks a wanted label"""
+        if any(wanted not in label_map for wanted in self.wanted_labels):
+            return False
+        self.form_labels = tuple(form_labels)
+        self.label_map = dict(label_map)
+        return True
+
+    def resolve(self, label, form_index):
+        """Form label for a wanted label on the given form index (None when nothing matches)"""
+        if form_index is not self.compiled_for:
+            self.compile(form_index)
+        if label in self.label_map:
+            return self.label_map[label]
+
+        # A label outside the compiled mapping: match it once against the labels no other label claimed
+        claimed = {form_label for form_label in self.label_map.values() if form_label}
+        free = [form_label for form_label in self.form_labels if form_label not in claimed]
+        match = assign_labels([label], free, self.threshold).get(label, (None, 0.0))
+        self.label_map[label] = match[0]
+        return match[0]
@@ -0,0 +1,72 @@
+"""
+Locator cache for elements found through slow fallback chains.
+
+Google Form pages have the same structure entry after entry, so the element
+that a fallback strategy found on the first entry sits at the same place on
+every later one. The cache remembers the strategy that worked and a unique CSS
+path to the element, tries that path first, and only on a miss does the caller
+run its full strategy chain again.
+"""
+
+import logging
+
+from selenium.webdriver.common.by import By
+
+from form_scripts import ELEMENT_SELECTOR_SCRIPT
+
+
+class LocatorCache:
+    """Remember which strategy/selector found each target and count hits and misses"""
+
+    def __init__(self):
+        self.locators = {}  # target -> {"strategy", "selector"}
+        self.hits = {}
+        self.misses = {}
+
+    def record(self, target, hit):
+        """Count a cache hit or miss for target"""
+        counters = self.hits if hit else self.misses
+        counters[target] = counters.get(target, 0) + 1
+
+    def lookup(self, driver, target, validate=None):
+        """Find target with the remembered selector; returns the element or None on a miss"""
+        locator = self.locators.get(target)
+        if locator is None or not locator.get("selector"):
+            self.record(target, False)
+            return None
+        try:
+            for element in driver.find_elements(By.CSS_SELECTOR, locator["selector"]):
+                if validate is None or validate(element):
+                    self.record(target, True)
+                    return element
+        except Exception as e:
+            logging.debug(f"Cached locator for {target} failed: {e}")
+        # The page changed - forget the locator so the chain re-learns it
+        self.locators.pop(target, None)
+        self.record(target, False)
+        return None
+
+    def remember(self, driver, target, strategy, element=None):
+        """Store the strategy that found target, plus a unique CSS path to element if given"""
+        selector = None
+        if element is not None:
+            try:
+                selector = driver.execute_script(ELEMENT_SELECTOR_SCRIPT, element)
+            except Exception as e:
+                logging.debug(f"Could not compute a selector for {target}: {e}")
+        self.locators[target] = {"strategy": strategy, "selector": selector}
+        logging.info(f"🧭 Cached locator for {target}: {strategy}" + (f" ({selector})" if selector else ""))
+
+    def strategy_for(self, target):
+        """Strategy that found target last time (None if unknown)"""
+        locator = self.locators.get(target)
+        return locator["strategy"] if locator else None
+
+    def forget(self, target):
+        """Drop the remembered locator for target"""
+        self.locators.pop(target, None)
+
+    def summary(self):
+        """List of (target, hits, misses) for every target looked up"""
+        targets = sorted(set(self.hits) | set(self.misses))
+        return [(target, self.hits.get(target, 0), self.misses.get(target, 0)) for target in targets]
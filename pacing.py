@@ -0,0 +1,121 @@
+"""
+Adaptive pacing between fields and submissions.
+
+An AIMD controller (as in TCP congestion control) owns the delay between
+submissions: every cleanly confirmed entry takes a fixed step off it, down to
+``DELAY_BETWEEN_SUBMISSIONS_MIN``, and every sign of trouble - a confirmation
+timeout, fields missing from the page, a rate-limit page - multiplies it, up to
+a ceiling. Rate-limit pages count double. A confirmation that takes much longer
+than usual holds the delay where it is. The field delay and the post-submission
+delay are scaled by the same factor, so the whole run slows down and speeds up
+together. With ``adaptive=False`` the configured delays are used as they are.
+"""
+
+import logging
+import random
+import time
+
+RATE_LIMITED = "rate limited"
+SLOW_LATENCY_RATIO = 2.0  # confirmation slower than this x the running average = the form is struggling
+LATENCY_SMOOTHING = 0.2  # weight of the newest sample in the running average
+LATENCY_WARMUP = 3  # samples before latency is judged
+
+
+class PacingController:
+    """AIMD-adjusted delays between fields, after submissions and between submissions"""
+
+    def __init__(self, field_delay, submission_min, submission_max, after_submission,
+                 step=0.05, backoff=2.0, ceiling=30.0, jitter=0.1, adaptive=True, sleep=time.sleep, rng=random.uniform):
+        self.field_delay = field_delay
+        self.submission_min = submission_min
+        self.submission_max = submission_max
+        self.after_submission = after_submission
+        self.step = step
+        self.backoff = backoff
+        self.ceiling = max(ceiling, submission_max)
+        self.jitter = jitter
+        self.adaptive = adaptive
+        self.sleep = sleep
+        self.rng = rng
+        self.delay = submission_max  # current delay between submissions
+        self.latency_average = None
+        self.latency_samples = 0
+        self.speed_ups = 0
+        self.holds = 0
+        self.back_offs = {}  # reason -> count
+
+    def factor(self):
+        """Current delay relative to DELAY_BETWEEN_SUBMISSIONS_MAX (scales the other delays)"""
+        if not self.submission_max:
+            return 1.0
+        return self.delay / self.submission_max
+
+    def latency_is_slow(self, latency):
+        """Compare a confirmation latency with the running average, then fold it in"""
+        if latency is None:
+            return False
+        slow = (self.latency_samples >= LATENCY_WARMUP and
+                latency > SLOW_LATENCY_RATIO * self.latency_average)
+        if self.latency_average is None:
+            self.latency_average = latency
+        else:
+            self.latency_average += LATENCY_SMOOTHING * (latency - self.latency_average)
+        self.latency_samples += 1
+        return slow
+
+    def observe(self, trouble=None, latency=None):
+        """Adjust the pace after an entry: trouble is None for a clean submission, else the reason"""
+        if not self.adaptive:
+            return self.delay
+        if trouble is None:
+            if self.latency_is_slow(latency):
+                self.holds += 1
+                return self.delay
+            self.delay = max(self.submission_min, self.delay - self.step)
+            self.speed_ups += 1
+            return self.delay
+
+        reason = str(trouble).split(":", 1)[0]
+        self.back_offs[reason] = self.back_offs.get(reason, 0) + 1
+        multiplier = self.backoff ** 2 if reason == RATE_LIMITED else self.backoff
+        previous = self.delay
+        self.delay = min(self.ceiling, max(self.delay, self.submission_min, 0.1) * multiplier)
+        logging.warning(f"🐢 Pacing backed off ({reason}): {previous:.2f}s -> {self.delay:.2f}s between submissions")
+        return self.delay
+
+    def jittered(self, seconds):
+        """seconds +/- the jitter fraction"""
+        if seconds <= 0 or not self.jitter:
+            return max(0.0, seconds)
+        return self.rng(seconds * (1 - self.jitter), seconds * (1 + self.jitter))
+
+    def field_pause(self):
+        """Sleep between two fields of an entry"""
+        self.sleep(self.jittered(self.field_delay * self.factor()))
+
+    def after_submission_pause(self):
+        """Sleep between a confirmed submission and loading the next form"""
+        self.sleep(self.jittered(self.after_submission * self.factor()))
+
+    def submission_pause(self):
+        """Sleep between two entries"""
+        if not self.adaptive:
+            self.sleep(self.rng(self.submission_min, self.submission_max))
+            return
+        self.sleep(self.jittered(self.delay))
+
+    def summary(self):
+        """Current pace and how often it changed"""
+        return {
+            "delay": round(self.delay, 3),
+            "speed_ups": self.speed_ups,
+            "holds": self.holds,
+            "back_offs": dict(self.back_offs),
+        }
+
+    def print_summary(self):
+        """Print the pace the run ended at"""
+        summary = self.summary()
+        back_offs = ", ".join(f"{reason}: {count}" for reason, count in summary["back_offs"].items()) or "none"
+        print(f"   🚦 Pacing: {summary['delay']:.2f}s between submissions "
+              f"({summary['speed_ups']} speed-ups, {summary['holds']} holds, back-offs: {back_offs})")
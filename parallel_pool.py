@@ -0,0 +1,167 @@
+"""
+Parallel submission pool: several browsers draining one shared row stream.
+
+Workers take (index, row) pairs off one shared, lazily read row iterator, so
+every row is taken by exactly one worker and no row can be submitted twice
+even when a worker's browser dies mid-run. With a (thread-safe) dedup index,
+rows whose content was already submitted are skipped as well. A shared rate
+limiter spaces submissions across all workers.
+"""
+
+import logging
+import threading
+import time
+
+from browser_launch import resolve_driver_path
+
+
+class RateLimiter:
+    """Thread-safe limiter spacing calls evenly to at most max_per_minute"""
+    
+    def __init__(self, max_per_minute):
+        self.interval = 60.0 / max_per_minute if max_per_minute else 0.0
+        self.next_allowed = 0.0
+        self.lock = threading.Lock()
+    
+    def acquire(self):
+        """Block until the caller may perform one more submission"""
+        if not self.interval:
+            return
+        with self.lock:
+            now = time.monotonic()
+            wait = self.next_allowed - now
+            self.next_allowed = max(now, self.next_allowed) + self.interval
+        if wait > 0:
+            time.sleep(wait)
+
+
+class WorkerPool:
+    """Run fill_form for a stream of rows across N browser workers and merge the results"""
+    
+    def __init__(self, worker_count, automation_factory, debug_ports=None, max_submissions_per_minute=None,
+                 dedup_index=None, row_hash=None):
+        self.automation_factory = automation_factory
+        self.debug_ports = list(debug_ports or [])
+        if self.debug_ports and worker_count > len(self.debug_ports):
+            # An attached session drives the focused tab, so two workers on one port would fill the same form
+            logging.warning(f"⚠️ {worker_count} workers but only {len(self.debug_ports)} debug ports - "
+                            f"running {len(self.debug_ports)} workers, one per Chrome")
+            worker_count = len(self.debug_ports)
+        self.worker_count = worker_count
+        self.rate_limiter = RateLimiter(max_submissions_per_minute)
+        self.dedup_index = dedup_index  # DedupIndex shared by all workers, or None
+        self.row_hash = row_hash  # row -> content hash, used with dedup_index
+        self.results = {}  # row index -> True/False
+        self.claimed = set()
+        self.lock = threading.Lock()
+        self.rows = iter(())
+        self.on_result = None
+        self.driver_path = None
+    
+    def next_row(self):
+        """Take the next (index, row) off the shared row iterator, or None when it is exhausted"""
+        with self.lock:
+            return next(self.rows, None)
+    
+    def claim(self, index):
+        """Register a row as taken; returns False if any worker already took it"""
+        with self.lock:
+            if index in self.claimed:
+                return False
+            self.claimed.add(index)
+            return True
+    
+    def record(self, index, row_data, success):
+        """Store the outcome of a claimed row and report it to the caller"""
+        with self.lock:
+            self.results[index] = success
+            if self.on_result is not None:
+                self.on_result(index, row_data, success)
+    
+    def dedup_done(self, index, row_hash, submitted):
+        """Remember a submitted row's content in the dedup index, or free it for another attempt"""
+        if row_hash is None:
+            return
+        if submitted:
+            self.dedup_index.add(index, row_hash)
+        else:
+            self.dedup_index.release(row_hash)
+    
+    def start_worker_driver(self, automation, worker_id):
+        """Attach worker_id to its debug port, or launch a headless Chrome for it"""
+        if self.debug_ports:
+            port = self.debug_ports[worker_id]
+            return automation.setup_driver(debugger_address=f"127.0.0.1:{port}", driver_path=self.driver_path)
+        return automation.setup_driver(headless=True, driver_path=self.driver_path)
+    
+    def worker(self, worker_id):
+        """Worker loop: open the form, then take rows off the shared iterator until it is exhausted"""
+        automation = self.automation_factory()
+        
+        if not self.start_worker_driver(automation, worker_id):
+            logging.error(f"❌ Worker {worker_id}: browser could not be started")
+            return
+        
+        try:
+            automation.load_form_page()
+            automation.wait_for_form_ready()
+            
+            while True:
+                item = self.next_row()
+                if item is None:
+                    break
+                index, row_data = item
+                
+                if not self.claim(index):
+                    continue
+                
+                row_hash = self.row_hash(row_data) if self.dedup_index is not None else None
+                if row_hash is not None and self.dedup_index.check(index, row_hash) is not None:
+                    continue
+                
+                if not automation.ensure_form_loaded(index, interactive=False):
+                    # Nothing was submitted for this row, so it is safe to report it as failed
+                    self.record(index, row_data, False)
+                    self.dedup_done(index, row_hash, False)
+                    continue
+                
+                self.rate_limiter.acquire()
+                success = automation.fill_form(row_data, index)
+                self.record(index, row_data, success)
+                self.dedup_done(index, row_hash, success)
+                logging.info(f"👷 Worker {worker_id}: entry {index + 1} {'submitted' if success else 'failed'}")
+        except Exception as e:
+            logging.error(f"❌ Worker {worker_id} stopped: {e}")
+        finally:
+            try:
+                if not self.debug_ports:
+                    automation.driver.quit()
+            except Exception:
+                pass
+    
+    def run(self, rows, on_result=None):
+        """Submit every (index, row) of rows with all workers; returns {row index: success}
+        
+        on_result(index, row, success) is called for each outcome while the pool lock is held.
+        """
+        self.rows = iter(rows)
+        self.on_result = on_result
+        
+        # Resolve the driver binary once instead of once per worker
+        self.driver_path = resolve_driver_path()
+        
+        threads = []
+        for worker_id in range(self.worker_count):
+            thread = threading.Thread(
+                target=self.worker,
+                args=(worker_id,),
+                name=f"worker-{worker_id}",
+                daemon=True
+            )
+            thread.start()
+            threads.append(thread)
+        
+        for thread in threads:
+            thread.join()
+        
+        return dict(sorted(self.results.items()))
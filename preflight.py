@@ -0,0 +1,164 @@
+"""
+Vectorized preflight pass over the dataset.
+
+Runs before any browser work: matches the mapped column names against the
+sheet headers tolerantly (``" Registration Number"`` / ``"Age "``), normalizes
+every value to the exact string that will be typed, validates the configured
+columns with whole-column pandas operations, and writes a rejected-rows report.
+Streaming row sources are checked and cleaned ``chunk_size`` rows at a time
+(``PreflightRowSource``), so the sheet is never copied into one DataFrame.
+"""
+
+import itertools
+import logging
+import re
+
+import pandas as pd
+
+from row_source import RowSource
+
+# Excel escapes carriage returns as _x000D_ when a cell contains line breaks
+EXCEL_CR_ESCAPE = "_x000D_"
+WHITESPACE = r"\s+"
+INTEGRAL_FLOAT = r"^(-?\d+)\.0+$"  # 25.0 -> 25 (floats that pandas produced from integer cells)
+
+
+def normalize_header(name):
+    """Header comparison key: trimmed, single-spaced, lowercase"""
+    return " ".join(str(name).split()).lower()
+
+
+def match_columns(frame_columns, wanted_columns):
+    """Map each wanted column name to the frame column it refers to"""
+    by_key = {normalize_header(column): column for column in frame_columns}
+    matched = {}
+    for wanted in wanted_columns:
+        if wanted in frame_columns:
+            matched[wanted] = wanted
+        elif normalize_header(wanted) in by_key:
+            matched[wanted] = by_key[normalize_header(wanted)]
+    return matched
+
+
+def normalize_values(series):
+    """Stringify a column the way it is typed: ints without '.0', trimmed text, None for empty"""
+    missing = series.isna()
+    text = series.astype(str)
+    text = text.str.replace(EXCEL_CR_ESCAPE, "", regex=False)
+    text = text.str.replace(WHITESPACE, " ", regex=True).str.strip()
+    text = text.str.replace(INTEGRAL_FLOAT, r"\1", regex=True)
+    return text.mask(missing | (text == ""))
+
+
+def normalize_value(value, remove_whitespace=False):
+    """normalize_values for a single cell (None for empty cells)"""
+    if value is None or pd.isna(value):
+        return None
+    text = re.sub(WHITESPACE, " ", str(value).replace(EXCEL_CR_ESCAPE, "")).strip()
+    text = re.sub(INTEGRAL_FLOAT, r"\1", text)
+    if remove_whitespace:
+        text = text.replace(" ", "")
+    return text or None
+
+
+def validate_column(values, rule):
+    """Boolean Series of valid values (missing values are valid unless the rule is required)"""
+    present = values.notna()
+    valid = pd.Series(True, index=values.index)
+    
+    if rule.get("remove_whitespace"):
+        values = values.str.replace(" ", "", regex=False)
+    if "pattern" in rule:
+        valid &= ~present | values.str.fullmatch(rule["pattern"]).fillna(False).astype(bool)
+    if "min" in rule or "max" in rule:
+        numbers = pd.to_numeric(values, errors="coerce")
+        in_range = numbers.notna()
+        if "min" in rule:
+            in_range &= numbers >= rule["min"]
+        if "max" in rule:
+            in_range &= numbers <= rule["max"]
+        valid &= ~present | in_range
+    if rule.get("required"):
+        valid &= present
+    return valid, values
+
+
+def run_preflight(frame, columns, rules):
+    """Normalize and validate frame; returns (clean frame of strings, rejected rows report)"""
+    matched = match_columns(list(frame.columns), columns)
+    missing = [column for column in columns if column not in matched]
+    if missing:
+        logging.warning(f"⚠️ Preflight: mapped columns not found in the data: {missing}")
+    
+    # Rename to the canonical (mapping) names so the rest of the run can use them as-is
+    clean = pd.DataFrame(
+        {column: normalize_values(frame[source]) for column, source in matched.items()},
+        index=frame.index
+    )
+    
+    reasons = pd.Series("", index=clean.index)
+    for column, rule in rules.items():
+        matched_rule = match_columns(list(clean.columns), [column])
+        if not matched_rule:
+            continue
+        target = matched_rule[column]
+        valid, cleaned = validate_column(clean[target], rule)
+        if rule.get("remove_whitespace"):
+            clean[target] = cleaned
+        reasons = reasons.where(valid, reasons + f"invalid {target.strip()}; ")
+    
+    rejected_mask = reasons != ""
+    report = frame.loc[rejected_mask, [source for source in matched.values()]].copy()
+    report.insert(0, "reason", reasons[rejected_mask].str.rstrip("; "))
+    report.insert(0, "entry", report.index + 1)
+    
+    clean = clean.loc[~rejected_mask].astype(object)
+    clean = clean.where(clean.notna(), None)
+    logging.debug(f"🧹 Preflight: {len(clean)} clean entries, {int(rejected_mask.sum())} rejected")
+    return clean, report
+
+
+def frame_chunks(source, start_index, end_index, chunk_size):
+    """DataFrames of up to chunk_size rows of a row source, indexed by row number"""
+    rows = source.rows(start_index, end_index)
+    while True:
+        chunk = dict(itertools.islice(rows, chunk_size))
+        if not chunk:
+            return
+        yield pd.DataFrame.from_dict(chunk, orient="index", columns=source.columns)
+
+
+class PreflightRowSource(RowSource):
+    """Normalized, valid rows of another row source, preflighted one chunk at a time"""
+    
+    def __init__(self, source, columns, rules, chunk_size=1000):
+        super().__init__(source.path, columns)
+        self.positions = [(name, position) for position, name in enumerate(match_columns(source.columns, self.wanted_columns))]
+        self.source = source
+        self.rules = rules
+        self.chunk_size = chunk_size
+    
+    def __len__(self):
+        return len(self.source)
+    
+    def check(self, start_index=0, end_index=None):
+        """Validate the range without keeping it; returns (rows checked, rejected rows report)"""
+        checked, reports = 0, []
+        for chunk in frame_chunks(self.source, start_index, end_index, self.chunk_size):
+            checked += len(chunk)
+            _, report = run_preflight(chunk, self.wanted_columns, self.rules)
+            if len(report):
+                reports.append(report)
+        if not reports:
+            return checked, pd.DataFrame(columns=["entry", "reason"])
+        return checked, pd.concat(reports)
+    
+    def rows(self, start_index=0, end_index=None):
+        for chunk in frame_chunks(self.source, start_index, end_index, self.chunk_size):
+            clean, _ = run_preflight(chunk, self.wanted_columns, self.rules)
+            columns = list(clean.columns)
+            for index, values in zip(clean.index, clean.itertuples(index=False, name=None)):
+                yield int(index), dict(zip(columns, values))
+    
+    def close(self):
+        self.source.close()
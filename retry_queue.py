@@ -0,0 +1,114 @@
+"""
+Retry queue for failed entries.
+
+A failed row is scheduled again after an exponential backoff (base, 2x base,
+4x base, ...) and picked up between entries of the main stream, so retries do
+not hold up the rows behind them. A row that fails more than ``max_retries``
+times goes to a dead-letter JSONL file with its last failure reason; that file
+can be fed back in later as the row source of a new run.
+"""
+
+import heapq
+import itertools
+import json
+import logging
+import os
+import time
+from datetime import datetime
+
+from row_source import format_cell_value
+
+
+def load_dead_letters(path):
+    """Read a dead-letter file back as [(index, row dict)] in file order"""
+    rows = []
+    if not os.path.exists(path):
+        return rows
+    with open(path, "r", encoding="utf-8") as dead_letter_file:
+        for line in dead_letter_file:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                logging.warning(f"⚠️ Skipping unreadable dead-letter line: {line[:80]}")
+                continue
+            rows.append((record["index"], record["row"]))
+    return rows
+
+
+class RetryQueue:
+    """Failed rows waiting for their backoff to expire, plus the dead-letter file"""
+
+    def __init__(self, max_retries, base_delay=5.0, dead_letter_path=None, clock=time.monotonic):
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.dead_letter_path = dead_letter_path
+        self.clock = clock
+        self.heap = []  # (ready_at, sequence, index)
+        self.pending = {}  # index -> {"row", "attempt", "reason"}
+        self.failures = {}  # index -> failed attempts so far
+        self.sequence = itertools.count()
+        self.recovered = 0
+        self.dead_lettered = 0
+
+    def __len__(self):
+        return len(self.pending)
+
+    def add(self, index, row_data, reason):
+        """Schedule a failed row again, or dead-letter it once its retries are used up"""
+        failures = self.failures.get(index, 0) + 1
+        self.failures[index] = failures
+        if failures > self.max_retries:
+            self.dead_letter(index, row_data, reason, failures)
+            return False
+        delay = self.base_delay * 2 ** (failures - 1)
+        self.pending[index] = {"row": row_data, "attempt": failures, "reason": reason}
+        heapq.heappush(self.heap, (self.clock() + delay, next(self.sequence), index))
+        logging.info(f"🔁 Entry {index + 1} queued for retry {failures}/{self.max_retries} in {delay:.0f}s ({reason})")
+        return True
+
+    def due(self):
+        """Pop every queued row whose backoff has expired: [(index, row, attempt, reason)]"""
+        ready = []
+        now = self.clock()
+        while self.heap and self.heap[0][0] <= now:
+            _, _, index = heapq.heappop(self.heap)
+            entry = self.pending.pop(index)
+            ready.append((index, entry["row"], entry["attempt"], entry["reason"]))
+        return ready
+
+    def seconds_until_next(self):
+        """Time until the next queued row is due (None if the queue is empty)"""
+        if not self.heap:
+            return None
+        return max(0.0, self.heap[0][0] - self.clock())
+
+    def succeeded(self, index):
+        """A retried row went through"""
+        self.failures.pop(index, None)
+        self.recovered += 1
+
+    def dead_letter(self, index, row_data, reason, attempts):
+        """Append a row that keeps failing to the dead-letter file"""
+        self.dead_lettered += 1
+        logging.error(f"☠️ Entry {index + 1} failed {attempts} times - moved to the dead-letter file ({reason})")
+        if not self.dead_letter_path:
+            return
+        record = {
+            "index": index,
+            "attempts": attempts,
+            "reason": reason,
+            "failed_at": datetime.now().isoformat(timespec="seconds"),
+            "row": {str(column): (format_cell_value(row_data[column]) or None) for column in row_data.keys()},
+        }
+        with open(self.dead_letter_path, "a", encoding="utf-8") as dead_letter_file:
+            dead_letter_file.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+    def abandon(self, reason):
+        """Dead-letter everything still queued (the run is ending early)"""
+        for index, entry in list(self.pending.items()):
+            self.dead_letter(index, entry["row"], f"{reason}; last error: {entry['reason']}", entry["attempt"])
+        self.pending = {}
+        self.heap = []
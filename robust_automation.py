@@ -1,22 +1,74 @@
 import pandas as pd
+import asyncio
 import time
-import random
 import logging
+import itertools
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
+from selenium.common.exceptions import StaleElementReferenceException, TimeoutException, SessionNotCreatedException
 from config import *
+from form_waits import form_fields_present, confirmation_page_visible, rate_limit_page_visible
+from form_scripts import FORM_INTROSPECTION_SCRIPT, JS_BATCH_FILL_SCRIPT, CHOICE_SELECT_SCRIPT, FORM_FINGERPRINT_SCRIPT, CACHED_INDEX_SCRIPT
+from parallel_pool import WorkerPool
+from http_engine import HttpFormEngine
+from checkpoint_journal import CheckpointJournal, row_content_hash
+from row_source import open_row_source, format_cell_value, FrameRowSource
+from preflight import run_preflight, match_columns, PreflightRowSource
+from dataset_cache import load_cached_row_source
+from cdp_engine import CDPFormEngine, CDPError
+from tab_pool import FormTabPool
+from locator_cache import LocatorCache
+from entry_metrics import EntryMetrics, timed_phase
+from command_profiler import CommandProfiler
+from batch_scheduler import BatchScheduler
+from retry_queue import RetryQueue, load_dead_letters
+from session_monitor import SessionMonitor
+from browser_launch import build_launch_options, block_resources, resolve_driver_path
+from choice_fields import CHOICE_KINDS, build_option_index, resolve_choice, option_texts
+from label_resolver import LabelResolver
+from schema_cache import FormSchemaCache, schema_fingerprint
+from pacing import PacingController
+from dedup_index import DedupIndex
+import subprocess
 import os
 from datetime import datetime
 
+FILL_STRATEGIES = ("typed", "send_keys_whole", "js_batch")
+
 class RobustAutomation:
     def __init__(self):
         self.driver = None
         self.data = None
+        self.row_source = None  # streaming RowSource when ROW_SOURCE_MODE == "stream"
+        self.total_rows = 0
+        self.form_index = None  # label -> {"container", "input"} for the loaded form page
+        self.label_resolver = LabelResolver(MANUAL_FIELD_MAPPING, LABEL_MATCH_THRESHOLD)  # mapping label -> form label, compiled per form
+        self.schema_cache = FormSchemaCache(FORM_SCHEMA_CACHE_PATH) if FORM_SCHEMA_CACHE_ENABLED else None
+        self.form_schema = None  # validated cached schema of GOOGLE_FORM_URL (fields indexed by position)
+        self.discovered_schema = None  # schema from the last full JS discovery, saved once the form is detected
+        self.fill_stats = {}  # fill strategy -> {"entries", "seconds"}
+        self.expected_field_count = None  # listitem count of a fully rendered form
+        self.http_engine = None  # set in browserless (SUBMISSION_ENGINE = "http") mode
+        self.journal = None  # CheckpointJournal when JOURNAL_ENABLED
+        self.dedup_index = None  # DedupIndex when DEDUP_ENABLED
+        self.tab_pool = None  # FormTabPool when PRELOADED_TABS > 1
+        self.locator_cache = LocatorCache()  # strategy/selector that found the submit button, confirmation link and fields
+        self.metrics = EntryMetrics()  # per-entry phase timings (written to METRICS_FILE_PATH when enabled)
+        self.profiler = None  # CommandProfiler when PROFILE_WEBDRIVER
+        self.scheduler = None  # BatchScheduler when UNATTENDED_MODE
+        self.retry_queue = None  # RetryQueue when RETRY_FAILED_ENTRIES
+        self.failure_reason = None  # why the last fill_form returned False
+        self.missing_fields = 0  # fields of the last entry that could not be filled
+        self.confirmation_seconds = None  # how long the last submission took to confirm
+        self.pacer = PacingController(
+            DELAY_BETWEEN_FIELDS, DELAY_BETWEEN_SUBMISSIONS_MIN, DELAY_BETWEEN_SUBMISSIONS_MAX, DELAY_AFTER_SUBMISSION,
+            step=PACING_STEP, backoff=PACING_BACKOFF, ceiling=PACING_MAX_DELAY, adaptive=ADAPTIVE_PACING
+        )
+        self.monitor = None  # SessionMonitor when HEALTH_MONITOR_ENABLED
         self.setup_logging()
         
     def setup_logging(self):
@@ -29,19 +81,35 @@ class RobustAutomation:
             ]
         )
         
-    def setup_driver(self):
-        """Setup Chrome driver to connect to existing browser instance"""
+    def setup_driver(self, debugger_address=CHROME_DEBUGGER_ADDRESS, headless=False, driver_path=None, launch=False):
+        """Setup Chrome driver to connect to existing browser instance (or launch a trimmed one)"""
+        launch = launch or headless
         try:
-            chrome_options = Options()
-            
-            # Connect to existing Chrome instance
-            chrome_options.add_experimental_option("debuggerAddress", "127.0.0.1:9222")
+            if launch:
+                # Start our own Chrome with a resource-trimmed profile (parallel workers, HEADLESS_MODE, "launch" mode)
+                chrome_options = build_launch_options(headless, BROWSER_WINDOW_SIZE, CHROME_USER_DATA_DIR)
+            else:
+                # Connect to existing Chrome instance
+                chrome_options = Options()
+                chrome_options.add_experimental_option("debuggerAddress", debugger_address)
             
             # Create service and driver
-            service = Service(ChromeDriverManager().install())
-            self.driver = webdriver.Chrome(service=service, options=chrome_options)
+            driver_path = driver_path or resolve_driver_path()
+            try:
+                self.driver = webdriver.Chrome(service=Service(driver_path), options=chrome_options)
+            except SessionNotCreatedException as e:
+                if CHROMEDRIVER_PATH:
+                    raise
+                # Chrome probably auto-updated past the cached chromedriver - look it up again once
+                logging.warning(f"⚠️ chromedriver {driver_path} could not start a session ({e.msg}) - resolving it again")
+                driver_path = resolve_driver_path(refresh=True)
+                self.driver = webdriver.Chrome(service=Service(driver_path), options=chrome_options)
             
-            logging.info("✅ Connected to existing Chrome browser successfully")
+            if launch:
+                block_resources(self.driver, BLOCKED_RESOURCE_PATTERNS)
+                logging.info(f"✅ Launched {'headless ' if headless else ''}Chrome browser successfully")
+            else:
+                logging.info(f"✅ Connected to existing Chrome browser at {debugger_address} successfully")
             return True
             
         except Exception as e:
@@ -49,6 +117,16 @@ class RobustAutomation:
             logging.error("Make sure Chrome is running with remote debugging enabled")
             return False
     
+    def launches_browser(self):
+        """True when the automation starts its own Chrome instead of attaching to one"""
+        return HEADLESS_MODE or BROWSER_LAUNCH_MODE == "launch"
+    
+    def connect_browser(self):
+        """Attach to or launch Chrome according to BROWSER_LAUNCH_MODE / HEADLESS_MODE"""
+        if self.launches_browser():
+            return self.setup_driver(headless=HEADLESS_MODE, launch=True)
+        return self.setup_driver()
+    
     def check_browser_active(self):
         """Check if browser window is still active"""
         try:
@@ -59,6 +137,104 @@ class RobustAutomation:
             logging.error(f"❌ Browser window is not active: {e}")
             return False
     
+    def session_healthy(self):
+        """Health monitor verdict, or a direct check when no monitor is running"""
+        if self.monitor is not None:
+            return self.monitor.healthy
+        return self.check_browser_active()
+    
+    def start_session_monitor(self):
+        """Watch chromedriver and Chrome from a background thread"""
+        self.monitor = SessionMonitor(
+            None if self.launches_browser() else CHROME_DEBUGGER_ADDRESS,
+            getattr(self.driver.command_executor, "_url", None),
+            interval=HEALTH_CHECK_INTERVAL,
+            hang_timeout=HUNG_ENTRY_TIMEOUT,
+            abort=self.abort_driver
+        ).start()
+    
+    def abort_driver(self):
+        """Stop chromedriver so a command blocked on a hung tab fails instead of waiting"""
+        service = getattr(self.driver, "service", None)
+        if service is not None:
+            service.stop()
+    
+    def relaunch_chrome(self):
+        """Start Chrome on the debug port with CHROME_LAUNCH_COMMAND and wait until it answers"""
+        if not CHROME_LAUNCH_COMMAND:
+            return False
+        logging.info("🚀 Relaunching Chrome on the debug port")
+        subprocess.Popen(CHROME_LAUNCH_COMMAND, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        deadline = time.monotonic() + FORM_LOAD_TIMEOUT
+        while time.monotonic() < deadline:
+            if self.monitor.chrome_reachable():
+                return True
+            time.sleep(0.5)
+        return False
+    
+    def recover_session(self):
+        """Reconnect to Chrome (relaunching it if it is gone) and reload the form"""
+        reason = self.monitor.reason if self.monitor is not None else "browser not responding"
+        logging.warning(f"🩺 Recovering browser session ({reason})")
+        try:
+            self.abort_driver()
+        except Exception:
+            pass
+        self.invalidate_form_index()
+        
+        for attempt in range(1, SESSION_RECOVERY_ATTEMPTS + 1):
+            if self.monitor is not None and not self.monitor.chrome_reachable():
+                self.relaunch_chrome()
+            if self.connect_browser():
+                if self.tab_pool is not None:
+                    # Preloaded tabs outlive a chromedriver restart - close them through the new session
+                    try:
+                        self.tab_pool.driver = self.driver
+                        self.tab_pool.close()
+                    except Exception:
+                        pass
+                try:
+                    self.load_form_page()
+                    self.wait_for_form_ready()
+                    if len(self.build_form_index()) > 0:
+                        if self.tab_pool is not None:
+                            self.tab_pool = FormTabPool(self.driver, GOOGLE_FORM_URL, PRELOADED_TABS)
+                            self.tab_pool.open()
+                        if self.profiler is not None:
+                            self.profiler.attach(self.driver)
+                        if self.monitor is not None:
+                            self.monitor.reset(getattr(self.driver.command_executor, "_url", None))
+                        logging.info(f"✅ Browser session recovered on attempt {attempt}")
+                        return True
+                except Exception as e:
+                    logging.warning(f"⚠️ Form did not load after reconnecting: {e}")
+            time.sleep(min(2 ** attempt, 30))
+        
+        logging.error(f"❌ Could not recover the browser session after {SESSION_RECOVERY_ATTEMPTS} attempts")
+        return False
+    
+    def wait_for(self, condition, timeout, description):
+        """Wait until condition(driver) is truthy, logging how long the page actually took"""
+        start = time.perf_counter()
+        try:
+            result = WebDriverWait(self.driver, timeout, poll_frequency=WAIT_POLL_INTERVAL).until(condition)
+            logging.info(f"⏱️ Waited {time.perf_counter() - start:.2f}s for {description}")
+            return result
+        except TimeoutException:
+            logging.warning(f"⚠️ Timed out after {timeout}s waiting for {description}")
+            return None
+    
+    def wait_for_form_ready(self, timeout=None):
+        """Wait until the form has rendered all of its field containers"""
+        fields = self.wait_for(
+            form_fields_present(self.expected_field_count),
+            timeout or FORM_LOAD_TIMEOUT,
+            "form to load"
+        )
+        if fields and self.expected_field_count is None:
+            self.expected_field_count = len(fields)
+        return bool(fields)
+    
     def load_excel_data(self):
         try:
             self.data = pd.read_excel(EXCEL_FILE_PATH)
@@ -68,75 +244,87 @@ class RobustAutomation:
             logging.error(f"❌ Error loading Excel: {e}")
             return False
     
+    def load_rows(self):
+        """Open the row data: a lazy streaming source, or the whole workbook through pandas"""
+        if ROW_SOURCE_MODE != "stream":
+            if not self.load_excel_data():
+                return False
+            self.total_rows = len(self.data)
+            return True
+        
+        try:
+            if DATASET_CACHE_ENABLED:
+                self.row_source = load_cached_row_source(EXCEL_FILE_PATH, MANUAL_FIELD_MAPPING.values(), DATASET_CACHE_DIR)
+            else:
+                self.row_source = open_row_source(EXCEL_FILE_PATH, columns=MANUAL_FIELD_MAPPING.values())
+            self.total_rows = len(self.row_source)
+            logging.info(f"✅ Streaming {self.total_rows} entries from {EXCEL_FILE_PATH} ({len(self.row_source.columns)} mapped columns)")
+            return True
+        except Exception as e:
+            logging.error(f"❌ Error opening {EXCEL_FILE_PATH}: {e}")
+            return False
+    
+    def iter_rows(self, start_index, end_index):
+        """Yield (index, row) for rows start_index..end_index-1"""
+        if self.row_source is not None:
+            yield from self.row_source.rows(start_index, end_index)
+        else:
+            for index in range(start_index, end_index):
+                yield index, self.data.iloc[index]
+    
+    def run_preflight_checks(self, start_index, end_index):
+        """Normalize and validate the whole row range before any browser work"""
+        columns = list(MANUAL_FIELD_MAPPING.values())
+        if self.row_source is not None:
+            # Streaming: validate chunk by chunk now, clean each chunk again as it is read
+            self.row_source = PreflightRowSource(self.row_source, columns, VALIDATION_RULES, PREFLIGHT_CHUNK_SIZE)
+            checked, rejected = self.row_source.check(start_index, end_index)
+            clean_count = checked - len(rejected)
+        else:
+            clean, rejected = run_preflight(self.data.iloc[start_index:end_index], columns, VALIDATION_RULES)
+            clean_count = len(clean)
+            # From here on only clean, pre-stringified rows are handed to the browser
+            self.row_source = FrameRowSource(clean)
+        
+        if len(rejected):
+            rejected.to_csv(PREFLIGHT_REPORT_PATH, index=False)
+            print(f"🧹 Preflight rejected {len(rejected)} entries - see {PREFLIGHT_REPORT_PATH}")
+            for _, report_row in rejected.head(10).iterrows():
+                print(f"   ❌ Entry {report_row['entry']}: {report_row['reason']}")
+        else:
+            print(f"🧹 Preflight: all {clean_count} entries are valid")
+        return len(rejected)
+    
+    @timed_phase("detection")
     def find_all_form_fields(self):
         """Find all form fields with multiple selectors"""
         fields = []
         
-        # Check if browser is still active
-        if not self.check_browser_active():
+        # Check if browser is still active (off the hot path when the health monitor runs)
+        if not self.session_healthy():
             logging.error("❌ Browser window is not active - cannot detect form fields")
             return fields
         
-        # Wait for page to fully load (ultra-fast)
-        time.sleep(1)
-        
-        # Debug: Print current URL to verify we're on the right page
-        try:
-            current_url = self.driver.current_url
-            logging.info(f"🔍 Current URL: {current_url}")
-        except Exception as e:
-            logging.error(f"❌ Cannot get current URL: {e}")
-            return fields
-        
-        # Method 1: Try the standard Google Forms selector
-        try:
-            found_fields = self.driver.find_elements(By.CSS_SELECTOR, "div[role='listitem']")
-            if found_fields:
-                fields.extend(found_fields)
-                logging.info(f"Found {len(found_fields)} fields with selector: div[role='listitem']")
-        except Exception as e:
-            logging.info(f"Method 1 failed: {e}")
-        
-        # Method 2: Look for divs with "Your answer" text
-        if not fields:
-            try:
-                all_divs = self.driver.find_elements(By.CSS_SELECTOR, "div")
-                logging.info(f"Scanning {len(all_divs)} div elements for 'Your answer' text")
-                
-                for div in all_divs:
-                    try:
-                        div_text = div.text.strip()
-                        if div_text and "Your answer" in div_text:
-                            # Check if this div contains an input field
-                            inputs_in_div = div.find_elements(By.CSS_SELECTOR, "input, textarea, div[contenteditable='true']")
-                            if inputs_in_div:
-                                fields.append(div)
-                                logging.info(f"Found field with 'Your answer': {div_text[:50]}...")
-                    except:
-                        continue
-                logging.info(f"Found {len(fields)} fields with 'Your answer' text")
-            except Exception as e:
-                logging.info(f"Method 2 failed: {e}")
+        # Wait for the field containers to render (returns as soon as they are there)
+        self.wait_for(form_fields_present(), ELEMENT_WAIT_TIMEOUT, "form fields to render")
         
-        # Method 3: Direct input field detection
-        if not fields:
-            try:
-                all_inputs = self.driver.find_elements(By.CSS_SELECTOR, "input[type='text'], input[type='email'], input[type='number'], textarea, div[contenteditable='true']")
-                logging.info(f"Found {len(all_inputs)} direct input elements")
-                
-                for input_elem in all_inputs:
-                    try:
-                        # Find the form field container (parent with label)
-                        parent = input_elem.find_element(By.XPATH, "./ancestor::div[position()<=5]")
-                        if parent and parent not in fields:
-                            # Check if this parent has a label or "Your answer" text
-                            parent_text = parent.text.strip()
-                            if parent_text and ("Your answer" in parent_text or any(label in parent_text for label in ["Age", "Name", "Email", "Registration", "Mobile", "Weight", "Gender", "Degree", "Institute", "Stream", "Work", "City", "Region", "Blood"])):
-                                fields.append(parent)
-                    except:
-                        continue
-            except Exception as e:
-                logging.info(f"Method 3 failed: {e}")
+        # Try the strategy that worked last time first, then the rest of the chain
+        strategies = [
+            ("listitem selector", self.find_fields_by_listitem),
+            ("'Your answer' text", self.find_fields_by_answer_text),
+            ("direct inputs", self.find_fields_by_direct_inputs),
+        ]
+        cached_strategy = self.locator_cache.strategy_for("field containers")
+        strategies.sort(key=lambda strategy: strategy[0] != cached_strategy)
+        for name, find_fields in strategies:
+            fields = find_fields()
+            if fields:
+                self.locator_cache.record("field containers", name == cached_strategy)
+                if name != cached_strategy:
+                    self.locator_cache.remember(self.driver, "field containers", name)
+                break
+        else:
+            self.locator_cache.record("field containers", False)
         
         # Remove duplicates
         unique_fields = []
@@ -154,6 +342,63 @@ class RobustAutomation:
         logging.info(f"✅ Total unique form fields found: {len(unique_fields)}")
         return unique_fields
     
+    def find_fields_by_listitem(self):
+        """Field containers by the standard Google Forms selector"""
+        try:
+            found_fields = self.driver.find_elements(By.CSS_SELECTOR, "div[role='listitem']")
+            if found_fields:
+                logging.info(f"Found {len(found_fields)} fields with selector: div[role='listitem']")
+            return found_fields
+        except Exception as e:
+            logging.info(f"Method 1 failed: {e}")
+            return []
+    
+    def find_fields_by_answer_text(self):
+        """Field containers as divs holding "Your answer" text and an input"""
+        fields = []
+        try:
+            all_divs = self.driver.find_elements(By.CSS_SELECTOR, "div")
+            logging.info(f"Scanning {len(all_divs)} div elements for 'Your answer' text")
+            
+            for div in all_divs:
+                try:
+                    div_text = div.text.strip()
+                    if div_text and "Your answer" in div_text:
+                        # Check if this div contains an input field
+                        inputs_in_div = div.find_elements(By.CSS_SELECTOR, "input, textarea, div[contenteditable='true']")
+                        if inputs_in_div:
+                            fields.append(div)
+                            logging.info(f"Found field with 'Your answer': {div_text[:50]}...")
+                except:
+                    continue
+            logging.info(f"Found {len(fields)} fields with 'Your answer' text")
+        except Exception as e:
+            logging.info(f"Method 2 failed: {e}")
+        return fields
+    
+    def find_fields_by_direct_inputs(self):
+        """Field containers as labelled ancestors of the input elements"""
+        fields = []
+        try:
+            all_inputs = self.driver.find_elements(By.CSS_SELECTOR, "input[type='text'], input[type='email'], input[type='number'], textarea, div[contenteditable='true']")
+            logging.info(f"Found {len(all_inputs)} direct input elements")
+            
+            for input_elem in all_inputs:
+                try:
+                    # Find the form field container (parent with label)
+                    parent = input_elem.find_element(By.XPATH, "./ancestor::div[position()<=5]")
+                    if parent and parent not in fields:
+                        # Check if this parent has a label or "Your answer" text
+                        parent_text = parent.text.strip()
+                        if parent_text and ("Your answer" in parent_text or any(label in parent_text for label in ["Age", "Name", "Email", "Registration", "Mobile", "Weight", "Gender", "Degree", "Institute", "Stream", "Work", "City", "Region", "Blood"])):
+                            fields.append(parent)
+                except:
+                    continue
+        except Exception as e:
+            logging.info(f"Method 3 failed: {e}")
+        return fields
+    
+    @timed_phase("label_resolution")
     def get_field_label(self, field):
         """Get field label with multiple methods"""
         try:
@@ -207,23 +452,236 @@ class RobustAutomation:
             logging.error(f"❌ Error getting field label: {e}")
             return None
     
+    def find_input_element(self, field):
+        """Find the input element inside a form field container"""
+        # Try multiple input selectors
+        input_selectors = [
+            "input[type='text']",
+            "input[type='email']", 
+            "input[type='number']",
+            "textarea",
+            "input",
+            "div[contenteditable='true']"
+        ]
+        
+        for selector in input_selectors:
+            try:
+                input_element = field.find_element(By.CSS_SELECTOR, selector)
+                if input_element:
+                    return input_element
+            except:
+                continue
+        return None
+    
+    def find_choice_options(self, field):
+        """Read the radio/checkbox/dropdown options of a field container: (kind, control, options)"""
+        listboxes = field.find_elements(By.CSS_SELECTOR, FORM_FIELD_SELECTORS["dropdown"])
+        choices = field.find_elements(By.CSS_SELECTOR, FORM_FIELD_SELECTORS["choice_options"])
+        options = []
+        for choice in choices:
+            value = choice.get_attribute("data-value") or choice.get_attribute("data-answer-value")
+            text = (value or choice.get_attribute("aria-label") or choice.text or "").strip()
+            if text:
+                options.append({"text": text, "value": value, "element": choice})
+        
+        if listboxes:
+            return "listbox", listboxes[0], options
+        if choices:
+            return choices[0].get_attribute("role"), None, options
+        return "text", None, []
+    
+    @timed_phase("detection")
+    def introspect_form_js(self):
+        """Read the whole form schema (labels, input kinds, elements, required flags, options) in one execute_script"""
+        start = time.perf_counter()
+        schema = self.driver.execute_script(FORM_INTROSPECTION_SCRIPT) or []
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        logging.info(f"⚡ JS introspection found {len(schema)} fields in {elapsed_ms:.0f}ms")
+        return schema
+    
+    def build_form_index(self):
+        """Scan the loaded form page once and index label -> container -> input element"""
+        if self.form_schema is not None:
+            try:
+                index = self.build_form_index_cached()
+                if index:
+                    return index
+                logging.warning("⚠️ Page no longer matches the cached form schema - running full discovery")
+            except Exception as e:
+                logging.warning(f"⚠️ Cached schema lookup failed ({e}) - running full discovery")
+            self.form_schema = None
+        
+        if FORM_INTROSPECTION_MODE == "js":
+            try:
+                index = self.build_form_index_js()
+                if index:
+                    return index
+                logging.warning("⚠️ JS introspection found no fields, falling back to Selenium selectors")
+            except Exception as e:
+                logging.warning(f"⚠️ JS introspection failed ({e}), falling back to Selenium selectors")
+        
+        return self.build_form_index_selenium()
+    
+    def build_form_index_js(self):
+        """Build the form index from a single JS introspection round trip"""
+        index = {}
+        schema = self.introspect_form_js()
+        schema_fields = []  # what the schema cache keeps of each field
+        for position, field in enumerate(schema):
+            label = (field.get("label") or "").strip()
+            if not label or label in index:
+                continue
+            options = field.get("options") or []
+            index[label] = {
+                "container": field.get("container"),
+                "input": field.get("input"),
+                "kind": field.get("kind", "unknown"),
+                "required": bool(field.get("required")),
+                "options": options,
+                "option_index": build_option_index(options),
+            }
+            schema_fields.append({
+                "label": label,
+                "position": position,
+                "kind": index[label]["kind"],
+                "required": index[label]["required"],
+                "options": [{"text": option.get("text"), "value": option.get("value"), "index": option.get("index")} for option in options],
+            })
+        
+        self.form_index = index
+        self.discovered_schema = {
+            "fingerprint": schema_fingerprint([field.get("heading") for field in schema]),
+            "fields": schema_fields,
+        }
+        logging.info(f"🗂️ Form index built with {len(index)} labelled fields")
+        return index
+    
+    @timed_phase("detection")
+    def build_form_index_cached(self):
+        """Build the form index from the cached schema: one call fetches the elements by position"""
+        fields = self.form_schema["fields"]
+        found = self.driver.execute_script(
+            CACHED_INDEX_SCRIPT,
+            [[field["position"], field["kind"]] for field in fields],
+            self.form_schema["fingerprint"]["count"]
+        )
+        if not found or len(found) != len(fields) or any(elements is None for elements in found):
+            return None
+        
+        index = {}
+        for field, elements in zip(fields, found):
+            choice_elements = elements.get("options") or []
+            options = [
+                {"text": option["text"], "value": option["value"], "element": choice_elements[option["index"]]}
+                for option in field["options"]
+                if option.get("index") is not None and option["index"] < len(choice_elements)
+            ]
+            index[field["label"]] = {
+                "container": elements.get("container"),
+                "input": elements.get("input"),
+                "kind": field["kind"],
+                "required": field["required"],
+                "options": options,
+                "option_index": build_option_index(options),
+            }
+        
+        self.form_index = index
+        logging.info(f"🗂️ Form index built from the cached schema ({len(index)} fields)")
+        return index
+    
+    def validate_form_schema(self):
+        """Check the cached schema of GOOGLE_FORM_URL against the page with one fingerprint call"""
+        self.form_schema = None
+        if self.schema_cache is None:
+            return False
+        entry = self.schema_cache.get(GOOGLE_FORM_URL)
+        if entry is None:
+            logging.info("📦 No cached schema for this form - running full discovery")
+            return False
+        try:
+            fingerprint = schema_fingerprint(self.driver.execute_script(FORM_FINGERPRINT_SCRIPT) or [])
+        except Exception as e:
+            logging.warning(f"⚠️ Could not fingerprint the form: {e}")
+            return False
+        if fingerprint != entry["fingerprint"]:
+            logging.info("📦 Form layout changed since the schema was cached - running full discovery")
+            return False
+        
+        if not self.label_resolver.restore([field["label"] for field in entry["fields"]], entry.get("label_map") or {}):
+            # Saved before a label was added to MANUAL_FIELD_MAPPING - rediscover so a complete map is cached
+            logging.info("📦 Cached label map does not cover the field mapping - running full discovery")
+            return False
+        self.form_schema = entry
+        logging.info(f"📦 Cached form schema is valid ({len(entry['fields'])} fields, saved {entry.get('saved_at')})")
+        return True
+    
+    def save_form_schema(self):
+        """Persist the schema of the last full discovery so later pages and runs skip it"""
+        if self.schema_cache is None or self.discovered_schema is None or not self.form_index:
+            return False
+        try:
+            label_map = self.label_resolver.compile(self.form_index)
+            self.form_schema = self.schema_cache.save(
+                GOOGLE_FORM_URL,
+                self.discovered_schema["fingerprint"],
+                self.discovered_schema["fields"],
+                dict(label_map)
+            )
+            return True
+        except Exception as e:
+            logging.warning(f"⚠️ Could not save the form schema: {e}")
+            return False
+    
+    def build_form_index_selenium(self):
+        """Build the form index with the Selenium selector fallbacks (one round trip per call)"""
+        index = {}
+        for field in self.find_all_form_fields():
+            label = self.get_field_label(field)
+            if not label:
+                continue
+            label = label.strip()
+            if label in index:
+                continue
+            input_element = self.find_input_element(field)
+            kind, options = "text", []
+            if input_element is None:
+                kind, input_element, options = self.find_choice_options(field)
+            index[label] = {
+                "container": field,
+                "input": input_element,
+                "kind": kind,
+                "required": False,
+                "options": options,
+                "option_index": build_option_index(options),
+            }
+        
+        self.form_index = index
+        logging.info(f"🗂️ Form index built with {len(index)} labelled fields")
+        return index
+    
+    def get_form_index(self):
+        """Return the form index for the current page, building it on first use"""
+        if self.form_index is None:
+            self.build_form_index()
+        return self.form_index
+    
+    def invalidate_form_index(self):
+        """Drop the form index - call after any navigation away from the current form page"""
+        self.form_index = None
+    
+    @timed_phase("label_resolution")
+    def find_indexed_field(self, label_text):
+        """Find the form index entry for a label through the compiled label map"""
+        index = self.get_form_index()
+        form_label = self.label_resolver.resolve(label_text, index)
+        return index.get(form_label) if form_label is not None else None
+    
     def find_field_by_label(self, label_text):
         """Find form field by exact label text"""
         try:
-            form_fields = self.find_all_form_fields()
-            
-            for field in form_fields:
-                field_label = self.get_field_label(field)
-                if field_label and field_label.strip() == label_text:
-                    logging.info(f"✅ Found field: '{label_text}'")
-                    return field
-            
-            # Try partial matching if exact match fails
-            for field in form_fields:
-                field_label = self.get_field_label(field)
-                if field_label and label_text.lower() in field_label.lower():
-                    logging.info(f"✅ Found field (partial match): '{field_label}' for '{label_text}'")
-                    return field
+            entry = self.find_indexed_field(label_text)
+            if entry:
+                return entry["container"]
             
             logging.error(f"❌ Field '{label_text}' not found")
             return None
@@ -231,46 +689,37 @@ class RobustAutomation:
             logging.error(f"❌ Error finding field '{label_text}': {e}")
             return None
     
-    def fill_field(self, label_text, value):
+    @timed_phase("fill")
+    def fill_field(self, label_text, value, strategy=None):
         """Fill a specific field by label"""
+        strategy = strategy or FILL_STRATEGY
         try:
-            field = self.find_field_by_label(label_text)
-            if not field:
+            entry = self.find_indexed_field(label_text)
+            if not entry:
+                logging.error(f"❌ Field '{label_text}' not found")
                 return False
             
-            # Try multiple input selectors
-            input_selectors = [
-                "input[type='text']",
-                "input[type='email']", 
-                "input[type='number']",
-                "textarea",
-                "input",
-                "div[contenteditable='true']"
-            ]
-            
-            input_element = None
-            for selector in input_selectors:
-                try:
-                    input_element = field.find_element(By.CSS_SELECTOR, selector)
-                    if input_element:
-                        break
-                except:
-                    continue
+            if entry.get("kind") in CHOICE_KINDS:
+                return self.select_choice(label_text, entry, value)
             
+            input_element = entry["input"]
             if not input_element:
                 logging.error(f"❌ No input element found for '{label_text}'")
                 return False
             
-            # Clear and fill
-            input_element.clear()
-            time.sleep(0.05)
-            
-            value_str = str(value) if pd.notna(value) else ""
+            value_str = format_cell_value(value)
             
-            # Type character by character (ultra-fast)
-            for char in value_str:
-                input_element.send_keys(char)
-                time.sleep(random.uniform(0.0005, 0.002))
+            try:
+                self.write_value(input_element, value_str, strategy)
+            except StaleElementReferenceException:
+                # Page re-rendered under us - rebuild the index once and retry
+                logging.warning(f"⚠️ Stale element for '{label_text}', rebuilding form index")
+                self.invalidate_form_index()
+                entry = self.find_indexed_field(label_text)
+                if not entry or not entry["input"]:
+                    logging.error(f"❌ Field '{label_text}' not found after rebuilding index")
+                    return False
+                self.write_value(entry["input"], value_str, strategy)
             
             logging.info(f"✅ Filled '{label_text}' with: {value_str[:30]}{'...' if len(value_str) > 30 else ''}")
             return True
@@ -279,15 +728,117 @@ class RobustAutomation:
             logging.error(f"❌ Error filling '{label_text}': {e}")
             return False
     
+    def select_choice(self, label_text, entry, value, retry_stale=True):
+        """Select the option(s) matching value from the field's option index in one execute_script"""
+        value_str = format_cell_value(value)
+        options = resolve_choice(entry.get("option_index") or {}, value_str, entry["kind"])
+        if not options:
+            logging.error(f"❌ '{value_str}' is not an option of '{label_text}' ({option_texts(entry.get('options') or [])})")
+            return False
+        
+        try:
+            self.driver.execute_script(CHOICE_SELECT_SCRIPT, entry["kind"], entry.get("input"), [option["element"] for option in options])
+        except StaleElementReferenceException:
+            if not retry_stale:
+                raise
+            # Page re-rendered under us - rebuild the index once and retry
+            logging.warning(f"⚠️ Stale option for '{label_text}', rebuilding form index")
+            self.invalidate_form_index()
+            entry = self.find_indexed_field(label_text)
+            if not entry:
+                logging.error(f"❌ Field '{label_text}' not found after rebuilding index")
+                return False
+            return self.select_choice(label_text, entry, value, retry_stale=False)
+        
+        logging.info(f"✅ Selected '{', '.join(option['text'] for option in options)}' for '{label_text}'")
+        return True
+    
+    def write_value(self, input_element, value_str, strategy):
+        """Write a value into an input element with the given fill strategy"""
+        if strategy == "typed":
+            self.type_value(input_element, value_str)
+        elif strategy == "send_keys_whole":
+            input_element.clear()
+            input_element.send_keys(value_str)
+        elif strategy == "js_batch":
+            self.driver.execute_script(JS_BATCH_FILL_SCRIPT, [[input_element, value_str]])
+        else:
+            raise ValueError(f"Unknown fill strategy '{strategy}' (expected one of {FILL_STRATEGIES})")
+    
+    def type_value(self, input_element, value_str):
+        """Clear an input element and type the value into it"""
+        # Clear and fill (the pause between fields is the pacer's field_pause)
+        input_element.clear()
+        
+        # Type character by character - all pacing comes from the pacer, not per keystroke
+        for char in value_str:
+            input_element.send_keys(char)
+    
+    @timed_phase("fill")
+    def fill_fields_js_batch(self, field_values, retry_stale=True):
+        """Fill all (label, value) pairs of an entry with a single execute_script call"""
+        pairs = []
+        leftovers = []
+        for label_text, value in field_values:
+            entry = self.find_indexed_field(label_text)
+            if entry and entry["input"] is not None and entry.get("kind") not in CHOICE_KINDS:
+                value_str = format_cell_value(value)
+                pairs.append([entry["input"], value_str])
+            else:
+                leftovers.append((label_text, value))
+        
+        filled = 0
+        if pairs:
+            try:
+                filled = self.driver.execute_script(JS_BATCH_FILL_SCRIPT, pairs) or 0
+            except StaleElementReferenceException:
+                if not retry_stale:
+                    raise
+                logging.warning("⚠️ Stale elements during batch fill, rebuilding form index")
+                self.invalidate_form_index()
+                return self.fill_fields_js_batch(field_values, retry_stale=False)
+            logging.info(f"✅ Batch-filled {filled} fields in one script call")
+        
+        # Fields the batch script cannot set (choice fields, missing inputs) go through the per-field path
+        for label_text, value in leftovers:
+            if self.fill_field(label_text, value, strategy="send_keys_whole"):
+                filled += 1
+        return filled
+    
+    def record_fill_time(self, strategy, seconds):
+        """Accumulate per-strategy fill time"""
+        stats = self.fill_stats.setdefault(strategy, {"entries": 0, "seconds": 0.0})
+        stats["entries"] += 1
+        stats["seconds"] += seconds
+    
+    def print_fill_stats(self):
+        """Print the average fill time per strategy"""
+        for strategy, stats in self.fill_stats.items():
+            if stats["entries"]:
+                average_ms = stats["seconds"] / stats["entries"] * 1000
+                print(f"   ⌨️  Fill strategy '{strategy}': {stats['entries']} entries, avg {average_ms:.0f}ms per entry")
+    
+    def print_locator_stats(self):
+        """Print the locator cache hit/miss counters"""
+        for target, hits, misses in self.locator_cache.summary():
+            print(f"   🧭 Locator cache '{target}': {hits} hits, {misses} misses")
+    
+    @timed_phase("submit_click")
     def find_submit_button(self):
         """Find and click the submit button"""
         try:
+            # Fast path: the selector that found the button on an earlier entry
+            submit_button = self.locator_cache.lookup(self.driver, "submit button", self.is_submit_button)
+            if submit_button is not None:
+                return submit_button
+            
             # Try finding by text content first
             all_buttons = self.driver.find_elements(By.CSS_SELECTOR, "div[role='button'], button, input[type='submit']")
             for button in all_buttons:
                 try:
                     if "submit" in button.text.lower():
                         logging.info("✅ Found submit button by text content")
+                        self.locator_cache.remember(self.driver, "submit button", "text content", button)
                         return button
                 except:
                     continue
@@ -306,6 +857,7 @@ class RobustAutomation:
                     submit_button = self.driver.find_element(By.CSS_SELECTOR, selector)
                     if submit_button and submit_button.is_displayed():
                         logging.info(f"✅ Found submit button with selector: {selector}")
+                        self.locator_cache.remember(self.driver, "submit button", f"selector {selector}", submit_button)
                         return submit_button
                 except:
                     continue
@@ -317,6 +869,94 @@ class RobustAutomation:
             logging.error(f"❌ Error finding submit button: {e}")
             return None
     
+    def is_submit_button(self, element):
+        """Cheap check that a cached element is still the Submit button"""
+        return "submit" in (element.text or "").lower() and element.is_displayed()
+    
+    def is_another_response_element(self, element):
+        """Cheap check that a cached element is still the 'Submit another response' link"""
+        text = (element.text or element.get_attribute("aria-label") or "").lower()
+        return "another" in text and "response" in text
+    
+    def find_another_response_button(self):
+        """Find the 'Submit another response' link on the confirmation page (None if missing)"""
+        # Fast path: the selector that found it on the previous confirmation page
+        another_response_button = self.locator_cache.lookup(self.driver, "another response link", self.is_another_response_element)
+        if another_response_button is not None:
+            return another_response_button
+        
+        # Method 1: Try finding by text content with more flexible matching
+        all_buttons = self.driver.find_elements(By.CSS_SELECTOR, "div[role='button'], button, a, span[role='button']")
+        for button in all_buttons:
+            try:
+                button_text = button.text.lower().strip()
+                if any(phrase in button_text for phrase in ["another response", "submit another", "new response", "fill another"]):
+                    another_response_button = button
+                    logging.info(f"✅ Found 'Submit another response' button: {button.text}")
+                    self.locator_cache.remember(self.driver, "another response link", "button text", button)
+                    break
+            except:
+                continue
+        
+        # Method 2: Try finding by link text (for hyperlinks)
+        if not another_response_button:
+            try:
+                links = self.driver.find_elements(By.CSS_SELECTOR, "a")
+                for link in links:
+                    try:
+                        link_text = link.text.lower().strip()
+                        if "another response" in link_text or "submit another" in link_text:
+                            another_response_button = link
+                            logging.info(f"✅ Found 'Submit another response' link: {link.text}")
+                            self.locator_cache.remember(self.driver, "another response link", "link text", link)
+                            break
+                    except:
+                        continue
+            except:
+                pass
+        
+        # Method 3: Try finding by aria-label or title
+        if not another_response_button:
+            try:
+                all_elements = self.driver.find_elements(By.CSS_SELECTOR, "*")
+                for element in all_elements:
+                    try:
+                        aria_label = element.get_attribute("aria-label") or ""
+                        title = element.get_attribute("title") or ""
+                        aria_label = aria_label.lower().strip()
+                        title = title.lower().strip()
+                        
+                        if any(phrase in aria_label or phrase in title for phrase in ["another response", "submit another", "new response"]):
+                            if element.is_displayed() and element.is_enabled():
+                                another_response_button = element
+                                logging.info(f"✅ Found 'Submit another response' by aria-label/title: {aria_label or title}")
+                                self.locator_cache.remember(self.driver, "another response link", "aria-label/title", element)
+                                break
+                    except:
+                        continue
+            except:
+                pass
+        
+        # Method 4: Try finding by partial text match
+        if not another_response_button:
+            try:
+                all_clickable = self.driver.find_elements(By.CSS_SELECTOR, "[role='button'], button, a, [onclick], [jsaction]")
+                for element in all_clickable:
+                    try:
+                        if element.is_displayed() and element.is_enabled():
+                            element_text = element.text.lower().strip()
+                            if len(element_text) > 0 and ("another" in element_text and "response" in element_text):
+                                another_response_button = element
+                                logging.info(f"✅ Found potential 'another response' button: {element.text}")
+                                self.locator_cache.remember(self.driver, "another response link", "partial text", element)
+                                break
+                    except:
+                        continue
+            except:
+                pass
+        
+        return another_response_button
+    
     def submit_form(self):
         """Submit the form automatically"""
         try:
@@ -326,155 +966,146 @@ class RobustAutomation:
             submit_button = self.find_submit_button()
             if not submit_button:
                 logging.error("❌ Could not find submit button")
+                self.failure_reason = "submit button not found"
                 return False
             
             # Click submit
-            submit_button.click()
+            with self.metrics.phase("submit_click"):
+                submit_button.click()
+            self.invalidate_form_index()
             logging.info("✅ Submit button clicked")
-            time.sleep(1)  # Ultra-fast wait for submission
             
-            # Check for "Submit another response" button
-            time.sleep(1.5)  # Ultra-fast wait for page to load after submission
-            
-            # Look for "Submit another response" button with improved detection
-            another_response_button = None
-            
-            # Method 1: Try finding by text content with more flexible matching
-            all_buttons = self.driver.find_elements(By.CSS_SELECTOR, "div[role='button'], button, a, span[role='button']")
-            for button in all_buttons:
-                try:
-                    button_text = button.text.lower().strip()
-                    if any(phrase in button_text for phrase in ["another response", "submit another", "new response", "fill another"]):
-                        another_response_button = button
-                        logging.info(f"✅ Found 'Submit another response' button: {button.text}")
-                        break
-                except:
-                    continue
-            
-            # Method 2: Try finding by link text (for hyperlinks)
-            if not another_response_button:
-                try:
-                    links = self.driver.find_elements(By.CSS_SELECTOR, "a")
-                    for link in links:
-                        try:
-                            link_text = link.text.lower().strip()
-                            if "another response" in link_text or "submit another" in link_text:
-                                another_response_button = link
-                                logging.info(f"✅ Found 'Submit another response' link: {link.text}")
-                                break
-                        except:
-                            continue
-                except:
-                    pass
+            # Wait for the confirmation page instead of a fixed delay
+            confirm_start = time.perf_counter()
+            with self.metrics.phase("confirmation_wait"):
+                confirmed = self.wait_for(confirmation_page_visible(), SUBMISSION_CONFIRM_TIMEOUT, "confirmation page")
+            self.confirmation_seconds = time.perf_counter() - confirm_start
+            if not confirmed:
+                logging.error("❌ Submission was not confirmed")
+                self.failure_reason = "rate limited" if self.rate_limited() else "submission not confirmed"
+                return False
+            self.pacer.after_submission_pause()
             
-            # Method 3: Try finding by aria-label or title
-            if not another_response_button:
-                try:
-                    all_elements = self.driver.find_elements(By.CSS_SELECTOR, "*")
-                    for element in all_elements:
-                        try:
-                            aria_label = element.get_attribute("aria-label") or ""
-                            title = element.get_attribute("title") or ""
-                            aria_label = aria_label.lower().strip()
-                            title = title.lower().strip()
-                            
-                            if any(phrase in aria_label or phrase in title for phrase in ["another response", "submit another", "new response"]):
-                                if element.is_displayed() and element.is_enabled():
-                                    another_response_button = element
-                                    logging.info(f"✅ Found 'Submit another response' by aria-label/title: {aria_label or title}")
-                                    break
-                        except:
-                            continue
-                except:
-                    pass
+            # Multi-tab mode: the next form is already loaded in another tab
+            if self.tab_pool is not None:
+                return self.switch_to_preloaded_tab()
             
-            # Method 4: Try finding by partial text match
-            if not another_response_button:
-                try:
-                    all_clickable = self.driver.find_elements(By.CSS_SELECTOR, "[role='button'], button, a, [onclick], [jsaction]")
-                    for element in all_clickable:
-                        try:
-                            if element.is_displayed() and element.is_enabled():
-                                element_text = element.text.lower().strip()
-                                if len(element_text) > 0 and ("another" in element_text and "response" in element_text):
-                                    another_response_button = element
-                                    logging.info(f"✅ Found potential 'another response' button: {element.text}")
-                                    break
-                        except:
-                            continue
-                except:
-                    pass
+            return self.load_next_form()
+                
+        except Exception as e:
+            logging.error(f"❌ Error submitting form: {e}")
+            self.failure_reason = f"submit error: {e}"
+            return False
+    
+    def rate_limited(self):
+        """True when the page is a throttling / unusual-traffic page"""
+        try:
+            return bool(rate_limit_page_visible()(self.driver))
+        except Exception:
+            return False
+    
+    @timed_phase("reload")
+    def load_next_form(self):
+        """Click 'Submit another response' on the confirmation page and index the new form"""
+        try:
+            # Look for "Submit another response" button (cached locator first)
+            another_response_button = self.find_another_response_button()
             
             if another_response_button:
                 logging.info("✅ Found 'Submit another response' button - clicking...")
                 try:
                     # Scroll to the button to make sure it's visible
                     self.driver.execute_script("arguments[0].scrollIntoView(true);", another_response_button)
-                    time.sleep(0.3)
+                    self.wait_for(EC.element_to_be_clickable(another_response_button), ELEMENT_WAIT_TIMEOUT, "'Submit another response' to be clickable")
                     
                     # Click the button
                     another_response_button.click()
+                    self.invalidate_form_index()
                     logging.info("✅ Clicked 'Submit another response' - New form loaded")
                     
-                    # Wait for new form to load
-                    time.sleep(1.5)
-                    
-                    # Verify we're back on a form page
-                    fields = self.find_all_form_fields()
+                    # Wait for new form to load, then verify we're back on a form page
+                    # (the index is reused for the next entry)
+                    self.wait_for_form_ready()
+                    fields = self.build_form_index()
                     if len(fields) > 0:
                         logging.info(f"✅ Confirmed: New form loaded with {len(fields)} fields")
                         return True
                     else:
+                        # The submission itself was confirmed - ensure_form_loaded reloads the form
                         logging.warning("⚠️ New form doesn't seem to have fields, will load fresh form")
-                        return False
+                        return True
                         
                 except Exception as e:
                     logging.error(f"❌ Error clicking 'Submit another response': {e}")
-                    return False
+                    self.invalidate_form_index()
+                    return True
             else:
                 logging.info("⚠️ 'Submit another response' button not found, will load fresh form")
-                return False
+                return True
                 
         except Exception as e:
-            logging.error(f"❌ Error submitting form: {e}")
-            return False
+            # The submission itself was confirmed - ensure_form_loaded reloads the form
+            logging.error(f"❌ Error loading the next form: {e}")
+            self.invalidate_form_index()
+            return True
+    
+    @timed_phase("reload")
+    def switch_to_preloaded_tab(self):
+        """Recycle the spent tab in the background and continue on the next pre-loaded form"""
+        try:
+            self.tab_pool.rotate()
+            self.invalidate_form_index()
+            self.wait_for_form_ready()
+            fields = self.build_form_index()
+            logging.info(f"✅ Switched to pre-loaded tab with {len(fields)} fields")
+        except Exception as e:
+            # The submission itself was confirmed - ensure_form_loaded reloads the form
+            logging.error(f"❌ Error switching to pre-loaded tab: {e}")
+            self.invalidate_form_index()
+        return True
     
-    def fill_form(self, row_data, entry_num):
+    def fill_form(self, row_data, entry_num, strategy=None):
         """Fill form with data from Excel row and submit automatically"""
+        strategy = strategy or FILL_STRATEGY
+        self.failure_reason = None
+        self.missing_fields = 0
+        self.confirmation_seconds = None
+        if self.http_engine is not None:
+            submitted = self.http_engine.submit_row(row_data, entry_num)
+            self.confirmation_seconds = self.http_engine.last_seconds
+            if submitted:
+                return True
+            self.failure_reason = self.http_engine.last_rejection or "rejected over HTTP"
+            return False
+        
         try:
             logging.info(f"📊 Filling entry {entry_num + 1}")
             
-            # Field mappings
-            field_mappings = {
-                "Registration Number": " Registration Number",
-                "Name": "Name", 
-                "Email Address": "Email Address",
-                "Middle Initial": "Middle Initial",
-                "Blood Group": "Blood Group",
-                "Age": "Age ",
-                "Mobile Number": "Mobile Number",
-                "Weight in Kgs.": "Weight in Kgs.",
-                "Gender": "Gender",
-                "Degree": "Degree",
-                "Institute": "Institute",
-                "Stream": "Stream",
-                "Register joining code": "Register joining code",
-                "Age in Company (Years)": "Age in Company (Years)",
-                "Work Experience": "Work Experience",
-                "Current City": "Current City",
-                "Region": "Region"
-            }
-            
-            # Fill each field
-            for field_label, excel_column in field_mappings.items():
-                if excel_column in self.data.columns:
+            # Collect the values to fill
+            field_values = []
+            for field_label, excel_column in MANUAL_FIELD_MAPPING.items():
+                if excel_column in row_data:
                     value = row_data[excel_column]
                     if pd.notna(value):
                         logging.info(f"   {field_label}: {value}")
-                        self.fill_field(field_label, value)
-                        time.sleep(0.05)  # Ultra-fast delay between fields
+                        field_values.append((field_label, value))
+            
+            # Fill each field
+            fill_start = time.perf_counter()
+            if strategy == "js_batch":
+                filled = self.fill_fields_js_batch(field_values)
+            else:
+                filled = 0
+                for field_label, value in field_values:
+                    if self.fill_field(field_label, value, strategy):
+                        filled += 1
+                    self.pacer.field_pause()
+            self.missing_fields = len(field_values) - filled
+            fill_seconds = time.perf_counter() - fill_start
+            self.record_fill_time(strategy, fill_seconds)
+            self.journal_record(entry_num, "filled", self.row_hash(row_data))
             
-            logging.info(f"✅ Entry {entry_num + 1} filled - Submitting automatically...")
+            logging.info(f"✅ Entry {entry_num + 1} filled in {fill_seconds * 1000:.0f}ms ({strategy}) - Submitting automatically...")
             
             # Submit form automatically
             if self.submit_form():
@@ -486,8 +1117,120 @@ class RobustAutomation:
             
         except Exception as e:
             logging.error(f"❌ Error filling entry {entry_num + 1}: {e}")
+            self.failure_reason = f"fill error: {e}"
             return False
     
+    def row_hash(self, row_data):
+        """Content hash of the mapped columns of a row (the same with and without preflight)"""
+        compact = [rule_column for rule_column, rule in VALIDATION_RULES.items() if rule.get("remove_whitespace")]
+        compact_columns = match_columns(MANUAL_FIELD_MAPPING.values(), compact).values()
+        return row_content_hash(row_data, MANUAL_FIELD_MAPPING.values(), set(compact_columns))
+    
+    def is_duplicate(self, index, row_hash):
+        """True when a row with the same content was already submitted to this form (or is in flight)"""
+        return self.dedup_index is not None and self.dedup_index.check(index, row_hash) is not None
+    
+    def dedup_record(self, index, row_hash, submitted):
+        """Remember a submitted row's content, or free it for another attempt"""
+        if self.dedup_index is None:
+            return
+        if submitted:
+            self.dedup_index.add(index, row_hash)
+        else:
+            self.dedup_index.release(row_hash)
+    
+    def report_duplicates(self):
+        """Print and write the rows skipped as duplicates"""
+        if self.dedup_index is None:
+            return
+        duplicates = self.dedup_index.duplicates
+        if duplicates:
+            pd.DataFrame(duplicates, columns=["entry", "duplicate_of", "source", "hash"]).to_csv(DEDUP_REPORT_PATH, index=False)
+            print(f"   🧬 Skipped as duplicates: {len(duplicates)} (see {DEDUP_REPORT_PATH})")
+        self.dedup_index.close()
+    
+    def journal_record(self, index, state, row_hash):
+        """Record a row state change in the checkpoint journal (if enabled)"""
+        if self.journal is not None:
+            self.journal.record(index, state, row_hash)
+    
+    def resume_index(self, start_index, end_index):
+        """First row at or after start_index that the journal has not confirmed submitted"""
+        index = end_index
+        for row_index, row_data in self.iter_rows(start_index, end_index):
+            if not self.journal.is_submitted(row_index, self.row_hash(row_data)):
+                index = row_index
+                break
+        if index > start_index:
+            logging.info(f"📒 Resuming from entry {index + 1} ({index - start_index} entries already submitted)")
+        return index
+    
+    def load_form_page(self):
+        """Navigate to a fresh copy of the Google Form"""
+        self.driver.get(GOOGLE_FORM_URL)
+        self.invalidate_form_index()
+    
+    @timed_phase("reload")
+    def ensure_form_loaded(self, entry_num, interactive=True):
+        """Make sure a fillable form is showing before entry_num, loading a fresh one if needed"""
+        # Check if we're still on a form page (reuses the index built after submit)
+        try:
+            fields = self.get_form_index()
+            if len(fields) > 0:
+                return True
+            
+            print(f"\n🔄 Loading fresh form for entry {entry_num + 1}...")
+            self.load_form_page()
+        except Exception as e:
+            # If error checking fields, load fresh form
+            print(f"\n🔄 Loading fresh form for entry {entry_num + 1} (error occurred: {e})...")
+            self.load_form_page()
+        
+        # Wait for form to load
+        try:
+            self.wait_for_form_ready()
+            fields = self.build_form_index()
+            if len(fields) > 0:
+                print(f"✅ Fresh form loaded successfully with {len(fields)} fields")
+                return True
+        except Exception as e:
+            print(f"⚠️  Error checking form: {e}")
+        
+        if not interactive:
+            return self.recover_form(entry_num)
+        
+        print("⚠️  Form not loading automatically. Please manually navigate.")
+        input("Press Enter when form is loaded...")
+        # Check again after manual navigation
+        try:
+            fields = self.build_form_index()
+            if len(fields) > 0:
+                print(f"✅ Manual navigation successful! Found {len(fields)} fields")
+                return True
+            print("⚠️  Still no fields found after manual navigation")
+        except:
+            print("⚠️  Error checking fields after manual navigation")
+        return False
+    
+    def recover_form(self, entry_num):
+        """Reload the form with backoff instead of asking for manual navigation"""
+        for attempt in range(1, FORM_RECOVERY_ATTEMPTS + 1):
+            delay = min(2 ** attempt, 30)
+            logging.warning(f"🔁 Form did not load for entry {entry_num + 1} - recovery attempt {attempt}/{FORM_RECOVERY_ATTEMPTS} in {delay}s")
+            time.sleep(delay)
+            try:
+                self.load_form_page()
+                self.wait_for_form_ready()
+                fields = self.build_form_index()
+                if len(fields) > 0:
+                    logging.info(f"✅ Form recovered with {len(fields)} fields")
+                    return True
+            except Exception as e:
+                logging.warning(f"⚠️ Recovery attempt {attempt} failed: {e}")
+        
+        logging.error(f"❌ Form did not load for entry {entry_num + 1}")
+        return False
+    
     def test_browser(self):
         """Test if browser is working properly"""
         try:
@@ -500,77 +1243,122 @@ class RobustAutomation:
             logging.error(f"❌ Browser test failed: {e}")
             return False
     
+    def prepare_browser(self):
+        """Connect to Chrome and wait until the form is detected"""
+        # Setup driver to connect to existing browser (or launch one)
+        if not self.connect_browser():
+            logging.error("❌ Failed to connect to existing Chrome browser")
+            return False
+        
+        # Test browser immediately
+        if not self.test_browser():
+            logging.error("❌ Browser test failed - cannot proceed")
+            return False
+        
+        # Debug: Print page source info
+        try:
+            page_title = self.driver.title
+            logging.info(f"📄 Page title: {page_title}")
+            
+            # Check if we're on a Google Form
+            if page_title and ("form" in page_title.lower() or "docs.google.com/forms" in self.driver.current_url):
+                logging.info("✅ Confirmed: Page appears to be a Google Form")
+            else:
+                logging.warning("⚠️ Page doesn't appear to be a Google Form")
+        except Exception as e:
+            logging.error(f"❌ Error checking page info: {e}")
+            print("⚠️ Warning: Could not verify page title. Make sure you're on the correct Google Form page.")
+        
+        # A launched browser starts on a blank page
+        if self.launches_browser():
+            print("🌐 Opening the form in the launched browser...")
+            self.load_form_page()
+        
+        # Check if we're on a submission confirmation page and navigate to fresh form
+        current_url = self.driver.current_url
+        if "formResponse" in current_url:
+            print("🔄 Detected submission confirmation page - navigating to fresh form...")
+            self.load_form_page()
+            print("✅ Navigated to fresh form")
+        
+        # Wait for form fields to render, then index them
+        form_detected = False
+        try:
+            print("🔍 Looking for form fields...")
+            self.wait_for_form_ready()
+            self.validate_form_schema()
+            fields = self.build_form_index()
+            if len(fields) > 0:
+                print(f"✅ Form detected! Found {len(fields)} fields")
+                form_detected = True
+                if self.form_schema is None:
+                    self.save_form_schema()
+        except Exception as e:
+            print(f"⚠️  Error detecting fields: {e}")
+        
+        if not form_detected:
+            print(f"❌ Form not detected within {FORM_LOAD_TIMEOUT}s")
+            print("Please make sure you're on the correct Google Form page")
+            print("Try refreshing the page and signing in again")
+            return False
+        
+        return True
+    
     def run_automation(self):
         start_time = datetime.now()
         
+        if PARALLEL_WORKERS > 1:
+            return self.run_parallel_automation()
+        
         try:
             logging.info("🚀 Starting Robust Automation")
             
-            # Setup driver to connect to existing browser
-            if not self.setup_driver():
-                logging.error("❌ Failed to connect to existing Chrome browser")
-                return False
-            
-            # Test browser immediately
-            if not self.test_browser():
-                logging.error("❌ Browser test failed - cannot proceed")
-                return False
-            
-            if not self.load_excel_data():
+            if SUBMISSION_ENGINE == "http":
+                # Browserless mode: resolve entry IDs once, then POST rows directly
+                self.http_engine = HttpFormEngine(GOOGLE_FORM_URL, MANUAL_FIELD_MAPPING)
+                if not self.http_engine.resolve_entry_ids():
+                    logging.error("❌ Could not resolve form entry IDs - cannot proceed")
+                    return False
+            elif SUBMISSION_ENGINE == "cdp":
+                # The asyncio CDP engine talks to Chrome's debug port itself - no chromedriver session
+                logging.info(f"🔌 Using the CDP engine on {CHROME_DEBUGGER_ADDRESS} with {CDP_TABS} tabs")
+            elif not self.prepare_browser():
                 return False
+            elif PRELOADED_TABS > 1:
+                self.tab_pool = FormTabPool(self.driver, GOOGLE_FORM_URL, PRELOADED_TABS)
+                self.tab_pool.open()
             
-            # Debug: Print page source info
-            try:
-                page_title = self.driver.title
-                logging.info(f"📄 Page title: {page_title}")
-                
-                # Check if we're on a Google Form
-                if page_title and ("form" in page_title.lower() or "docs.google.com/forms" in self.driver.current_url):
-                    logging.info("✅ Confirmed: Page appears to be a Google Form")
-                else:
-                    logging.warning("⚠️ Page doesn't appear to be a Google Form")
-            except Exception as e:
-                logging.error(f"❌ Error checking page info: {e}")
-                print("⚠️ Warning: Could not verify page title. Make sure you're on the correct Google Form page.")
-            
-            # Check if we're on a submission confirmation page and navigate to fresh form
-            current_url = self.driver.current_url
-            if "formResponse" in current_url:
-                print("🔄 Detected submission confirmation page - navigating to fresh form...")
-                self.driver.get(GOOGLE_FORM_URL)
-                time.sleep(1.5)
-                print("✅ Navigated to fresh form")
-            
-            # Wait for form fields with multiple attempts
-            form_detected = False
-            for attempt in range(5):
-                try:
-                    print(f"🔍 Attempt {attempt + 1}: Looking for form fields...")
-                    fields = self.find_all_form_fields()
-                    if len(fields) > 0:
-                        print(f"✅ Form detected! Found {len(fields)} fields")
-                        form_detected = True
-                        break
-                    else:
-                        print(f"⚠️  Attempt {attempt + 1}: No fields found, waiting...")
-                        time.sleep(0.5)
-                except Exception as e:
-                    print(f"⚠️  Attempt {attempt + 1}: Error detecting fields: {e}")
-                    time.sleep(0.5)
-            
-            if not form_detected:
-                print("❌ Form not detected after 5 attempts")
-                print("Please make sure you're on the correct Google Form page")
-                print("Try refreshing the page and signing in again")
+            if not self.load_rows():
                 return False
             
             # Process entries in batches from config
-            end_index = END_INDEX if END_INDEX is not None else len(self.data)
+            end_index = min(END_INDEX if END_INDEX is not None else self.total_rows, self.total_rows)
             start_index = START_INDEX
             batch_size = BATCH_SIZE
             
+            # Normalize and validate every row up front
+            rejected_entries = 0
+            if PREFLIGHT_ENABLED:
+                rejected_entries = self.run_preflight_checks(start_index, end_index)
+            
+            if METRICS_ENABLED:
+                self.metrics.open(METRICS_FILE_PATH)
+            if PROFILE_WEBDRIVER and self.driver is not None:
+                self.profiler = CommandProfiler().attach(self.driver)
+                self.profiler.open(PROFILE_FILE_PATH)
+            if HEALTH_MONITOR_ENABLED and self.driver is not None:
+                self.start_session_monitor()
+            
+            # Resume automatically from the checkpoint journal
+            if JOURNAL_ENABLED:
+                self.journal = CheckpointJournal(JOURNAL_FILE_PATH)
+                if AUTO_RESUME:
+                    start_index = self.resume_index(start_index, end_index)
+            if DEDUP_ENABLED:
+                self.dedup_index = DedupIndex(DEDUP_INDEX_PATH, GOOGLE_FORM_URL)
+            
             # Calculate batch information
-            total_entries = min(end_index, len(self.data)) - start_index
+            total_entries = end_index - start_index
             current_batch = (start_index // batch_size) + 1
             total_batches = (total_entries + batch_size - 1) // batch_size
             
@@ -578,84 +1366,128 @@ class RobustAutomation:
             print(f"   Total entries to process: {total_entries}")
             print(f"   Batch size: {batch_size}")
             print(f"   Current batch: {current_batch}/{total_batches}")
-            print(f"   Processing entries: {start_index + 1} to {min(end_index, len(self.data))}")
+            print(f"   Processing entries: {start_index + 1} to {end_index}")
             print()
             
             successful_submissions = 0
             failed_submissions = 0
+            skipped_submissions = 0
+            
+            # Unattended mode: batch boundaries are checkpoints, not prompts
+            if UNATTENDED_MODE:
+                self.scheduler = BatchScheduler(BATCH_COOLDOWN_SECONDS, RUN_WINDOW, STOP_FILE_PATH)
+                if not self.scheduler.wait_for_window():
+                    print("🛑 Automation stopped (stop file found)")
+                    return True
             
-            for index in range(start_index, min(end_index, len(self.data))):
-                logging.info(f"📝 Processing entry {index + 1}/{len(self.data)} (Batch {current_batch})")
+            if RETRY_FAILED_ENTRIES and MAX_RETRIES > 0:
+                self.retry_queue = RetryQueue(MAX_RETRIES, RETRY_BASE_DELAY, DEAD_LETTER_PATH)
+            
+            rows_to_submit = self.iter_rows(start_index, end_index)
+            if REPLAY_DEAD_LETTERS:
+                rows_to_submit = self.dead_letter_rows()
+            if SUBMISSION_ENGINE == "cdp":
+                # Tabs are pipelined on one event loop, so the rows are consumed by the engine
+                successful_submissions, failed_submissions, skipped_submissions = self.run_cdp_submissions(rows_to_submit)
+                rows_to_submit = []
+            
+            stopped = False
+            processed = 0  # entries actually filled - skipped rows do not count towards a batch
+            for index, row_data in rows_to_submit:
+                if self.scheduler is not None and not self.scheduler.wait_for_window():
+                    print("🛑 Automation stopped (stop file found)")
+                    stopped = True
+                    break
+                logging.info(f"📝 Processing entry {index + 1}/{self.total_rows} (Batch {current_batch})")
+                
+                # A dead or hung browser is reconnected before the entry, so the run resumes here
+                if self.monitor is not None:
+                    if not self.monitor.healthy and not self.recover_session():
+                        print("🛑 Automation stopped (browser session lost)")
+                        stopped = True
+                        break
                 
-                row_data = self.data.iloc[index]
+                row_hash = self.row_hash(row_data)
+                if self.journal is not None and self.journal.is_submitted(index, row_hash):
+                    skipped_submissions += 1
+                    logging.info(f"⏭️ Entry {index + 1} already submitted according to the journal - skipping")
+                    continue
+                if self.is_duplicate(index, row_hash):
+                    continue
+                if processed:
+                    # Only a real submission waits - rows skipped above cost no pause
+                    self.pacer.submission_pause()
+                self.journal_record(index, "pending", row_hash)
+                processed += 1
                 
-                if self.fill_form(row_data, index):
+                self.metrics.start_entry(index)
+                if self.profiler is not None:
+                    self.profiler.start_entry(index)
+                if self.monitor is not None:
+                    self.monitor.entry_started()
+                submitted = self.fill_form(row_data, index)
+                if not submitted and self.monitor is not None and not self.monitor.check_now():
+                    # The browser died under this entry - reconnect and fill it again
+                    self.monitor.entry_finished()
+                    if self.recover_session():
+                        self.monitor.entry_started()
+                        submitted = self.fill_form(row_data, index)
+                if self.monitor is not None:
+                    # Reloads and manual-navigation prompts below are not part of the entry
+                    self.monitor.entry_finished()
+                self.journal_record(index, "submitted" if submitted else "failed", row_hash)
+                self.dedup_record(index, row_hash, submitted)
+                self.pace_after_entry(submitted)
+                
+                if submitted:
                     successful_submissions += 1
                     print(f"\n🎯 ENTRY {index + 1} COMPLETED! ✅")
                     print(f"📊 Progress: {successful_submissions + failed_submissions}/{min(batch_size, total_entries)} in current batch")
                     
                     # Check if we need to load fresh form (if "Submit another response" failed)
-                    if index + 1 < min(end_index, len(self.data)):
-                        # Check if we're still on a form page
-                        try:
-                            fields = self.find_all_form_fields()
-                            if len(fields) == 0:
-                                print(f"\n🔄 Loading fresh form for entry {index + 2}...")
-                                self.driver.get(GOOGLE_FORM_URL)
-                                time.sleep(1.5)  # Ultra-fast wait time
-                                
-                                # Wait for form to load with more attempts
-                                form_loaded = False
-                                for attempt in range(10):  # Increased attempts
-                                    try:
-                                        fields = self.find_all_form_fields()
-                                        if len(fields) > 0:
-                                            form_loaded = True
-                                            print(f"✅ Fresh form loaded successfully with {len(fields)} fields")
-                                            break
-                                        else:
-                                            print(f"⚠️  Attempt {attempt + 1}: Form not loaded yet, waiting...")
-                                            time.sleep(0.5)
-                                    except Exception as e:
-                                        print(f"⚠️  Attempt {attempt + 1}: Error checking form: {e}")
-                                        time.sleep(0.5)
-                                
-                                if not form_loaded:
-                                    print("⚠️  Form not loading automatically. Please manually navigate.")
-                                    input("Press Enter when form is loaded...")
-                                    # Check again after manual navigation
-                                    try:
-                                        fields = self.find_all_form_fields()
-                                        if len(fields) > 0:
-                                            print(f"✅ Manual navigation successful! Found {len(fields)} fields")
-                                        else:
-                                            print("⚠️  Still no fields found after manual navigation")
-                                    except:
-                                        print("⚠️  Error checking fields after manual navigation")
-                        except Exception as e:
-                            # If error checking fields, load fresh form
-                            print(f"\n🔄 Loading fresh form for entry {index + 2} (error occurred: {e})...")
-                            self.driver.get(GOOGLE_FORM_URL)
-                            time.sleep(3)
+                    if self.http_engine is None and index + 1 < end_index:
+                        self.ensure_form_loaded(index + 1, interactive=not UNATTENDED_MODE)
                 else:
                     failed_submissions += 1
                     logging.error(f"❌ Failed to fill entry {index + 1}")
+                    if self.retry_queue is not None:
+                        self.retry_queue.add(index, row_data, self.failure_reason or "unknown error")
+                    
+                    # Unattended: start the next entry on a fresh form instead of the failed page
+                    if UNATTENDED_MODE and self.http_engine is None and index + 1 < end_index:
+                        self.invalidate_form_index()
+                        try:
+                            self.load_form_page()
+                        except Exception as e:
+                            logging.warning(f"⚠️ Could not reload the form after a failure: {e}")
+                        self.ensure_form_loaded(index + 1, interactive=False)
+                self.metrics.finish_entry(submitted)
+                if self.profiler is not None:
+                    self.profiler.finish_entry()
                 
                 # Check if batch is complete
-                entries_in_current_batch = (index - start_index + 1)
-                if entries_in_current_batch >= batch_size:
+                entries_in_current_batch = (processed - 1) % batch_size + 1
+                if entries_in_current_batch == batch_size:
                     print(f"\n🎉 BATCH {current_batch} COMPLETED!")
                     print(f"✅ Successful: {successful_submissions}")
                     print(f"❌ Failed: {failed_submissions}")
                     print(f"📊 Success Rate: {(successful_submissions/(successful_submissions+failed_submissions)*100):.1f}%")
+                    self.metrics.print_batch_report()
                     
-                    # Ask user if they want to continue with next batch
-                    if index + 1 < min(end_index, len(self.data)):
-                        print(f"\n🔄 Ready for next batch? (entries {index + 2} to {min(index + 1 + batch_size, min(end_index, len(self.data)))})")
-                        response = input("Press Enter to continue, or type 'stop' to end: ").strip().lower()
-                        if response == 'stop':
-                            print("🛑 Automation stopped by user")
-                            break
+                    # Ask user if they want to continue with next batch (unattended: checkpoint instead)
+                    if index + 1 < end_index:
+                        print(f"\n🔄 Ready for next batch? (entries {index + 2} to {min(index + 1 + batch_size, end_index)})")
+                        if self.scheduler is not None:
+                            if not self.scheduler.checkpoint(current_batch, index + 1):
+                                print("🛑 Automation stopped (stop file found)")
+                                stopped = True
+                                break
+                        else:
+                            response = input("Press Enter to continue, or type 'stop' to end: ").strip().lower()
+                            if response == 'stop':
+                                print("🛑 Automation stopped by user")
+                                stopped = True
+                                break
                         
                         # Reset counters for next batch
                         successful_submissions = 0
@@ -665,9 +1497,20 @@ class RobustAutomation:
                 # Progress update every 10 entries
                 if (index + 1) % 10 == 0:
                     elapsed = datetime.now() - start_time
-                    logging.info(f"📈 Progress: {index + 1}/{len(self.data)} entries")
+                    logging.info(f"📈 Progress: {index + 1}/{self.total_rows} entries")
                     logging.info(f"⏱️  Elapsed: {elapsed}")
                     logging.info(f"📊 Batch Progress: {entries_in_current_batch}/{batch_size}")
+                
+                # Interleave retries whose backoff has expired with the main stream
+                if self.retry_queue is not None:
+                    self.process_due_retries(more_rows=index + 1 < end_index)
+            
+            # Finish the retry queue (or dead-letter it when the run was stopped)
+            if self.retry_queue is not None:
+                if stopped:
+                    self.retry_queue.abandon("run stopped")
+                else:
+                    self.drain_retries()
             
             total_time = datetime.now() - start_time
             print(f"\n🎉 AUTOMATION COMPLETED!")
@@ -678,6 +1521,28 @@ class RobustAutomation:
             if successful_submissions + failed_submissions > 0:
                 print(f"   📈 Success rate: {(successful_submissions/(successful_submissions+failed_submissions)*100):.1f}%")
             print(f"   🎯 Entries processed: {successful_submissions + failed_submissions}")
+            if skipped_submissions:
+                print(f"   ⏭️  Skipped (already submitted): {skipped_submissions}")
+            self.report_duplicates()
+            if rejected_entries:
+                print(f"   🧹 Rejected by preflight: {rejected_entries} (see {PREFLIGHT_REPORT_PATH})")
+            if self.retry_queue is not None:
+                print(f"   🔁 Recovered by retry: {self.retry_queue.recovered}")
+                if self.retry_queue.dead_lettered:
+                    print(f"   ☠️  Dead-lettered: {self.retry_queue.dead_lettered} (see {DEAD_LETTER_PATH})")
+            self.print_fill_stats()
+            self.print_locator_stats()
+            self.pacer.print_summary()
+            self.metrics.print_batch_report()
+            self.metrics.close()
+            if self.profiler is not None:
+                self.profiler.print_summary()
+                self.profiler.close()
+            if self.monitor is not None:
+                self.monitor.stop()
+            
+            if self.tab_pool is not None:
+                self.tab_pool.close()
             
             return True
             
@@ -685,6 +1550,342 @@ class RobustAutomation:
             logging.error(f"❌ Error in automation: {e}")
             return False
 
+    def pace_after_entry(self, submitted):
+        """Feed the outcome of an entry to the pacing controller"""
+        if not submitted:
+            trouble = self.failure_reason or "unknown error"
+        elif self.missing_fields:
+            trouble = "missing fields"
+        else:
+            trouble = None
+        self.pacer.observe(trouble, self.confirmation_seconds)
+    
+    def retry_entry(self, index, row_data, attempt, reason):
+        """Retry one queued row on a freshly loaded form"""
+        logging.info(f"🔁 Retrying entry {index + 1} (attempt {attempt}/{MAX_RETRIES}, last error: {reason})")
+        row_hash = self.row_hash(row_data)
+        if self.http_engine is None:
+            try:
+                self.load_form_page()
+            except Exception as e:
+                logging.warning(f"⚠️ Could not reload the form for the retry: {e}")
+            if not self.ensure_form_loaded(index, interactive=False):
+                self.retry_queue.add(index, row_data, "form did not load")
+                return False
+        
+        if self.is_duplicate(index, row_hash):
+            # The same content went through from another row while this one waited
+            return False
+        self.journal_record(index, "pending", row_hash)
+        submitted = self.fill_form(row_data, index)
+        self.journal_record(index, "submitted" if submitted else "failed", row_hash)
+        self.dedup_record(index, row_hash, submitted)
+        if submitted:
+            self.retry_queue.succeeded(index)
+            logging.info(f"✅ Entry {index + 1} submitted on retry {attempt}")
+        else:
+            self.retry_queue.add(index, row_data, self.failure_reason or "unknown error")
+        return submitted
+    
+    def process_due_retries(self, more_rows=True):
+        """Retry every queued row whose backoff has expired"""
+        retried = False
+        for index, row_data, attempt, reason in self.retry_queue.due():
+            self.retry_entry(index, row_data, attempt, reason)
+            retried = True
+        # Hand the main stream a fillable form again
+        if retried and more_rows and self.http_engine is None:
+            self.ensure_form_loaded(index + 1, interactive=False)
+    
+    def drain_retries(self):
+        """Retry what is left in the queue after the main stream, waiting out the backoff"""
+        while len(self.retry_queue):
+            wait = self.retry_queue.seconds_until_next()
+            if wait:
+                logging.info(f"⏳ {len(self.retry_queue)} entries waiting for retry - next in {wait:.0f}s")
+                time.sleep(wait)
+            self.process_due_retries(more_rows=False)
+    
+    def dead_letter_rows(self):
+        """Rows from the dead-letter file, which is set aside so new failures start a fresh one"""
+        rows = load_dead_letters(DEAD_LETTER_PATH)
+        if rows:
+            os.replace(DEAD_LETTER_PATH, DEAD_LETTER_PATH + ".replayed")
+        logging.info(f"☠️ Replaying {len(rows)} dead-lettered rows from {DEAD_LETTER_PATH}")
+        return rows
+    
+    def run_cdp_submissions(self, rows):
+        """Submit (index, row) pairs through the asyncio CDP engine; returns (successful, failed, skipped)
+        
+        Unattended runs go batch by batch on fresh tabs, with the scheduler's
+        checkpoint (stop file, cooldown, run window) between batches.
+        """
+        engine = CDPFormEngine(
+            CHROME_DEBUGGER_ADDRESS,
+            GOOGLE_FORM_URL,
+            MANUAL_FIELD_MAPPING,
+            tabs=CDP_TABS,
+            form_load_timeout=FORM_LOAD_TIMEOUT,
+            confirm_timeout=SUBMISSION_CONFIRM_TIMEOUT,
+            poll_interval=WAIT_POLL_INTERVAL,
+            label_threshold=LABEL_MATCH_THRESHOLD
+        )
+        in_flight = {}  # row index -> (row hash, row) until its result is in
+        retrying = set()
+        skipped = 0
+        rows = iter(rows)
+        lookahead = []  # a row peeked at between batches, not staged yet
+        taken = 0  # rows the current retry pass took off the retry queue
+        
+        def stage(index, row_data, row_hash):
+            if self.is_duplicate(index, row_hash):
+                return False
+            in_flight[index] = (row_hash, row_data)
+            self.journal_record(index, "pending", row_hash)
+            return True
+        
+        def next_row():
+            return lookahead.pop() if lookahead else next(rows, None)
+        
+        def pending_rows():
+            nonlocal skipped
+            for index, row_data in iter(next_row, None):
+                row_hash = self.row_hash(row_data)
+                if self.journal is not None and self.journal.is_submitted(index, row_hash):
+                    skipped += 1
+                    continue
+                if stage(index, row_data, row_hash):
+                    yield index, row_data
+        
+        def due_retries():
+            nonlocal taken
+            due = self.retry_queue.due()
+            taken += len(due)
+            for index, row_data, attempt, reason in due:
+                logging.info(f"🔁 Retrying entry {index + 1} (attempt {attempt}/{MAX_RETRIES}, last error: {reason})")
+                if stage(index, row_data, self.row_hash(row_data)):
+                    retrying.add(index)
+                    yield index, row_data
+        
+        def on_result(index, success):
+            row_hash, row_data = in_flight.pop(index)
+            self.journal_record(index, "submitted" if success else "failed", row_hash)
+            self.dedup_record(index, row_hash, success)
+            print(f"{'🎯' if success else '❌'} ENTRY {index + 1} {'COMPLETED' if success else 'FAILED'}")
+            if self.retry_queue is None:
+                return
+            if not success:
+                self.retry_queue.add(index, row_data, "cdp submission not confirmed")
+            elif index in retrying:
+                self.retry_queue.succeeded(index)
+        
+        def requeue_unreported(reason):
+            # Rows a tab took but never reported (the tab or its socket died) count as failed
+            for index in list(in_flight):
+                row_hash, row_data = in_flight.pop(index)
+                self.journal_record(index, "failed", row_hash)
+                self.dedup_record(index, row_hash, False)
+                if self.retry_queue is not None:
+                    self.retry_queue.add(index, row_data, reason)
+        
+        stopped = False
+        if self.scheduler is None:
+            results = asyncio.run(engine.run(pending_rows(), on_result))
+        else:
+            results = {}
+            remaining = pending_rows()
+            batch_number = 1
+            while True:
+                results.update(asyncio.run(engine.run(itertools.islice(remaining, BATCH_SIZE), on_result)))
+                upcoming = next_row()
+                if upcoming is None:
+                    break
+                lookahead.append(upcoming)
+                if not self.scheduler.checkpoint(batch_number, upcoming[0]):
+                    print("🛑 Automation stopped (stop file found)")
+                    stopped = True
+                    break
+                batch_number += 1
+        unreported = len(in_flight)
+        requeue_unreported("cdp tab stopped before reporting the entry")
+        successful = sum(1 for success in results.values() if success)
+        if stopped and self.retry_queue is not None:
+            self.retry_queue.abandon("run stopped")
+        
+        # Failed rows go round again on fresh tabs once their backoff expires
+        while self.retry_queue is not None and len(self.retry_queue):
+            wait = self.retry_queue.seconds_until_next()
+            if wait:
+                logging.info(f"⏳ {len(self.retry_queue)} entries waiting for retry - next in {wait:.0f}s")
+                time.sleep(wait)
+            taken = 0
+            try:
+                asyncio.run(engine.run(due_retries(), on_result))
+            except CDPError as e:
+                logging.error(f"❌ [cdp] Retry pass failed: {e}")
+            requeue_unreported("cdp tab stopped before reporting the entry")
+            if not taken:
+                # No tab got as far as taking a row - dead-letter the rest instead of reopening tabs forever
+                self.retry_queue.abandon("cdp tabs could not be started")
+        return successful, len(results) - successful + unreported, skipped
+    
+    def run_pool_submissions(self, start_index, end_index):
+        """Submit the row range with a WorkerPool, retrying failures on fresh pools; returns (results, workers, stopped)"""
+        in_flight = {}  # row index -> (row hash, row) until its result is in
+        retrying = set()
+        stopped = False
+        taken = 0  # rows the current retry pass took off the retry queue
+        
+        def new_pool():
+            return WorkerPool(
+                PARALLEL_WORKERS,
+                automation_factory=RobustAutomation,
+                debug_ports=WORKER_DEBUG_PORTS,
+                max_submissions_per_minute=MAX_SUBMISSIONS_PER_MINUTE
+            )
+        
+        def stage(index, row_data):
+            row_hash = self.row_hash(row_data)
+            if self.journal is not None and self.journal.is_submitted(index, row_hash):
+                return False
+            if self.is_duplicate(index, row_hash):
+                return False
+            in_flight[index] = (row_hash, row_data)
+            self.journal_record(index, "pending", row_hash)
+            return True
+        
+        def pending_rows():
+            # Pulled by the workers one row at a time, under the pool lock
+            nonlocal stopped
+            rows = self.dead_letter_rows() if REPLAY_DEAD_LETTERS else self.iter_rows(start_index, end_index)
+            handed_out = 0
+            for index, row_data in rows:
+                if self.scheduler is not None:
+                    if handed_out and handed_out % BATCH_SIZE == 0:
+                        ready = self.scheduler.checkpoint(handed_out // BATCH_SIZE, index)
+                    else:
+                        ready = self.scheduler.wait_for_window()
+                    if not ready:
+                        stopped = True
+                        return
+                if stage(index, row_data):
+                    handed_out += 1
+                    yield index, row_data
+        
+        def due_retries():
+            nonlocal taken
+            due = self.retry_queue.due()
+            taken += len(due)
+            for index, row_data, attempt, reason in due:
+                logging.info(f"🔁 Retrying entry {index + 1} (attempt {attempt}/{MAX_RETRIES}, last error: {reason})")
+                if stage(index, row_data):
+                    retrying.add(index)
+                    yield index, row_data
+        
+        def on_result(index, row_data, success):
+            row_hash, _ = in_flight.pop(index)
+            self.journal_record(index, "submitted" if success else "failed", row_hash)
+            self.dedup_record(index, row_hash, success)
+            if self.retry_queue is None:
+                return
+            if not success:
+                self.retry_queue.add(index, row_data, "parallel worker submission failed")
+            elif index in retrying:
+                self.retry_queue.succeeded(index)
+        
+        def requeue_unreported(results):
+            # Rows a worker took but never reported (its browser died mid-entry) count as failed
+            for index in list(in_flight):
+                row_hash, row_data = in_flight.pop(index)
+                self.journal_record(index, "failed", row_hash)
+                self.dedup_record(index, row_hash, False)
+                results[index] = False
+                if self.retry_queue is not None:
+                    self.retry_queue.add(index, row_data, "worker stopped before reporting the entry")
+        
+        pool = new_pool()
+        results = pool.run(pending_rows(), on_result)
+        requeue_unreported(results)
+        
+        # Failed rows go round again on fresh browsers once their backoff expires
+        while self.retry_queue is not None and len(self.retry_queue):
+            if stopped:
+                self.retry_queue.abandon("run stopped")
+                break
+            wait = self.retry_queue.seconds_until_next()
+            if wait:
+                logging.info(f"⏳ {len(self.retry_queue)} entries waiting for retry - next in {wait:.0f}s")
+                time.sleep(wait)
+            taken = 0
+            retried = new_pool().run(due_retries(), on_result)
+            requeue_unreported(retried)
+            results.update(retried)
+            if not taken:
+                # No worker got as far as taking a row - dead-letter the rest instead of relaunching browsers forever
+                self.retry_queue.abandon("parallel workers could not be started")
+        return dict(sorted(results.items())), pool.worker_count, stopped
+    
+    def run_parallel_automation(self):
+        """Process the configured row range with a pool of browsers"""
+        start_time = datetime.now()
+        
+        try:
+            logging.info(f"🚀 Starting Robust Automation with {PARALLEL_WORKERS} parallel workers")
+            
+            if SUBMISSION_ENGINE != "browser":
+                logging.error(f"❌ PARALLEL_WORKERS > 1 drives one browser per worker - set SUBMISSION_ENGINE = \"browser\" "
+                              f"(the {SUBMISSION_ENGINE} engine runs without the pool)")
+                return False
+            
+            if not self.load_rows():
+                return False
+            
+            end_index = min(END_INDEX if END_INDEX is not None else self.total_rows, self.total_rows)
+            start_index = START_INDEX
+            rejected_entries = 0
+            if PREFLIGHT_ENABLED:
+                rejected_entries = self.run_preflight_checks(start_index, end_index)
+            if JOURNAL_ENABLED:
+                self.journal = CheckpointJournal(JOURNAL_FILE_PATH)
+                if AUTO_RESUME:
+                    start_index = self.resume_index(start_index, end_index)
+            if DEDUP_ENABLED:
+                self.dedup_index = DedupIndex(DEDUP_INDEX_PATH, GOOGLE_FORM_URL)
+            if UNATTENDED_MODE:
+                self.scheduler = BatchScheduler(BATCH_COOLDOWN_SECONDS, RUN_WINDOW, STOP_FILE_PATH)
+            if RETRY_FAILED_ENTRIES and MAX_RETRIES > 0:
+                self.retry_queue = RetryQueue(MAX_RETRIES, RETRY_BASE_DELAY, DEAD_LETTER_PATH)
+            
+            results, worker_count, stopped = self.run_pool_submissions(start_index, end_index)
+            successful_submissions = sum(1 for ok in results.values() if ok)
+            failed_submissions = len(results) - successful_submissions
+            
+            total_time = datetime.now() - start_time
+            print("\n🎉 PARALLEL AUTOMATION COMPLETED!")
+            print(f"⏱️  Total time: {total_time}")
+            print("📊 Final Statistics:")
+            print(f"   👷 Workers: {worker_count}")
+            print(f"   ✅ Successful submissions: {successful_submissions}")
+            print(f"   ❌ Failed submissions: {failed_submissions}")
+            if results:
+                print(f"   📈 Success rate: {(successful_submissions/len(results)*100):.1f}%")
+            print(f"   🎯 Entries processed: {len(results)}/{max(end_index - start_index, 0)}")
+            self.report_duplicates()
+            if rejected_entries:
+                print(f"   🧹 Rejected by preflight: {rejected_entries} (see {PREFLIGHT_REPORT_PATH})")
+            if self.retry_queue is not None:
+                print(f"   🔁 Recovered by retry: {self.retry_queue.recovered}")
+                if self.retry_queue.dead_lettered:
+                    print(f"   ☠️  Dead-lettered: {self.retry_queue.dead_lettered} (see {DEAD_LETTER_PATH})")
+            if stopped:
+                print("🛑 Automation stopped (stop file found)")
+            
+            return True
+            
+        except Exception as e:
+            logging.error(f"❌ Error in parallel automation: {e}")
+            return False
+
 def main():
     print("🚀 FULLY AUTOMATED DMSReg Form Filler")
     print("=" * 50)
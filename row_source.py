@@ -0,0 +1,193 @@
+"""
+Streaming row sources for the spreadsheet data.
+
+Rows are read lazily from xlsx (openpyxl read-only mode), CSV or Parquet,
+starting at a given row index and restricted to the mapped columns, and are
+yielded as ``(index, {column: value})`` pairs. Nothing before the start row is
+turned into cell objects and nothing outside the mapped columns is kept.
+"""
+
+import csv
+import itertools
+import logging
+import os
+
+import openpyxl
+import pandas as pd
+
+
+def format_cell_value(value):
+    """Stringify a cell value the way it is typed into the form ("" for empty cells)"""
+    return str(value) if value is not None and pd.notna(value) else ""
+
+
+class RowSource:
+    """Base class: a lazily read table of rows addressed by 0-based index"""
+    
+    def __init__(self, path, columns=None):
+        self.path = path
+        self.wanted_columns = list(columns) if columns is not None else None
+        self.header = []
+        self.positions = []  # (column name, position in the raw row)
+    
+    def select_columns(self, header):
+        """Remember which raw positions hold the wanted columns"""
+        self.header = [str(name) if name is not None else "" for name in header]
+        wanted = self.header if self.wanted_columns is None else self.wanted_columns
+        self.positions = [(name, self.header.index(name)) for name in wanted if name in self.header]
+        missing = [name for name in wanted if name not in self.header]
+        if missing:
+            logging.warning(f"⚠️ Columns not found in {os.path.basename(self.path)}: {missing}")
+    
+    @property
+    def columns(self):
+        """Names of the columns that are yielded"""
+        return [name for name, _ in self.positions]
+    
+    def make_row(self, values):
+        """Turn a raw value tuple into a compact {column: value} dict"""
+        return {name: (values[position] if position < len(values) else None) for name, position in self.positions}
+    
+    def rows(self, start_index=0, end_index=None):
+        """Yield (index, row) for rows start_index..end_index-1"""
+        raise NotImplementedError
+    
+    def close(self):
+        """Release any open file handles"""
+        pass
+
+
+class XlsxRowSource(RowSource):
+    """Stream rows from the active sheet of an xlsx workbook"""
+    
+    def __init__(self, path, columns=None):
+        super().__init__(path, columns)
+        self.workbook = openpyxl.load_workbook(path, read_only=True, data_only=True)
+        self.sheet = self.workbook.active
+        self.select_columns(next(self.sheet.iter_rows(min_row=1, max_row=1, values_only=True)))
+        self.row_count = None
+    
+    def __len__(self):
+        if self.row_count is None:
+            # Formatted but empty rows at the end of the sheet are stored too;
+            # pandas drops them, so count up to the last row holding a value
+            self.row_count = 0
+            for count, values in enumerate(self.sheet.iter_rows(min_row=2, values_only=True), start=1):
+                if any(value is not None for value in values):
+                    self.row_count = count
+        return self.row_count
+    
+    def rows(self, start_index=0, end_index=None):
+        # Row 1 is the header, so data row i lives on sheet row i + 2
+        max_row = end_index + 1 if end_index is not None else None
+        sheet_rows = self.sheet.iter_rows(min_row=start_index + 2, max_row=max_row, values_only=True)
+        blank = []  # empty rows are held back until a later row shows they are not trailing
+        for index, values in enumerate(sheet_rows, start=start_index):
+            if not any(value is not None for value in values):
+                blank.append((index, values))
+                continue
+            for blank_index, blank_values in blank:
+                yield blank_index, self.make_row(blank_values)
+            blank = []
+            yield index, self.make_row(values)
+    
+    def close(self):
+        self.workbook.close()
+
+
+class CsvRowSource(RowSource):
+    """Stream rows from a CSV file"""
+    
+    def __init__(self, path, columns=None):
+        super().__init__(path, columns)
+        with open(path, "r", encoding="utf-8-sig", newline="") as csv_file:
+            self.select_columns(next(csv.reader(csv_file)))
+        self.row_count = None
+    
+    def __len__(self):
+        if self.row_count is None:
+            with open(self.path, "r", encoding="utf-8-sig", newline="") as csv_file:
+                self.row_count = max(sum(1 for _ in csv.reader(csv_file)) - 1, 0)
+        return self.row_count
+    
+    def rows(self, start_index=0, end_index=None):
+        with open(self.path, "r", encoding="utf-8-sig", newline="") as csv_file:
+            reader = csv.reader(csv_file)
+            next(reader)  # header
+            for index, values in enumerate(itertools.islice(reader, start_index, end_index), start=start_index):
+                yield index, self.make_row([value if value != "" else None for value in values])
+
+
+class ParquetRowSource(RowSource):
+    """Stream rows from a Parquet file, seeking by row group (requires pyarrow)"""
+    
+    def __init__(self, path, columns=None):
+        super().__init__(path, columns)
+        try:
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ImportError("Reading Parquet files requires pyarrow: pip install pyarrow")
+        self.parquet_file = pq.ParquetFile(path)
+        self.select_columns(self.parquet_file.schema_arrow.names)
+    
+    def __len__(self):
+        return self.parquet_file.metadata.num_rows
+    
+    def rows(self, start_index=0, end_index=None):
+        end_index = len(self) if end_index is None else min(end_index, len(self))
+        metadata = self.parquet_file.metadata
+        columns = self.columns
+        
+        # Skip whole row groups before start_index without reading them
+        first_row = 0
+        for group in range(metadata.num_row_groups):
+            group_rows = metadata.row_group(group).num_rows
+            if first_row + group_rows <= start_index:
+                first_row += group_rows
+                continue
+            if first_row >= end_index:
+                break
+            table = self.parquet_file.read_row_group(group, columns=columns)
+            values = table.to_pydict()
+            for offset in range(group_rows):
+                index = first_row + offset
+                if start_index <= index < end_index:
+                    yield index, {name: values[name][offset] for name in columns}
+            first_row += group_rows
+
+
+class FrameRowSource(RowSource):
+    """Row source over an in-memory DataFrame whose index holds the original row numbers"""
+    
+    def __init__(self, frame, path="<memory>"):
+        super().__init__(path, list(frame.columns))
+        self.positions = [(name, position) for position, name in enumerate(frame.columns)]
+        self.frame = frame
+    
+    def __len__(self):
+        return len(self.frame)
+    
+    def rows(self, start_index=0, end_index=None):
+        in_range = self.frame.index >= start_index
+        if end_index is not None:
+            in_range &= self.frame.index < end_index
+        subset = self.frame.loc[in_range]
+        columns = list(subset.columns)
+        for index, values in zip(subset.index, subset.itertuples(index=False, name=None)):
+            yield int(index), dict(zip(columns, values))
+
+
+ROW_SOURCES = {
+    ".xlsx": XlsxRowSource,
+    ".xlsm": XlsxRowSource,
+    ".csv": CsvRowSource,
+    ".parquet": ParquetRowSource,
+}
+
+
+def open_row_source(path, columns=None):
+    """Open the streaming row source matching the file extension"""
+    extension = os.path.splitext(path)[1].lower()
+    if extension not in ROW_SOURCES:
+        raise ValueError(f"Unsupported data file type '{extension}' (expected one of {sorted(ROW_SOURCES)})")
+    return ROW_SOURCES[extension](path, columns)
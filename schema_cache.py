@@ -0,0 +1,74 @@
+"""
+On-disk form schema cache keyed by form URL.
+
+The resolved schema of a form - field labels and their positions, input kinds,
+required flags, choice options and the mapping label -> form label - is saved
+to a JSON file after the first full discovery. Later runs validate it with a
+fingerprint (field count plus a hash of the heading texts) read in one
+``execute_script`` call, and while it holds every page of the form is indexed
+by position without scraping labels or options again.
+"""
+
+import hashlib
+import json
+import logging
+import os
+from datetime import datetime
+
+SCHEMA_FORMAT_VERSION = 1
+
+
+def form_key(form_url):
+    """Cache key for a form: its URL without the query string"""
+    return (form_url or "").split("?", 1)[0].rstrip("/")
+
+
+def schema_fingerprint(labels):
+    """{count, label_hash} of the heading texts of every field container, in page order"""
+    labels = [str(label or "") for label in labels]
+    digest = hashlib.sha256("\x1f".join(labels).encode("utf-8")).hexdigest()
+    return {"count": len(labels), "label_hash": digest[:16]}
+
+
+class FormSchemaCache:
+    """JSON file of {form key: schema} entries"""
+
+    def __init__(self, path):
+        self.path = path
+        self.entries = None
+
+    def load(self):
+        """Read the cache file once; a missing or unreadable file is an empty cache"""
+        if self.entries is not None:
+            return self.entries
+        self.entries = {}
+        if not os.path.exists(self.path):
+            return self.entries
+        try:
+            with open(self.path, "r", encoding="utf-8") as cache_file:
+                data = json.load(cache_file)
+            if data.get("version") == SCHEMA_FORMAT_VERSION:
+                self.entries = data.get("forms", {})
+        except (OSError, ValueError) as e:
+            logging.warning(f"⚠️ Ignoring unreadable form schema cache {self.path}: {e}")
+        return self.entries
+
+    def get(self, form_url):
+        """Cached schema for form_url, or None"""
+        return self.load().get(form_key(form_url))
+
+    def save(self, form_url, fingerprint, fields, label_map):
+        """Store the schema for form_url and rewrite the cache file; returns the stored entry"""
+        entry = {
+            "fingerprint": fingerprint,
+            "fields": fields,
+            "label_map": label_map,
+            "saved_at": datetime.now().isoformat(timespec="seconds"),
+        }
+        self.load()[form_key(form_url)] = entry
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as cache_file:
+            json.dump({"version": SCHEMA_FORMAT_VERSION, "forms": self.entries}, cache_file, ensure_ascii=False, indent=1)
+        os.replace(temp_path, self.path)
+        logging.info(f"📦 Saved schema of {len(fields)} fields to {self.path}")
+        return entry
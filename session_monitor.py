@@ -0,0 +1,133 @@
+"""
+Background health monitor for the browser session.
+
+Instead of a ``current_url`` round trip before every form scan, a daemon thread
+probes chromedriver's ``/status`` and Chrome's DevTools ``/json/version``
+endpoints on an interval. Neither probe goes through the WebDriver session, so
+the hot path is never blocked or interleaved with monitor traffic. The main
+loop brackets every entry with ``entry_started()``/``entry_finished()``; when
+an entry runs longer than ``hang_timeout`` the session is treated as hung and
+``abort`` is called to unblock the stuck command. Cooldowns and prompts between
+entries never count as a hang.
+"""
+
+import json
+import logging
+import threading
+import time
+import urllib.request
+
+
+class SessionMonitor:
+    """Probe chromedriver and Chrome off the hot path and flag dead or hung sessions"""
+
+    def __init__(self, debugger_address=None, driver_url=None, interval=5, probe_timeout=3,
+                 hang_timeout=120, abort=None, opener=urllib.request.urlopen, clock=time.monotonic):
+        self.debugger_address = debugger_address
+        self.driver_url = driver_url
+        self.interval = interval
+        self.probe_timeout = probe_timeout
+        self.hang_timeout = hang_timeout
+        self.abort = abort
+        self.opener = opener
+        self.clock = clock
+        self.healthy = True
+        self.reason = None
+        self.entry_start = None  # set while an entry is being filled
+        self.stop_event = threading.Event()
+        self.thread = None
+        self.lock = threading.Lock()
+
+    def fetch_json(self, url):
+        """GET url and decode the JSON body"""
+        with self.opener(url, timeout=self.probe_timeout) as response:
+            return json.loads(response.read().decode("utf-8") or "null")
+
+    def chrome_reachable(self):
+        """True when Chrome answers on its debug port"""
+        if not self.debugger_address:
+            return True
+        try:
+            return bool(self.fetch_json(f"http://{self.debugger_address}/json/version"))
+        except Exception:
+            return False
+
+    def probe(self):
+        """Reason the session is unusable, or None when chromedriver and Chrome both answer"""
+        if self.driver_url:
+            try:
+                status = self.fetch_json(f"{self.driver_url.rstrip('/')}/status")
+                if not (status or {}).get("value", {}).get("ready", True):
+                    return "chromedriver not ready"
+            except Exception as e:
+                return f"chromedriver not responding ({e})"
+        if not self.chrome_reachable():
+            return f"Chrome not reachable on {self.debugger_address}"
+        return None
+
+    def mark(self, reason):
+        """Record the outcome of a check"""
+        with self.lock:
+            was_healthy = self.healthy
+            self.healthy = reason is None
+            self.reason = reason
+        if was_healthy and reason:
+            logging.error(f"🩺 Browser session unhealthy: {reason}")
+
+    def check_now(self):
+        """Probe synchronously (e.g. right after a failed entry); returns the health"""
+        self.mark(self.probe())
+        return self.healthy
+
+    def entry_started(self):
+        """The main loop started filling an entry"""
+        self.entry_start = self.clock()
+
+    def entry_finished(self):
+        """The entry finished (successfully or not)"""
+        self.entry_start = None
+
+    def check_hang(self):
+        """Flag the session as hung when the current entry runs longer than hang_timeout"""
+        entry_start = self.entry_start
+        if not self.hang_timeout or not self.healthy or entry_start is None:
+            return False
+        stalled = self.clock() - entry_start
+        if stalled < self.hang_timeout:
+            return False
+        self.mark(f"entry stuck for {stalled:.0f}s")
+        if self.abort is not None:
+            try:
+                self.abort()
+            except Exception as e:
+                logging.warning(f"⚠️ Could not abort the hung session: {e}")
+        return True
+
+    def run(self):
+        """Monitor loop (runs on the daemon thread)"""
+        while not self.stop_event.wait(self.interval):
+            if self.healthy:
+                self.mark(self.probe())
+            self.check_hang()
+
+    def start(self):
+        """Start the monitor thread"""
+        self.stop_event.clear()
+        self.thread = threading.Thread(target=self.run, name="session-monitor", daemon=True)
+        self.thread.start()
+        logging.info(f"🩺 Session health monitor started (every {self.interval}s)")
+        return self
+
+    def reset(self, driver_url=None):
+        """Start over after a reconnect"""
+        if driver_url:
+            self.driver_url = driver_url
+        self.entry_start = None
+        self.mark(None)
+
+    def stop(self):
+        """Stop the monitor thread"""
+        self.stop_event.set()
+        if self.thread is not None:
+            self.thread.join(timeout=self.interval + self.probe_timeout)
+            self.thread = None
@@ -67,6 +67,9 @@ setup(
             "mypy>=1.7.1",
             "pre-commit>=3.5.0",
         ],
+        "cdp": [
+            "websockets>=12.0",
+        ],
         "docs": [
             "sphinx>=7.2.6",
             "sphinx-rtd-theme>=1.3.0",
@@ -0,0 +1,69 @@
+"""
+Pre-loaded form tabs inside one browser session.
+
+The pool keeps several tabs of the form open in the attached Chrome. After a
+submission is confirmed the spent tab is sent back to the form with a
+non-blocking ``location.replace`` and the driver switches to the next tab,
+whose form has been loading in the background in the meantime. Page load
+latency is hidden without starting more browser processes.
+"""
+
+import logging
+from collections import deque
+
+OPEN_TAB_SCRIPT = "window.open(arguments[0], '_blank');"
+
+# Returns immediately - the navigation continues while the driver works on another tab
+RECYCLE_TAB_SCRIPT = "var url = arguments[0]; setTimeout(function() { window.location.replace(url); }, 0);"
+
+
+class FormTabPool:
+    """Rotate the driver through tab_count tabs of form_url"""
+
+    def __init__(self, driver, form_url, tab_count):
+        self.driver = driver
+        self.form_url = form_url
+        self.tab_count = max(1, tab_count)
+        self.current = None
+        self.ready = deque()  # handles of tabs loading or showing a fresh form
+        self.opened = []  # tabs opened by the pool (closed again by close())
+
+    def open(self):
+        """Open the extra tabs next to the current one; returns the number of tabs in rotation"""
+        self.current = self.driver.current_window_handle
+        known = set(self.driver.window_handles)
+        for _ in range(self.tab_count - 1):
+            self.driver.execute_script(OPEN_TAB_SCRIPT, self.form_url)
+        self.opened = [handle for handle in self.driver.window_handles if handle not in known]
+        self.ready.extend(self.opened)
+        # window.open may move focus in some Chrome builds - keep working on the original tab
+        self.driver.switch_to.window(self.current)
+        logging.info(f"🗂️ Pre-loading the form in {len(self.opened)} extra tab(s)")
+        return len(self.opened) + 1
+
+    def rotate(self):
+        """Recycle the current tab in the background and switch to the next pre-loaded one"""
+        if not self.ready:
+            return self.current
+        self.driver.execute_script(RECYCLE_TAB_SCRIPT, self.form_url)
+        self.ready.append(self.current)
+        self.current = self.ready.popleft()
+        self.driver.switch_to.window(self.current)
+        return self.current
+
+    def close(self):
+        """Close the tabs opened by the pool and return to the original tab"""
+        handles = set(self.driver.window_handles)
+        original = next((handle for handle in [self.current, *self.ready] if handle not in self.opened), None)
+        for handle in self.opened:
+            if handle in handles:
+                try:
+                    self.driver.switch_to.window(handle)
+                    self.driver.close()
+                except Exception as e:
+                    logging.warning(f"⚠️ Could not close tab {handle}: {e}")
+        if original is not None:
+            self.driver.switch_to.window(original)
+        self.current = original
+        self.ready.clear()
+        self.opened = []
@@ -0,0 +1,54 @@
+"""
+Shared fixtures for the tests that drive a whole run_automation() call
+"""
+
+import pytest
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import robust_automation
+
+
+class FakeClock:
+    """Manually advanced monotonic clock"""
+    
+    def __init__(self):
+        self.now = 0.0
+    
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    """A FakeClock starting at 0.0, for components that take a clock= callable"""
+    return FakeClock()
+
+
+@pytest.fixture
+def run_settings(monkeypatch, tmp_path):
+    """Point robust_automation at an in-memory sheet with every run file under tmp_path
+
+    Call it as run_settings(data, NAME=value, ...) to override further module
+    globals (config constants or classes such as CDPFormEngine) for the test.
+    """
+    def apply(data, **overrides):
+        settings = {
+            'START_INDEX': 0,
+            'END_INDEX': None,
+            'ROW_SOURCE_MODE': 'pandas',
+            'PREFLIGHT_ENABLED': False,
+            'JOURNAL_FILE_PATH': str(tmp_path / "journal.jsonl"),
+            'METRICS_FILE_PATH': str(tmp_path / "metrics.jsonl"),
+            'DEDUP_INDEX_PATH': str(tmp_path / "submitted.jsonl"),
+            'DEAD_LETTER_PATH': str(tmp_path / "dead.jsonl"),
+            'STOP_FILE_PATH': str(tmp_path / "STOP"),
+        }
+        settings.update(overrides)
+        for name, value in settings.items():
+            monkeypatch.setattr(robust_automation, name, value)
+        monkeypatch.setattr(robust_automation.pd, "read_excel", lambda *args, **kwargs: data)
+    return apply
@@ -0,0 +1,209 @@
+"""
+Tests for unattended batch scheduling
+"""
+
+import pandas as pd
+from datetime import datetime, timedelta
+from unittest.mock import Mock, patch
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from batch_scheduler import BatchScheduler
+from robust_automation import RobustAutomation
+
+
+class FakeClock:
+    """datetime.now replacement advanced by the fake sleep"""
+    
+    def __init__(self, start):
+        self.moment = start
+        self.slept = []
+    
+    def now(self):
+        return self.moment
+    
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+        self.moment = self.moment + timedelta(seconds=seconds)
+
+
+class TestBatchScheduler:
+    """Test cases for BatchScheduler"""
+    
+    def test_window_wrapping_midnight(self):
+        """An overnight window includes late evening and early morning only"""
+        scheduler = BatchScheduler(run_window=("22:00", "06:00"))
+        
+        assert scheduler.in_window(datetime(2024, 1, 1, 23, 30))
+        assert scheduler.in_window(datetime(2024, 1, 2, 5, 59))
+        assert not scheduler.in_window(datetime(2024, 1, 2, 12, 0))
+        assert scheduler.seconds_until_window(datetime(2024, 1, 2, 21, 0)) == 3600
+    
+    def test_no_window_always_open(self):
+        """Without a window the scheduler never waits"""
+        scheduler = BatchScheduler()
+        assert scheduler.in_window()
+        assert scheduler.seconds_until_window() == 0
+    
+    def test_wait_for_window_sleeps_until_open(self):
+        """Outside the window the scheduler sleeps until it opens"""
+        clock = FakeClock(datetime(2024, 1, 1, 21, 58))
+        scheduler = BatchScheduler(run_window=("22:00", "06:00"), sleep=clock.sleep, now=clock.now)
+        
+        assert scheduler.wait_for_window() is True
+        assert clock.moment == datetime(2024, 1, 1, 22, 0)
+    
+    def test_checkpoint_cooldown(self):
+        """A checkpoint sleeps for the cooldown and continues"""
+        clock = FakeClock(datetime(2024, 1, 1, 12, 0))
+        scheduler = BatchScheduler(cooldown_seconds=75, sleep=clock.sleep, now=clock.now)
+        
+        assert scheduler.checkpoint(1, 59) is True
+        assert sum(clock.slept) == 75
+    
+    def test_stop_file_ends_run(self, tmp_path):
+        """The stop file ends the run at the next checkpoint"""
+        stop_file = tmp_path / "STOP"
+        scheduler = BatchScheduler(cooldown_seconds=10, stop_file=str(stop_file), sleep=Mock())
+        assert scheduler.checkpoint(1, 59) is True
+        
+        stop_file.write_text("")
+        assert scheduler.checkpoint(2, 118) is False
+
+
+class TestUnattendedRun:
+    """run_automation never prompts in unattended mode"""
+    
+    def test_batches_checkpointed_without_input(self, run_settings):
+        """Every batch boundary is a checkpoint and input() is never called"""
+        automation = RobustAutomation()
+        automation.pacer.sleep = Mock()  # no real pauses between entries
+        data = pd.DataFrame({"Name": [f"Person {i}" for i in range(7)]})
+        scheduler = Mock()
+        scheduler.wait_for_window.return_value = True
+        scheduler.checkpoint.return_value = True
+        
+        run_settings(data, UNATTENDED_MODE=True, BatchScheduler=Mock(return_value=scheduler), BATCH_SIZE=2)
+        
+        with patch('builtins.input', side_effect=AssertionError("prompted")), \
+             patch.object(automation, 'prepare_browser', return_value=True), \
+             patch.object(automation, 'ensure_form_loaded', return_value=True) as ensure, \
+             patch.object(automation, 'fill_form', return_value=True) as fill:
+            assert automation.run_automation() is True
+        
+        assert fill.call_count == 7
+        assert [call.args[1] for call in scheduler.checkpoint.call_args_list] == [2, 4, 6]
+        assert all(call.kwargs["interactive"] is False for call in ensure.call_args_list)
+    
+    def test_stop_at_checkpoint(self, run_settings):
+        """A checkpoint returning False ends the run after the batch"""
+        automation = RobustAutomation()
+        automation.pacer.sleep = Mock()  # no real pauses between entries
+        data = pd.DataFrame({"Name": [f"Person {i}" for i in range(7)]})
+        scheduler = Mock()
+        scheduler.wait_for_window.return_value = True
+        scheduler.checkpoint.return_value = False
+        
+        run_settings(data, UNATTENDED_MODE=True, BatchScheduler=Mock(return_value=scheduler), BATCH_SIZE=3)
+        
+        with patch.object(automation, 'prepare_browser', return_value=True), \
+             patch.object(automation, 'ensure_form_loaded', return_value=True), \
+             patch.object(automation, 'fill_form', return_value=True) as fill:
+            assert automation.run_automation() is True
+        
+        assert fill.call_count == 3
+    
+    def test_skipped_rows_do_not_shift_batches(self, tmp_path, run_settings):
+        """A duplicate row on a batch boundary does not swallow that batch's checkpoint"""
+        automation = RobustAutomation()
+        automation.pacer.sleep = Mock()  # no real pauses between entries
+        names = ["P0", "P1", "P0", "P2", "P3", "P4", "P5", "P6"]
+        data = pd.DataFrame({"Name": names})
+        scheduler = Mock()
+        scheduler.wait_for_window.return_value = True
+        scheduler.checkpoint.return_value = True
+        
+        run_settings(
+            data,
+            UNATTENDED_MODE=True,
+            BatchScheduler=Mock(return_value=scheduler),
+            BATCH_SIZE=3,
+            DEDUP_ENABLED=True,
+            DEDUP_REPORT_PATH=str(tmp_path / "duplicates.csv"),
+        )
+        
+        with patch.object(automation, 'prepare_browser', return_value=True), \
+             patch.object(automation, 'ensure_form_loaded', return_value=True), \
+             patch.object(automation, 'fill_form', return_value=True) as fill:
+            assert automation.run_automation() is True
+        
+        assert fill.call_count == 7
+        assert [call.args[1] for call in scheduler.checkpoint.call_args_list] == [4, 7]
+    
+    def run_cdp(self, run_settings, scheduler):
+        """Run five rows through a fake CDP engine in batches of two; returns the rows of each engine run"""
+        automation = RobustAutomation()
+        data = pd.DataFrame({"Name": [f"Person {i}" for i in range(5)]})
+        batches = []
+        
+        class FakeEngine:
+            def __init__(self, *args, **kwargs):
+                pass
+            
+            async def run(self, rows, on_result=None):
+                batch = [index for index, _ in rows]
+                batches.append(batch)
+                for index in batch:
+                    on_result(index, True)
+                return {index: True for index in batch}
+        
+        run_settings(
+            data,
+            UNATTENDED_MODE=True,
+            SUBMISSION_ENGINE='cdp',
+            CDPFormEngine=FakeEngine,
+            BatchScheduler=Mock(return_value=scheduler),
+            BATCH_SIZE=2,
+        )
+        
+        assert automation.run_automation() is True
+        return batches
+    
+    def test_cdp_batches_checkpointed(self, run_settings):
+        """The CDP engine runs batch by batch with a scheduler checkpoint in between"""
+        scheduler = Mock()
+        scheduler.wait_for_window.return_value = True
+        scheduler.checkpoint.return_value = True
+        
+        batches = self.run_cdp(run_settings, scheduler)
+        
+        assert batches == [[0, 1], [2, 3], [4]]
+        assert [call.args for call in scheduler.checkpoint.call_args_list] == [(1, 2), (2, 4)]
+    
+    def test_cdp_stop_at_checkpoint(self, tmp_path, run_settings):
+        """A stop at a CDP batch boundary leaves the remaining rows untouched"""
+        scheduler = Mock()
+        scheduler.wait_for_window.return_value = True
+        scheduler.checkpoint.return_value = False
+        
+        batches = self.run_cdp(run_settings, scheduler)
+        
+        assert batches == [[0, 1]]
+        assert "\"row\": 2" not in (tmp_path / "journal.jsonl").read_text()
+    
+    @patch('robust_automation.time.sleep')
+    def test_recover_form_retries(self, mock_sleep):
+        """Non-interactive reloads retry with backoff instead of prompting"""
+        automation = RobustAutomation()
+        automation.pacer.sleep = Mock()  # no real pauses between entries
+        automation.driver = Mock()
+        automation.wait_for_form_ready = Mock(return_value=True)
+        automation.build_form_index = Mock(side_effect=[{}, {}, {"Name": {}}])
+        
+        with patch('robust_automation.FORM_RECOVERY_ATTEMPTS', 3):
+            assert automation.recover_form(4) is True
+        
+        assert [call.args[0] for call in mock_sleep.call_args_list] == [2, 4, 8]
@@ -0,0 +1,120 @@
+"""
+Tests for the benchmark harness and the local mock Google Form
+"""
+
+import json
+import pytest
+import urllib3
+from unittest.mock import patch
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.mock_form import FORM_LABELS, MockFormServer, render_form_page, entry_id
+from benchmarks.run_benchmark import synthetic_rows, compare_to_baseline, save_baseline, load_baseline, main, run_browser_benchmark
+import robust_automation
+from form_waits import CONFIRMATION_PHRASES
+from http_engine import parse_form_fields
+
+
+@pytest.fixture
+def mock_form():
+    """Serve the mock form on a random local port"""
+    with MockFormServer() as server:
+        yield server
+
+
+def make_result(entries_per_second=10.0, commands_per_entry=40.0, total_p95=0.5):
+    """Benchmark result with the fields the baseline uses"""
+    return {
+        "engine": "browser", "strategy": "js_batch", "tabs": 1,
+        "entries_per_second": entries_per_second,
+        "commands_per_entry": commands_per_entry,
+        "phases": {"total": {"p50": 0.4, "p95": total_p95, "p99": 0.6}},
+    }
+
+
+class TestMockForm:
+    """Test cases for the mock Google Form"""
+    
+    def test_form_page_has_dmsreg_fields(self):
+        """17 listitem fields, a Submit button and parseable FB_PUBLIC_LOAD_DATA_"""
+        page = render_form_page()
+        
+        assert page.count('role="listitem"') == 17
+        assert 'data-value="Submit"' in page
+        fields = parse_form_fields(page)
+        assert [field["label"] for field in fields] == FORM_LABELS
+        assert fields[0]["entry_id"] == entry_id(0)
+    
+    def test_submission_confirmed_and_recorded(self, mock_form):
+        """A POST to formResponse is recorded and answered with the confirmation page"""
+        http = urllib3.PoolManager()
+        response_url = mock_form.form_url.replace("viewform", "formResponse")
+        response = http.request("POST", response_url, fields={f"entry.{entry_id(1)}": "Diya"}, encode_multipart=False)
+        
+        body = response.data.decode("utf-8").lower()
+        assert response.status == 200
+        assert any(phrase in body for phrase in CONFIRMATION_PHRASES)
+        assert "submit another response" in body
+        assert mock_form.submissions == [{f"entry.{entry_id(1)}": "Diya"}]
+
+
+class TestBenchmarkRunner:
+    """Test cases for the benchmark runner"""
+    
+    def test_synthetic_rows_are_deterministic(self):
+        """Rows use the Excel column names and repeat for the same seed"""
+        rows = synthetic_rows(5)
+        
+        assert len(rows) == 5
+        assert " Registration Number" in rows.columns
+        assert "Age " in rows.columns
+        assert rows.equals(synthetic_rows(5))
+    
+    def test_compare_to_baseline(self):
+        """Throughput drops and command growth beyond the tolerance are regressions"""
+        baseline = {"browser:js_batch:1": {"entries_per_second": 10.0, "commands_per_entry": 40.0, "total_p95": 0.5}}
+        
+        assert compare_to_baseline(make_result(9.0, 44.0, 0.55), baseline) == []
+        regressions = compare_to_baseline(make_result(7.0, 60.0, 0.9), baseline)
+        assert len(regressions) == 3
+        assert compare_to_baseline(make_result(1.0), {}) == []
+    
+    def test_baseline_round_trip(self, tmp_path):
+        """Saved baselines are keyed by engine, strategy and tab count"""
+        path = str(tmp_path / "baseline.json")
+        save_baseline(make_result(), path)
+        
+        assert load_baseline(path) == {"browser:js_batch:1": {"entries_per_second": 10.0, "commands_per_entry": 40.0, "total_p95": 0.5}}
+    
+    def test_http_benchmark_end_to_end(self, tmp_path, capsys):
+        """The HTTP engine benchmark submits every row to the mock form"""
+        baseline = str(tmp_path / "baseline.json")
+        result_path = tmp_path / "result.json"
+        
+        assert main(["--engine", "http", "--rows", "5", "--baseline", baseline, "--update-baseline"]) == 0
+        assert main(["--engine", "http", "--rows", "5", "--baseline", baseline, "--tolerance", "100", "--json", str(result_path)]) == 0
+        
+        result = json.loads(result_path.read_text())
+        assert result["received"] == 5
+        assert result["successful"] == 5
+        assert "http:http:1" in load_baseline(baseline)
+    
+    def test_committed_baseline_covers_http_engine(self):
+        """The repository ships a baseline, so the offline HTTP gate can fail"""
+        reference = load_baseline()["http:http:1"]
+        assert reference["entries_per_second"] > 0
+        assert compare_to_baseline({"engine": "http", "strategy": "http", "tabs": 1, "entries_per_second": 0.0,
+                                    "commands_per_entry": 0.0, "phases": {}}, load_baseline())
+    
+    def test_browser_benchmark_restores_form_url(self):
+        """The mock form URL is only in effect while the browser benchmark runs"""
+        configured_url = robust_automation.GOOGLE_FORM_URL
+        
+        with patch('robust_automation.RobustAutomation.setup_driver', return_value=False), pytest.raises(RuntimeError):
+            run_browser_benchmark("http://127.0.0.1:1/viewform", synthetic_rows(1), "typed")
+        
+        assert robust_automation.GOOGLE_FORM_URL == configured_url
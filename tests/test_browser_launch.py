@@ -0,0 +1,173 @@
+"""
+Tests for the managed Chrome launch (trimmed profile, blocked resources, cached chromedriver)
+"""
+
+import json
+from unittest.mock import Mock, patch
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from selenium.common.exceptions import SessionNotCreatedException
+
+from browser_launch import build_launch_options, block_resources, resolve_driver_path, PROFILE_PREFERENCES
+from robust_automation import RobustAutomation
+
+
+class TestLaunchOptions:
+    """Test cases for build_launch_options and block_resources"""
+
+    def test_headless_options(self):
+        """Headless launch gets the new headless mode, window size, tuned prefs and eager loading"""
+        options = build_launch_options(headless=True, window_size="1280,800", user_data_dir="/tmp/profile")
+
+        assert "--headless=new" in options.arguments
+        assert "--window-size=1280,800" in options.arguments
+        assert "--user-data-dir=/tmp/profile" in options.arguments
+        assert "--blink-settings=imagesEnabled=false" in options.arguments
+        assert options.experimental_options["prefs"] == PROFILE_PREFERENCES
+        assert options.page_load_strategy == "eager"
+
+    def test_headed_options(self):
+        """A visible launch keeps the trimmed flags without --headless"""
+        options = build_launch_options(headless=False)
+
+        assert "--headless=new" not in options.arguments
+        assert "--disable-extensions" in options.arguments
+
+    def test_block_resources(self):
+        """Patterns are sent through Network.setBlockedURLs"""
+        driver = Mock()
+
+        assert block_resources(driver, ["*.png", "*.woff2"]) is True
+        driver.execute_cdp_cmd.assert_any_call("Network.enable", {})
+        driver.execute_cdp_cmd.assert_any_call("Network.setBlockedURLs", {"urls": ["*.png", "*.woff2"]})
+
+    def test_block_resources_failure_is_not_fatal(self):
+        """A browser without CDP support only logs a warning"""
+        driver = Mock()
+        driver.execute_cdp_cmd.side_effect = Exception("not supported")
+
+        assert block_resources(driver, ["*.png"]) is False
+        assert block_resources(driver, []) is False
+
+
+class TestResolveDriverPath:
+    """Test cases for the cached chromedriver lookup"""
+
+    def test_explicit_path_wins(self, tmp_path):
+        """CHROMEDRIVER_PATH skips the manager and the cache"""
+        with patch('browser_launch.ChromeDriverManager') as manager:
+            assert resolve_driver_path("/opt/chromedriver", str(tmp_path / "cache.json")) == "/opt/chromedriver"
+        manager.assert_not_called()
+
+    def test_cache_miss_installs_and_writes_cache(self, tmp_path):
+        """The first run asks the manager and remembers its answer"""
+        cache = tmp_path / "cache.json"
+        driver_binary = tmp_path / "chromedriver"
+        driver_binary.write_text("")
+
+        with patch('browser_launch.ChromeDriverManager') as manager:
+            manager.return_value.install.return_value = str(driver_binary)
+            assert resolve_driver_path(None, str(cache)) == str(driver_binary)
+
+        assert json.loads(cache.read_text())["path"] == str(driver_binary)
+
+    def test_cache_hit_skips_manager(self, tmp_path):
+        """Later runs reuse the cached path without a lookup"""
+        cache = tmp_path / "cache.json"
+        driver_binary = tmp_path / "chromedriver"
+        driver_binary.write_text("")
+        cache.write_text(json.dumps({"path": str(driver_binary)}))
+
+        with patch('browser_launch.ChromeDriverManager') as manager:
+            assert resolve_driver_path(None, str(cache)) == str(driver_binary)
+        manager.assert_not_called()
+
+    def test_stale_cache_is_resolved_again(self, tmp_path):
+        """A cached binary that was deleted is looked up again"""
+        cache = tmp_path / "cache.json"
+        cache.write_text(json.dumps({"path": str(tmp_path / "gone")}))
+
+        with patch('browser_launch.ChromeDriverManager') as manager:
+            manager.return_value.install.return_value = "/new/chromedriver"
+            assert resolve_driver_path(None, str(cache)) == "/new/chromedriver"
+        manager.return_value.install.assert_called_once()
+
+    def test_refresh_skips_cache(self, tmp_path):
+        """refresh=True installs again and replaces the cached path"""
+        cache = tmp_path / "cache.json"
+        driver_binary = tmp_path / "chromedriver"
+        driver_binary.write_text("")
+        cache.write_text(json.dumps({"path": str(driver_binary)}))
+
+        with patch('browser_launch.ChromeDriverManager') as manager:
+            manager.return_value.install.return_value = "/new/chromedriver"
+            assert resolve_driver_path(None, str(cache), refresh=True) == "/new/chromedriver"
+
+        assert json.loads(cache.read_text())["path"] == "/new/chromedriver"
+
+
+class TestSetupDriverLaunch:
+    """Test cases for setup_driver/connect_browser in launch mode"""
+
+    def setup_method(self):
+        """Create an automation instance"""
+        self.automation = RobustAutomation()
+
+    @patch('robust_automation.block_resources')
+    @patch('robust_automation.resolve_driver_path', return_value="/opt/chromedriver")
+    @patch('robust_automation.Service')
+    @patch('robust_automation.webdriver.Chrome')
+    def test_launch_mode_blocks_resources(self, chrome, service, resolve, block):
+        """A launched browser gets the trimmed options and the resource block list"""
+        assert self.automation.setup_driver(headless=True) is True
+
+        options = chrome.call_args.kwargs["options"]
+        assert "--headless=new" in options.arguments
+        service.assert_called_once_with("/opt/chromedriver")
+        block.assert_called_once()
+
+    @patch('robust_automation.block_resources')
+    @patch('robust_automation.resolve_driver_path', return_value="/opt/chromedriver")
+    @patch('robust_automation.Service')
+    @patch('robust_automation.webdriver.Chrome')
+    def test_attach_mode_uses_debugger_address(self, chrome, service, resolve, block):
+        """Attaching keeps the debuggerAddress option and leaves the user's browser alone"""
+        assert self.automation.setup_driver(debugger_address="127.0.0.1:9333") is True
+
+        options = chrome.call_args.kwargs["options"]
+        assert options.experimental_options["debuggerAddress"] == "127.0.0.1:9333"
+        block.assert_not_called()
+
+    @patch('robust_automation.CHROMEDRIVER_PATH', None)
+    @patch('robust_automation.resolve_driver_path', side_effect=["/old/chromedriver", "/new/chromedriver"])
+    @patch('robust_automation.Service')
+    @patch('robust_automation.webdriver.Chrome')
+    def test_outdated_cached_driver_is_resolved_again(self, chrome, service, resolve):
+        """A session-not-created error with the cached chromedriver drops the cache and retries once"""
+        chrome.side_effect = [SessionNotCreatedException("This version of ChromeDriver only supports Chrome version 120"), Mock()]
+
+        assert self.automation.setup_driver() is True
+
+        assert resolve.call_args_list[1].kwargs == {"refresh": True}
+        assert service.call_args_list[1].args == ("/new/chromedriver",)
+
+    @patch('robust_automation.CHROMEDRIVER_PATH', "/opt/chromedriver")
+    @patch('robust_automation.Service')
+    @patch('robust_automation.webdriver.Chrome', side_effect=SessionNotCreatedException("version mismatch"))
+    def test_explicit_driver_is_not_replaced(self, chrome, service):
+        """An explicit CHROMEDRIVER_PATH is never swapped for a downloaded one"""
+        with patch('robust_automation.resolve_driver_path', return_value="/opt/chromedriver") as resolve:
+            assert self.automation.setup_driver() is False
+        resolve.assert_called_once_with()
+
+    @patch('robust_automation.HEADLESS_MODE', True)
+    def test_headless_mode_launches(self):
+        """HEADLESS_MODE implies launching our own browser"""
+        self.automation.setup_driver = Mock(return_value=True)
+
+        assert self.automation.connect_browser() is True
+        self.automation.setup_driver.assert_called_once_with(headless=True, launch=True)
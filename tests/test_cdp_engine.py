@@ -0,0 +1,212 @@
+"""
+Tests for the asyncio CDP engine, using an in-memory fake of a Chrome tab
+"""
+
+import asyncio
+import json
+import pytest
+from unittest.mock import patch
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cdp_engine import CDPError, CDPFormEngine, CDPSession
+
+
+class FakeTabSocket:
+    """Websocket stand-in that answers CDP commands like a Google Form tab"""
+    
+    def __init__(self, reorder=False, labels=("Name", "Age"), choices=()):
+        self.labels = list(labels)
+        self.choices = list(choices)
+        self.incoming = asyncio.Queue()
+        self.sent = []
+        self.reorder = reorder
+        self.held = []
+        self.filled = []
+    
+    async def send(self, message):
+        command = json.loads(message)
+        self.sent.append(command)
+        reply = {"id": command["id"], "result": self.answer(command)}
+        if command["method"] == "Broken.method":
+            reply = {"id": command["id"], "error": {"message": "method not found"}}
+        if self.reorder:
+            # Hold replies and release them newest first
+            self.held.append(reply)
+            if len(self.held) == 3:
+                for held in reversed(self.held):
+                    await self.incoming.put(json.dumps(held))
+                self.held = []
+        else:
+            await self.incoming.put(json.dumps(reply))
+        if command["method"] == "Page.navigate":
+            await self.incoming.put(json.dumps({"method": "Page.loadEventFired", "params": {}}))
+    
+    def answer(self, command):
+        if command["method"] != "Runtime.evaluate":
+            return {"echo": command["params"].get("value")}
+        expression = command["params"]["expression"]
+        if "const values = arguments[0]" in expression:
+            values, label_map = json.loads("[" + expression[expression.rindex("})(") + 3:-1] + "]")
+            self.filled.append({label_map.get(label, label): value for label, value in values.items()})
+            value = {"filled": len(values), "missing": []}
+        elif "field.options.map" in expression:
+            value = self.choices
+        elif "(field) => field.label" in expression:
+            value = self.labels
+        elif "submit.click()" in expression:
+            value = True
+        elif "formResponse" in expression:
+            value = True
+        else:
+            value = 17
+        return {"result": {"type": "object", "value": value}}
+    
+    def __aiter__(self):
+        return self
+    
+    async def __anext__(self):
+        message = await self.incoming.get()
+        if message is None:
+            raise StopAsyncIteration
+        return message
+    
+    async def close(self):
+        await self.incoming.put(None)
+
+
+class TestCDPSession:
+    """Test cases for command pipelining"""
+    
+    def test_pipelined_replies_matched_by_id(self):
+        """Replies arriving out of order resolve the right futures"""
+        async def scenario():
+            session = CDPSession(FakeTabSocket(reorder=True))
+            futures = [session.send_nowait("Echo.value", {"value": n}) for n in range(3)]
+            results = await asyncio.gather(*futures)
+            await session.close()
+            return results
+        
+        assert asyncio.run(scenario()) == [{"echo": 0}, {"echo": 1}, {"echo": 2}]
+    
+    def test_error_reply_raises(self):
+        """CDP errors surface as CDPError"""
+        async def scenario():
+            session = CDPSession(FakeTabSocket())
+            try:
+                await session.send("Broken.method")
+            finally:
+                await session.close()
+        
+        with pytest.raises(CDPError):
+            asyncio.run(scenario())
+
+
+class TestCDPFormEngine:
+    """Test cases for multi-tab submission"""
+    
+    def setup_method(self):
+        """Engine with fake tabs instead of Chrome"""
+        self.sockets = []
+        
+        async def connect(websocket_url):
+            socket = FakeTabSocket()
+            self.sockets.append(socket)
+            return socket
+        
+        self.engine = CDPFormEngine(
+            "127.0.0.1:9222",
+            "https://docs.google.com/forms/d/e/X/viewform",
+            {"Name": "Name", "Age": "Age "},
+            tabs=2,
+            poll_interval=0.001,
+            connect=connect
+        )
+        self.engine.debug_endpoint = lambda path, method="GET": {"id": "tab", "webSocketDebuggerUrl": "ws://fake"}
+    
+    def test_rows_submitted_once_across_tabs(self):
+        """Every row is submitted exactly once and reported"""
+        rows = [(index, {"Name": f"Person {index}", "Age ": str(20 + index)}) for index in range(6)]
+        reported = []
+        
+        results = asyncio.run(self.engine.run(rows, lambda index, success: reported.append(index)))
+        
+        assert results == {index: True for index in range(6)}
+        assert sorted(reported) == list(range(6))
+        assert len(self.sockets) == 2
+        filled = [values["Name"] for socket in self.sockets for values in socket.filled]
+        assert sorted(filled) == [f"Person {index}" for index in range(6)]
+    
+    def test_labels_resolved_one_to_one(self):
+        """The Age column goes to the relabelled Age: field, not to Age in Company (Years)"""
+        async def connect(websocket_url):
+            socket = FakeTabSocket(labels=["Name", "Age in Company (Years)", "Age:"])
+            self.sockets.append(socket)
+            return socket
+        self.engine.connect = connect
+        
+        asyncio.run(self.engine.run([(0, {"Name": "A", "Age ": "30"})]))
+        
+        assert self.engine.label_map == {"Name": "Name", "Age": "Age:"}
+        assert [values for socket in self.sockets for values in socket.filled] == [{"Name": "A", "Age:": "30"}]
+    
+    def test_failed_connect_closes_tab(self):
+        """A tab whose websocket cannot be opened is closed again and the run fails"""
+        endpoints = []
+        
+        async def connect(websocket_url):
+            raise ConnectionRefusedError("refused")
+        self.engine.connect = connect
+        self.engine.debug_endpoint = lambda path, method="GET": endpoints.append(path) or {"id": "tab", "webSocketDebuggerUrl": "ws://fake"}
+        
+        with pytest.raises(CDPError):
+            asyncio.run(self.engine.run([(0, {"Name": "A"})]))
+        
+        assert len([path for path in endpoints if path.startswith("/json/close/")]) == 2
+    
+    def test_missing_websockets_fails_before_opening_tabs(self):
+        """Without the optional websockets package no tab is opened at all"""
+        engine = CDPFormEngine("127.0.0.1:9222", "https://docs.google.com/forms/d/e/X/viewform", {"Name": "Name"})
+        engine.debug_endpoint = lambda path, method="GET": pytest.fail(f"opened {path}")
+        
+        with patch('cdp_engine.websockets', None), pytest.raises(ImportError):
+            asyncio.run(engine.run([(0, {"Name": "A"})]))
+    
+    def test_navigation_error_reports_staged_row(self):
+        """A staged row is reported as failed when loading the next form raises"""
+        self.engine.tabs = 1
+        
+        async def broken_navigation(session):
+            raise CDPError("socket closed")
+        self.engine.navigate_to_form = broken_navigation
+        rows = [(0, {"Name": "A"}), (1, {"Name": "B"})]
+        
+        assert asyncio.run(self.engine.run(rows)) == {0: True, 1: False}
+    
+    def test_choice_values_staged_as_options(self):
+        """Radio and checkbox cells are resolved to option indexes before they reach the page"""
+        choices = [
+            {"label": "Gender", "kind": "radio", "options": [{"text": "Male", "value": "Male", "index": 0},
+                                                             {"text": "Female", "value": "Female", "index": 1}]},
+            {"label": "Languages", "kind": "checkbox", "options": [{"text": "Python", "value": "Python", "index": 2},
+                                                                   {"text": "SQL", "value": "SQL", "index": 3}]},
+        ]
+        
+        async def connect(websocket_url):
+            socket = FakeTabSocket(labels=["Name", "Gender", "Languages"], choices=choices)
+            self.sockets.append(socket)
+            return socket
+        self.engine.connect = connect
+        self.engine.tabs = 1
+        self.engine.field_mapping = {"Name": "Name", "Gender": "Gender", "Languages": "Languages"}
+        rows = [(0, {"Name": "A", "Gender": "female", "Languages": "Python; SQL"}), (1, {"Name": "B", "Gender": "Other"})]
+        
+        assert asyncio.run(self.engine.run(rows)) == {0: True, 1: False}
+        assert self.sockets[0].filled == [{"Name": "A", "Gender": [1], "Languages": [2, 3]}]
+    
+    def test_stage_values_skips_empty_cells(self):
+        """Empty cells are not sent to the page"""
+        assert self.engine.stage_values({"Name": "A", "Age ": None}) == {"Name": "A"}
@@ -0,0 +1,114 @@
+"""
+Tests for the crash-safe checkpoint journal
+"""
+
+import pytest
+import pandas as pd
+from unittest.mock import patch
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from checkpoint_journal import CheckpointJournal, row_content_hash
+from preflight import run_preflight
+from robust_automation import RobustAutomation
+
+
+class TestRowContentHash:
+    """Test cases for row_content_hash"""
+    
+    def test_hash_is_stable_and_content_sensitive(self):
+        """Same values hash the same, changed values do not"""
+        columns = ["Name", "Age "]
+        row = pd.Series({"Name": "John", "Age ": 25, "Other": "ignored"})
+        same = pd.Series({"Name": "John", "Age ": 25, "Other": "different"})
+        changed = pd.Series({"Name": "John", "Age ": 26})
+        
+        assert row_content_hash(row, columns) == row_content_hash(same, columns)
+        assert row_content_hash(row, columns) != row_content_hash(changed, columns)
+    
+    def test_raw_and_preflighted_rows_hash_equal(self):
+        """Toggling PREFLIGHT_ENABLED does not change the hash of an unchanged row"""
+        mapping = {"Name": "Name", "Age": "Age ", "Email": "Email Address"}
+        rules = {"Email Address": {"pattern": r"[^@\s]+@[^@\s]+\.[^@\s]+", "remove_whitespace": True}}
+        raw = pd.DataFrame({
+            " Name ": ["MOHD AHMED ", "Asha_x000D_\nRao"],
+            "Age": [26.0, float("nan")],
+            "Email Address": ["mohd@gmail.com", "asha_x000D_\n@gmail.com"],
+        })
+        clean, _ = run_preflight(raw, list(mapping.values()), rules)
+        automation = RobustAutomation()
+        
+        with patch('robust_automation.MANUAL_FIELD_MAPPING', mapping), \
+             patch('robust_automation.VALIDATION_RULES', rules):
+            for index in raw.index:
+                assert automation.row_hash(raw.loc[index]) == automation.row_hash(clean.loc[index])
+            # A streaming source yields the integer cell as 26, pandas as 26.0
+            streamed = {"Name": "MOHD AHMED", "Age ": 26, "Email Address": "mohd@gmail.com"}
+            assert automation.row_hash(streamed) == automation.row_hash(raw.loc[0])
+
+
+class TestCheckpointJournal:
+    """Test cases for CheckpointJournal"""
+    
+    def test_replay_restores_latest_state(self, tmp_path):
+        """Reopening the journal restores each row's latest state"""
+        path = str(tmp_path / "journal.jsonl")
+        journal = CheckpointJournal(path)
+        journal.record(0, "pending", "h0")
+        journal.record(0, "submitted", "h0")
+        journal.record(1, "pending", "h1")
+        journal.record(1, "failed", "h1")
+        journal.close()
+        
+        reopened = CheckpointJournal(path)
+        assert reopened.is_submitted(0, "h0") is True
+        assert reopened.is_submitted(0, "changed") is False
+        assert reopened.is_submitted(1, "h1") is False
+        assert reopened.submitted_count() == 1
+        reopened.close()
+    
+    def test_torn_last_line_is_ignored(self, tmp_path):
+        """A partial write from a crash does not break replay"""
+        path = tmp_path / "journal.jsonl"
+        path.write_text('{"row": 0, "state": "submitted", "hash": "h0", "ts": 1}\n{"row": 1, "sta')
+        
+        journal = CheckpointJournal(str(path))
+        assert journal.is_submitted(0, "h0") is True
+        assert 1 not in journal.states
+        journal.close()
+    
+    def test_records_are_appended(self, tmp_path):
+        """State changes append lines instead of rewriting the file"""
+        path = tmp_path / "journal.jsonl"
+        journal = CheckpointJournal(str(path))
+        for row in range(5):
+            journal.record(row, "submitted", f"h{row}")
+        journal.close()
+        
+        assert len(path.read_text().splitlines()) == 5
+    
+    def test_unknown_state_rejected(self, tmp_path):
+        """Only the known row states can be recorded"""
+        journal = CheckpointJournal(str(tmp_path / "journal.jsonl"))
+        with pytest.raises(ValueError):
+            journal.record(0, "maybe", "h0")
+        journal.close()
+
+
+class TestAutoResume:
+    """Test cases for resuming run_automation from the journal"""
+    
+    def test_resume_index_skips_submitted_rows(self, tmp_path):
+        """Resume starts at the first row not confirmed submitted"""
+        automation = RobustAutomation()
+        automation.data = pd.DataFrame({"Name": ["A", "B", "C", "D"]})
+        automation.journal = CheckpointJournal(str(tmp_path / "journal.jsonl"))
+        for index in (0, 1, 3):
+            automation.journal.record(index, "submitted", automation.row_hash(automation.data.iloc[index]))
+        
+        assert automation.resume_index(0, 4) == 2
+        assert automation.resume_index(3, 4) == 4
+        automation.journal.close()
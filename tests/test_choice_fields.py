@@ -0,0 +1,123 @@
+"""
+Tests for radio, checkbox and dropdown filling through the option index
+"""
+
+from unittest.mock import Mock
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from choice_fields import normalize_option, build_option_index, resolve_choice, option_texts
+from robust_automation import RobustAutomation, CHOICE_SELECT_SCRIPT
+
+
+def make_options(*texts):
+    """Option dicts as returned by the introspection script"""
+    return [{"text": text, "value": text, "element": Mock(name=text)} for text in texts]
+
+
+class TestOptionIndex:
+    """Test cases for normalize_option, build_option_index and resolve_choice"""
+
+    def test_normalize_option(self):
+        """Case, spacing and trailing punctuation do not matter"""
+        assert normalize_option("  North   East. ") == "north east"
+        assert normalize_option("O+") == "o+"
+        assert normalize_option(None) == ""
+
+    def test_lookup_by_text_and_value(self):
+        """Options are found by their text or their data-value"""
+        options = [{"text": "Male", "value": "M", "element": Mock()}, {"text": "Female", "value": "F", "element": Mock()}]
+        index = build_option_index(options)
+
+        assert resolve_choice(index, "male", "radio") == [options[0]]
+        assert resolve_choice(index, "F", "radio") == [options[1]]
+
+    def test_unknown_value(self):
+        """A value matching no option resolves to None"""
+        index = build_option_index(make_options("A+", "B+"))
+        assert resolve_choice(index, "C+", "radio") is None
+
+    def test_checkbox_multiple_values(self):
+        """A checkbox cell may tick several options"""
+        options = make_options("Python", "SQL", "Java")
+        index = build_option_index(options)
+
+        assert resolve_choice(index, "Python, sql", "checkbox") == [options[0], options[1]]
+        assert resolve_choice(index, "Python; Go", "checkbox") is None
+        assert resolve_choice(index, "Python, SQL", "radio") is None
+
+    def test_option_texts_is_truncated(self):
+        """Long option lists are shortened in error messages"""
+        assert option_texts(make_options("a", "b", "c"), limit=2) == "a, b, ... (+1)"
+
+
+class TestChoiceFilling:
+    """Test cases for choice fields in fill_field and the form index"""
+
+    def setup_method(self):
+        """Set up an automation object with an indexed radio and dropdown field"""
+        self.automation = RobustAutomation()
+        self.automation.driver = Mock()
+        self.gender_options = make_options("Male", "Female")
+        self.region_options = make_options("North", "South")
+        self.region_listbox = Mock(name="listbox")
+        self.automation.form_index = {
+            "Gender": {"container": Mock(), "input": None, "kind": "radio", "required": False,
+                       "options": self.gender_options, "option_index": build_option_index(self.gender_options)},
+            "Region": {"container": Mock(), "input": self.region_listbox, "kind": "listbox", "required": False,
+                       "options": self.region_options, "option_index": build_option_index(self.region_options)},
+        }
+
+    def test_radio_is_one_script_call(self):
+        """Selecting a radio option costs a single execute_script"""
+        assert self.automation.fill_field("Gender", "female") is True
+
+        self.automation.driver.execute_script.assert_called_once_with(
+            CHOICE_SELECT_SCRIPT, "radio", None, [self.gender_options[1]["element"]]
+        )
+
+    def test_dropdown_passes_listbox(self):
+        """Dropdowns hand the listbox to the script so it can be opened"""
+        assert self.automation.fill_field("Region", "South") is True
+
+        script, kind, control, elements = self.automation.driver.execute_script.call_args[0]
+        assert (kind, control, elements) == ("listbox", self.region_listbox, [self.region_options[1]["element"]])
+
+    def test_unknown_option_fails_without_round_trip(self):
+        """A value that is not an option fails before anything is sent to the browser"""
+        assert self.automation.fill_field("Gender", "Unknown") is False
+        self.automation.driver.execute_script.assert_not_called()
+
+    def test_js_batch_routes_choices_to_select(self):
+        """js_batch leaves choice fields out of the text batch and selects them separately"""
+        filled = self.automation.fill_fields_js_batch([("Gender", "Male"), ("Region", "North")])
+
+        assert filled == 2
+        assert all(call.args[0] == CHOICE_SELECT_SCRIPT for call in self.automation.driver.execute_script.call_args_list)
+
+    def test_js_index_includes_option_index(self):
+        """The form index built from JS introspection carries the option index"""
+        options = make_options("A+", "O-")
+        self.automation.introspect_form_js = Mock(return_value=[
+            {"container": Mock(), "input": None, "label": "Blood Group", "kind": "radio", "required": True, "options": options},
+        ])
+
+        index = self.automation.build_form_index_js()
+
+        assert index["Blood Group"]["option_index"]["o-"] is options[1]
+
+    def test_selenium_fallback_reads_choice_options(self):
+        """Without a text input the Selenium scan reads the radio options"""
+        container = Mock()
+        male = Mock(text="Male")
+        male.get_attribute.side_effect = lambda name: {"data-value": "Male", "role": "radio"}.get(name)
+        container.find_elements.side_effect = lambda by, selector: [] if "listbox" in selector else [male]
+
+        kind, control, options = self.automation.find_choice_options(container)
+
+        assert kind == "radio"
+        assert control is None
+        assert options == [{"text": "Male", "value": "Male", "element": male}]
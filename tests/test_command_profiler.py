@@ -0,0 +1,99 @@
+"""
+Tests for the WebDriver command profiler
+"""
+
+import json
+from unittest.mock import Mock
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from command_profiler import CommandProfiler
+from robust_automation import RobustAutomation
+
+
+class FakeDriver:
+    """Driver whose execute answers every command like Selenium would"""
+    
+    def __init__(self):
+        self.sent = []
+    
+    def execute(self, driver_command, params=None):
+        self.sent.append(driver_command)
+        return {"value": "https://docs.google.com/forms/d/e/x/viewform"}
+    
+    @property
+    def current_url(self):
+        return self.execute("getCurrentUrl")["value"]
+
+
+class TestCommandProfiler:
+    """Test cases for CommandProfiler"""
+    
+    def setup_method(self):
+        """Profiler attributing commands from this test file"""
+        self.driver = FakeDriver()
+        self.profiler = CommandProfiler(attribution_files=("robust_automation.py", "test_command_profiler.py"))
+        self.profiler.attach(self.driver)
+    
+    def test_commands_attributed_to_caller(self):
+        """Each command is counted under the method that caused it"""
+        def read_url_twice():
+            self.driver.execute("getCurrentUrl")
+            self.driver.execute("getCurrentUrl")
+        
+        read_url_twice()
+        self.driver.execute("findElements", {"using": "css selector", "value": "div"})
+        
+        rows = {(row["method"], row["command"]): row["count"] for row in self.profiler.breakdown()}
+        assert rows[("read_url_twice", "getCurrentUrl")] == 2
+        assert rows[("test_commands_attributed_to_caller", "findElements")] == 1
+        assert self.profiler.total_commands() == 3
+        assert self.profiler.command_counts() == {"getCurrentUrl": 2, "findElements": 1}
+    
+    def test_commands_still_reach_driver(self):
+        """Profiling does not change what is sent or returned"""
+        assert self.driver.current_url.endswith("viewform")
+        assert self.driver.sent == ["getCurrentUrl"]
+    
+    def test_per_entry_breakdown_written(self, tmp_path):
+        """Each entry gets its own breakdown line; the run totals keep accumulating"""
+        path = tmp_path / "profile.jsonl"
+        self.profiler.open(str(path))
+        for index in range(2):
+            self.profiler.start_entry(index)
+            for _ in range(index + 1):
+                self.driver.execute("clickElement")
+            self.profiler.finish_entry()
+        self.profiler.close()
+        
+        records = [json.loads(line) for line in path.read_text().splitlines()]
+        assert [record["commands"] for record in records] == [1, 2]
+        assert records[1]["breakdown"][0]["command"] == "clickElement"
+        assert self.profiler.total_commands() == 3
+    
+    def test_detach_restores_execute(self):
+        """After detach nothing more is counted"""
+        self.profiler.detach()
+        self.driver.execute("getTitle")
+        assert self.profiler.total_commands() == 0
+
+
+class TestAutomationAttribution:
+    """Commands from WebElement calls are attributed to RobustAutomation methods"""
+    
+    def test_element_calls_attributed_to_automation_method(self):
+        """is_displayed() inside a RobustAutomation method is charged to that method"""
+        automation = RobustAutomation()
+        automation.driver = FakeDriver()
+        profiler = CommandProfiler().attach(automation.driver)
+        element = Mock()
+        element.text = "Submit"
+        element.is_displayed.side_effect = lambda: automation.driver.execute("isElementDisplayed")
+        
+        assert automation.is_submit_button(element)
+        
+        assert profiler.breakdown()[0]["method"] == "is_submit_button"
+        assert profiler.breakdown()[0]["command"] == "isElementDisplayed"
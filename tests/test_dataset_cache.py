@@ -0,0 +1,86 @@
+"""
+Tests for the pre-converted dataset cache
+"""
+
+import os
+import time
+import pytest
+import pandas as pd
+from unittest.mock import patch
+import sys
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dataset_cache import DatasetCache, CachedRowSource
+
+COLUMNS = ["Name", "Age ", "Weight in Kgs."]
+
+
+@pytest.fixture
+def workbook(tmp_path):
+    """A small workbook with an empty cell"""
+    path = tmp_path / "data.xlsx"
+    pd.DataFrame({
+        "Name": ["A", "B", "C"],
+        "Age ": [20, 21, 22],
+        "Weight in Kgs.": [58.15, None, 60.0],
+        "Unmapped": [1, 2, 3],
+    }).to_excel(path, index=False)
+    return str(path)
+
+
+class TestDatasetCache:
+    """Test cases for DatasetCache"""
+    
+    def test_build_then_load(self, workbook, tmp_path):
+        """The first call builds the cache, the second loads it without parsing the workbook"""
+        cache = DatasetCache(str(tmp_path / "cache"))
+        built = cache.load_or_build(workbook, COLUMNS)
+        
+        with patch('dataset_cache.open_row_source') as mock_open:
+            loaded = cache.load_or_build(workbook, COLUMNS)
+            mock_open.assert_not_called()
+        
+        assert isinstance(loaded, CachedRowSource)
+        assert list(loaded.rows()) == list(built.rows())
+    
+    def test_values_are_stringified(self, workbook, tmp_path):
+        """Cached values are strings, empty cells come back as None"""
+        source = DatasetCache(str(tmp_path / "cache")).load_or_build(workbook, COLUMNS)
+        rows = dict(source.rows())
+        
+        assert rows[0] == {"Name": "A", "Age ": "20", "Weight in Kgs.": "58.15"}
+        assert rows[1]["Weight in Kgs."] is None
+        assert [index for index, _ in source.rows(1, 3)] == [1, 2]
+    
+    def test_changed_source_rebuilds(self, workbook, tmp_path):
+        """Editing the data file invalidates the cache"""
+        cache = DatasetCache(str(tmp_path / "cache"))
+        cache.load_or_build(workbook, COLUMNS)
+        
+        pd.DataFrame({"Name": ["Z"], "Age ": [30], "Weight in Kgs.": [70.5]}).to_excel(workbook, index=False)
+        os.utime(workbook, ns=(time.time_ns(), time.time_ns() + 10**9))
+        
+        assert cache.load(workbook, COLUMNS) is None
+        rebuilt = cache.load_or_build(workbook, COLUMNS)
+        assert dict(rebuilt.rows()) == {0: {"Name": "Z", "Age ": "30", "Weight in Kgs.": "70.5"}}
+    
+    def test_touched_but_identical_source_is_reused(self, workbook, tmp_path):
+        """A new mtime with the same content keeps the cache (hash match)"""
+        cache = DatasetCache(str(tmp_path / "cache"))
+        cache.load_or_build(workbook, COLUMNS)
+        os.utime(workbook, ns=(time.time_ns(), time.time_ns() + 10**9))
+        
+        assert cache.load(workbook, COLUMNS) is not None
+    
+    def test_missing_mapped_column_still_reuses_cache(self, workbook, tmp_path):
+        """A mapped column the file lacks does not invalidate the cache on every run"""
+        cache = DatasetCache(str(tmp_path / "cache"))
+        columns = COLUMNS + ["Region"]
+        cache.load_or_build(workbook, columns)
+        
+        loaded = cache.load(workbook, columns)
+        
+        assert loaded is not None
+        assert loaded.columns == COLUMNS
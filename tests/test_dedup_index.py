@@ -0,0 +1,93 @@
+"""
+Tests for the duplicate-submission guard
+"""
+
+import pandas as pd
+from unittest.mock import Mock, patch
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dedup_index import DedupIndex
+from robust_automation import RobustAutomation
+
+FORM_URL = "https://docs.google.com/forms/d/e/abc/viewform"
+OTHER_FORM_URL = "https://docs.google.com/forms/d/e/xyz/viewform"
+
+
+class TestDedupIndex:
+    """Test cases for DedupIndex"""
+
+    def test_new_row_is_claimed(self, tmp_path):
+        """Unknown content is not a duplicate"""
+        index = DedupIndex(str(tmp_path / "submitted.jsonl"), FORM_URL)
+
+        assert index.check(0, "h1") is None
+        assert index.duplicates == []
+
+    def test_duplicate_within_sheet(self, tmp_path):
+        """A later row with submitted content is reported against the first one"""
+        index = DedupIndex(str(tmp_path / "submitted.jsonl"), FORM_URL)
+        index.check(3, "h1")
+        index.add(3, "h1")
+
+        assert index.check(7, "h1") == 3
+        assert index.duplicates == [{"entry": 8, "duplicate_of": 4, "source": "submitted before", "hash": "h1"}]
+
+    def test_survives_restart_per_form(self, tmp_path):
+        """Hashes are reloaded for the same form only"""
+        path = str(tmp_path / "submitted.jsonl")
+        first_run = DedupIndex(path, FORM_URL)
+        first_run.add(0, "h1")
+        first_run.close()
+
+        assert DedupIndex(path, FORM_URL + "?usp=sf_link").check(0, "h1") == 0
+        assert DedupIndex(path, OTHER_FORM_URL).check(0, "h1") is None
+
+    def test_in_flight_and_release(self, tmp_path):
+        """Content being submitted blocks copies until it is released"""
+        index = DedupIndex(str(tmp_path / "submitted.jsonl"), FORM_URL)
+        index.check(1, "h1")
+
+        assert index.check(2, "h1") == 1
+        index.release("h1")
+        assert index.check(2, "h1") is None
+
+    def test_torn_line_ignored(self, tmp_path):
+        """A partial write from a crash does not break the index"""
+        path = tmp_path / "submitted.jsonl"
+        path.write_text('{"form": "https://docs.google.com/forms/d/e/abc/viewform", "hash": "h1", "row": 0}\n{"form": "https://doc')
+
+        assert len(DedupIndex(str(path), FORM_URL)) == 1
+
+
+class TestDedupRun:
+    """Duplicates are skipped inside run_automation"""
+
+    def test_duplicate_rows_skipped_and_reported(self, tmp_path, run_settings):
+        """Repeated rows are submitted once and listed in the report"""
+        automation = RobustAutomation()
+        automation.pacer.sleep = Mock()  # no real pauses between entries
+        data = pd.DataFrame({"Name": ["Asha", "Ravi", "Asha", "Ravi", "Meera"]})
+        fill_form = Mock(return_value=True)
+        report_path = tmp_path / "duplicates.csv"
+
+        run_settings(
+            data,
+            GOOGLE_FORM_URL=FORM_URL,
+            JOURNAL_ENABLED=False,
+            RETRY_FAILED_ENTRIES=False,
+            DEDUP_REPORT_PATH=str(report_path),
+        )
+        
+        with patch.object(automation, 'prepare_browser', return_value=True), \
+             patch.object(automation, 'ensure_form_loaded', return_value=True), \
+             patch.object(automation, 'fill_form', fill_form):
+            assert automation.run_automation() is True
+
+        assert [call.args[1] for call in fill_form.call_args_list] == [0, 1, 4]
+        report = pd.read_csv(report_path)
+        assert list(report["entry"]) == [3, 4]
+        assert list(report["duplicate_of"]) == [1, 2]
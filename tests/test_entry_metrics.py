@@ -0,0 +1,100 @@
+"""
+Tests for per-entry phase timing
+"""
+
+import json
+import pytest
+from unittest.mock import patch
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from entry_metrics import EntryMetrics, percentile, timed_phase
+
+
+class TestPercentile:
+    """Test cases for the nearest-rank percentile"""
+    
+    def test_nearest_rank(self):
+        """Percentiles pick an observed value"""
+        values = list(range(1, 101))
+        assert percentile(values, 50) == 50
+        assert percentile(values, 95) == 95
+        assert percentile(values, 99) == 99
+        assert percentile([3.0], 99) == 3.0
+        assert percentile([], 50) == 0.0
+
+
+class TestEntryMetrics:
+    """Test cases for EntryMetrics"""
+    
+    @pytest.fixture(autouse=True)
+    def setup(self, clock):
+        """Metrics driven by a fake perf_counter"""
+        self.clock = clock
+        with patch('entry_metrics.time.perf_counter', clock):
+            self.metrics = EntryMetrics()
+            yield
+        self.metrics.close()
+    
+    def test_nested_phases_are_exclusive(self):
+        """Time inside a nested phase is not counted for the outer one"""
+        self.metrics.start_entry(0)
+        with self.metrics.phase("fill"):
+            self.clock.now += 1.0
+            with self.metrics.phase("label_resolution"):
+                self.clock.now += 0.25
+            self.clock.now += 0.5
+        record = self.metrics.finish_entry(True)
+        
+        assert record["phases"] == {"fill": 1.5, "label_resolution": 0.25}
+        assert record["total"] == 1.75
+    
+    def test_entries_written_as_jsonl(self, tmp_path):
+        """Every finished entry is one JSON line"""
+        path = tmp_path / "metrics.jsonl"
+        self.metrics.open(str(path))
+        for index in range(3):
+            self.metrics.start_entry(index)
+            with self.metrics.phase("detection"):
+                self.clock.now += 0.1
+            self.metrics.finish_entry(index != 1)
+        self.metrics.close()
+        
+        records = [json.loads(line) for line in path.read_text().splitlines()]
+        assert [record["entry"] for record in records] == [0, 1, 2]
+        assert [record["success"] for record in records] == [True, False, True]
+    
+    def test_batch_report(self):
+        """The batch report has percentiles per phase and throughput, then resets"""
+        for index in range(10):
+            self.metrics.start_entry(index)
+            with self.metrics.phase("confirmation_wait"):
+                self.clock.now += 0.1 * (index + 1)
+            self.metrics.finish_entry(True)
+        
+        report = self.metrics.print_batch_report()
+        
+        assert report["entries"] == 10
+        assert report["entries_per_minute"] == pytest.approx(10 / 5.5 * 60)
+        assert report["phases"]["confirmation_wait"]["p50"] == pytest.approx(0.5)
+        assert report["phases"]["confirmation_wait"]["p99"] == pytest.approx(1.0)
+        assert self.metrics.batch_report()["entries"] == 0
+    
+    def test_timed_phase_decorator(self):
+        """Decorated methods are timed under their phase"""
+        clock = self.clock
+        
+        class Worker:
+            metrics = self.metrics
+            
+            @timed_phase("submit_click")
+            def click(self):
+                clock.now += 0.2
+                return "clicked"
+        
+        self.metrics.start_entry(0)
+        assert Worker().click() == "clicked"
+        assert self.metrics.finish_entry(True)["phases"] == {"submit_click": 0.2}
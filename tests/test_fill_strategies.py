@@ -0,0 +1,68 @@
+"""
+Tests for the configurable fill strategies
+"""
+
+import pandas as pd
+from unittest.mock import Mock, patch
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from robust_automation import RobustAutomation, JS_BATCH_FILL_SCRIPT
+
+
+class TestFillStrategies:
+    """Test cases for typed, send_keys_whole and js_batch filling"""
+    
+    def setup_method(self):
+        """Set up an automation object with an indexed two-field form"""
+        self.automation = RobustAutomation()
+        self.automation.driver = Mock()
+        self.automation.driver.execute_script.return_value = 2
+        self.name_input = Mock(name="name_input")
+        self.email_input = Mock(name="email_input")
+        self.automation.form_index = {
+            "Name": {"container": Mock(), "input": self.name_input, "kind": "text", "required": False, "options": []},
+            "Email Address": {"container": Mock(), "input": self.email_input, "kind": "email", "required": False, "options": []},
+        }
+        self.automation.data = pd.DataFrame({"Name": ["John"], "Email Address": ["john@test.com"]})
+        self.automation.submit_form = Mock(return_value=True)
+    
+    @patch('robust_automation.time.sleep')
+    def test_typed_sends_one_key_per_character(self, mock_sleep):
+        """The typed strategy keeps the character-by-character behaviour"""
+        assert self.automation.fill_field("Name", "John", strategy="typed") is True
+        assert self.name_input.send_keys.call_count == 4
+    
+    def test_send_keys_whole_sends_once(self):
+        """send_keys_whole costs one send_keys call per field"""
+        assert self.automation.fill_field("Email Address", "john@test.com", strategy="send_keys_whole") is True
+        self.email_input.send_keys.assert_called_once_with("john@test.com")
+    
+    def test_unknown_strategy_fails_field(self):
+        """An unknown strategy is reported as a failed field"""
+        assert self.automation.fill_field("Name", "John", strategy="telepathy") is False
+    
+    def test_js_batch_fills_entry_in_one_script_call(self):
+        """js_batch sets every field of the entry in one execute_script"""
+        row = self.automation.data.iloc[0]
+        
+        assert self.automation.fill_form(row, 0, strategy="js_batch") is True
+        
+        self.automation.driver.execute_script.assert_called_once()
+        script, pairs = self.automation.driver.execute_script.call_args[0]
+        assert script == JS_BATCH_FILL_SCRIPT
+        assert pairs == [[self.name_input, "John"], [self.email_input, "john@test.com"]]
+        self.name_input.send_keys.assert_not_called()
+    
+    def test_fill_time_recorded_per_strategy(self):
+        """Fill time is accumulated per strategy"""
+        row = self.automation.data.iloc[0]
+        
+        self.automation.fill_form(row, 0, strategy="js_batch")
+        self.automation.fill_form(row, 1, strategy="js_batch")
+        
+        assert self.automation.fill_stats["js_batch"]["entries"] == 2
+        assert self.automation.fill_stats["js_batch"]["seconds"] >= 0
@@ -0,0 +1,123 @@
+"""
+Tests for the per-page form field index
+"""
+
+from unittest.mock import Mock, patch
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from label_resolver import LabelResolver
+from robust_automation import RobustAutomation
+
+
+class TestFormIndex:
+    """Test cases for the label -> container -> input index"""
+    
+    def setup_method(self):
+        """Set up an automation object with a fake two-field form"""
+        self.automation = RobustAutomation()
+        self.name_field = Mock(name="name_field")
+        self.age_field = Mock(name="age_field")
+        self.labels = {
+            self.name_field: "Name",
+            self.age_field: "Age in Company (Years)",
+        }
+        self.automation.find_all_form_fields = Mock(return_value=[self.name_field, self.age_field])
+        self.automation.get_field_label = Mock(side_effect=lambda field: self.labels[field])
+        self.automation.find_input_element = Mock(side_effect=lambda field: Mock(name=f"input_{id(field)}"))
+    
+    def test_index_built_once_per_page(self):
+        """Looking up many fields scans the form only once"""
+        self.automation.find_field_by_label("Name")
+        self.automation.find_field_by_label("Age in Company (Years)")
+        self.automation.find_field_by_label("Name")
+        
+        assert self.automation.find_all_form_fields.call_count == 1
+        assert self.automation.get_field_label.call_count == 2
+    
+    def test_exact_and_partial_lookup(self):
+        """Exact labels win, partial matching is the fallback"""
+        # Only "Name" is mapped, so the company-age field is free for a partial match
+        self.automation.label_resolver = LabelResolver(["Name"])
+        assert self.automation.find_field_by_label("Name") is self.name_field
+        assert self.automation.find_field_by_label("Age in Company") is self.age_field
+        assert self.automation.find_field_by_label("Missing") is None
+    
+    def test_invalidate_forces_rescan(self):
+        """Invalidating the index rescans on the next lookup"""
+        self.automation.find_field_by_label("Name")
+        self.automation.invalidate_form_index()
+        self.automation.find_field_by_label("Name")
+        
+        assert self.automation.find_all_form_fields.call_count == 2
+    
+    def test_load_form_page_invalidates_index(self):
+        """Navigating to a fresh form drops the old index"""
+        self.automation.driver = Mock()
+        self.automation.build_form_index()
+        
+        self.automation.load_form_page()
+        
+        assert self.automation.form_index is None
+        self.automation.driver.get.assert_called_once()
+    
+    @patch('robust_automation.time.sleep')
+    def test_fill_field_uses_indexed_input(self, mock_sleep):
+        """fill_field types into the cached input element"""
+        assert self.automation.fill_field("Name", "John") is True
+        
+        input_element = self.automation.form_index["Name"]["input"]
+        input_element.clear.assert_called_once()
+        assert input_element.send_keys.call_count == len("John")
+
+
+class TestJsIntrospection:
+    """Test cases for the single round trip JS introspection mode"""
+    
+    def setup_method(self):
+        """Set up an automation object with a mocked driver"""
+        self.automation = RobustAutomation()
+        self.automation.driver = Mock()
+        self.automation.find_all_form_fields = Mock(return_value=[])
+    
+    @patch('robust_automation.FORM_INTROSPECTION_MODE', 'js')
+    def test_schema_builds_index_in_one_call(self):
+        """One execute_script call yields the whole index"""
+        name_input = Mock(name="name_input")
+        self.automation.driver.execute_script.return_value = [
+            {"container": Mock(), "input": name_input, "label": "Name", "kind": "text", "required": True, "options": []},
+            {"container": Mock(), "input": None, "label": "Gender", "kind": "radio", "required": False,
+             "options": [{"text": "Male", "value": "Male", "element": Mock()}]},
+            {"container": Mock(), "input": None, "label": "", "kind": "unknown", "required": False, "options": []},
+        ]
+        
+        index = self.automation.build_form_index()
+        
+        assert self.automation.driver.execute_script.call_count == 1
+        self.automation.find_all_form_fields.assert_not_called()
+        assert set(index) == {"Name", "Gender"}
+        assert index["Name"]["input"] is name_input
+        assert index["Name"]["required"] is True
+        assert index["Gender"]["kind"] == "radio"
+        assert len(index["Gender"]["options"]) == 1
+    
+    @patch('robust_automation.FORM_INTROSPECTION_MODE', 'js')
+    def test_falls_back_to_selenium_when_script_fails(self):
+        """Selector fallbacks run when the script raises"""
+        self.automation.driver.execute_script.side_effect = Exception("javascript error")
+        
+        index = self.automation.build_form_index()
+        
+        assert index == {}
+        self.automation.find_all_form_fields.assert_called_once()
+    
+    @patch('robust_automation.FORM_INTROSPECTION_MODE', 'selenium')
+    def test_selenium_mode_skips_script(self):
+        """Selenium mode never runs the introspection script"""
+        self.automation.build_form_index()
+        
+        self.automation.driver.execute_script.assert_not_called()
+        self.automation.find_all_form_fields.assert_called_once()
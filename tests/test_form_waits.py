@@ -0,0 +1,70 @@
+"""
+Tests for the explicit wait conditions and wait subsystem
+"""
+
+from unittest.mock import Mock, patch
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from form_waits import form_fields_present, confirmation_page_visible
+from robust_automation import RobustAutomation
+
+
+class TestWaitConditions:
+    """Test cases for the expected-condition style predicates"""
+    
+    def test_form_fields_present_any(self):
+        """Without an expected count any rendered field is enough"""
+        driver = Mock()
+        driver.find_elements.return_value = []
+        assert form_fields_present()(driver) is False
+        
+        driver.find_elements.return_value = [Mock()]
+        assert form_fields_present()(driver) == driver.find_elements.return_value
+    
+    def test_form_fields_present_expected_count(self):
+        """With an expected count the form is ready only when all fields render"""
+        driver = Mock()
+        driver.find_elements.return_value = [Mock()] * 3
+        assert form_fields_present(17)(driver) is False
+        
+        driver.find_elements.return_value = [Mock()] * 17
+        assert len(form_fields_present(17)(driver)) == 17
+    
+    def test_confirmation_page_visible(self):
+        """Confirmation needs the formResponse URL and the confirmation text"""
+        driver = Mock()
+        driver.current_url = "https://docs.google.com/forms/d/e/x/viewform"
+        assert confirmation_page_visible()(driver) is False
+        
+        driver.current_url = "https://docs.google.com/forms/d/e/x/formResponse"
+        driver.find_element.return_value.text = "Your response has been recorded.\nSubmit another response"
+        assert confirmation_page_visible()(driver) is True
+
+
+class TestWaitSubsystem:
+    """Test cases for RobustAutomation.wait_for and wait_for_form_ready"""
+    
+    def setup_method(self):
+        """Set up an automation object with a mocked driver"""
+        self.automation = RobustAutomation()
+        self.automation.driver = Mock()
+    
+    def test_wait_for_returns_condition_result(self):
+        """A satisfied condition returns immediately with its value"""
+        assert self.automation.wait_for(lambda driver: "ready", 1, "test condition") == "ready"
+    
+    @patch('robust_automation.WAIT_POLL_INTERVAL', 0.01)
+    def test_wait_for_times_out(self):
+        """An unsatisfied condition returns None after the timeout"""
+        assert self.automation.wait_for(lambda driver: False, 0.05, "never") is None
+    
+    def test_wait_for_form_ready_learns_field_count(self):
+        """The first fully loaded form sets the expected field count"""
+        self.automation.driver.find_elements.return_value = [Mock()] * 17
+        
+        assert self.automation.wait_for_form_ready() is True
+        assert self.automation.expected_field_count == 17
@@ -0,0 +1,223 @@
+"""
+Tests for the browserless HTTP submission engine, run against a local stub
+server that mimics Google Forms' viewform/formResponse endpoints
+"""
+
+import json
+import threading
+import pytest
+import pandas as pd
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs
+from unittest.mock import Mock
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from http_engine import HttpFormEngine, form_response_url, parse_form_fields
+from robust_automation import RobustAutomation
+
+FORM_ITEMS = [
+    [101, "Name", None, 0, [[1001, None, 1]]],
+    [102, "Email Address", None, 0, [[1002, None, 1]]],
+    [103, "Section header", None, 8, None],
+    [104, "Gender", None, 2, [[1004, [["Male"], ["Female"]], 0]]],
+    [105, "Age in Company (Years)", None, 0, [[1005, None, 0]]],
+    [106, "Age", None, 0, [[1006, None, 0]]],
+]
+LOAD_DATA = [None, [None, FORM_ITEMS], "/forms", "DMSReg"]
+VIEWFORM_HTML = (
+    "<html><body><form>"
+    '<input type="hidden" name="fbzx" value="-123456">'
+    "</form><script>var FB_PUBLIC_LOAD_DATA_ = " + json.dumps(LOAD_DATA) + ";</script></body></html>"
+)
+
+
+class StubFormHandler(BaseHTTPRequestHandler):
+    """Minimal viewform/formResponse replica"""
+    
+    protocol_version = "HTTP/1.1"  # keep-alive
+    
+    def log_message(self, format, *args):
+        pass
+    
+    def reply(self, status, body):
+        data = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+    
+    def do_GET(self):
+        self.server.client_ports.add(self.client_address[1])
+        if self.path.startswith("/forms/d/e/TEST/viewform"):
+            self.reply(200, VIEWFORM_HTML)
+        else:
+            self.reply(404, "not found")
+    
+    def do_POST(self):
+        self.server.client_ports.add(self.client_address[1])
+        length = int(self.headers.get("Content-Length", 0))
+        fields = parse_qs(self.rfile.read(length).decode("utf-8"))
+        if self.path == "/forms/d/e/TEST/formResponse" and "entry.1001" in fields:
+            self.server.submissions.append(fields)
+            self.reply(200, "<html><body>Your response has been recorded. Submit another response</body></html>")
+        else:
+            self.reply(400, "bad request")
+
+
+@pytest.fixture
+def stub_server():
+    """Serve the stub form on a random local port"""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubFormHandler)
+    server.submissions = []
+    server.client_ports = set()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def stub_form_url(server):
+    return f"http://127.0.0.1:{server.server_address[1]}/forms/d/e/TEST/viewform?usp=sf_link"
+
+
+MAPPING = {
+    "Name": "Name",
+    "Email Address": "Email Address",
+    "Gender": "Gender",
+    "Age": "Age ",
+}
+
+
+class TestParsing:
+    """Test cases for viewform parsing helpers"""
+    
+    def test_form_response_url(self):
+        """viewform URLs map to formResponse without the query string"""
+        assert form_response_url("https://docs.google.com/forms/d/e/X/viewform?pli=1") == \
+            "https://docs.google.com/forms/d/e/X/formResponse"
+    
+    def test_parse_form_fields(self):
+        """Answerable items are extracted with entry IDs, kinds and options"""
+        fields = parse_form_fields(VIEWFORM_HTML)
+        
+        assert [field["label"] for field in fields] == ["Name", "Email Address", "Gender", "Age in Company (Years)", "Age"]
+        assert fields[0]["entry_id"] == 1001
+        assert fields[0]["required"] is True
+        assert fields[2]["kind"] == "radio"
+        assert fields[2]["options"] == ["Male", "Female"]
+    
+    def test_parse_without_load_data(self):
+        """Pages without FB_PUBLIC_LOAD_DATA_ are rejected"""
+        with pytest.raises(ValueError):
+            parse_form_fields("<html></html>")
+
+
+class TestHttpFormEngine:
+    """Test cases for HttpFormEngine against the stub server"""
+    
+    def test_resolve_and_submit(self, stub_server):
+        """Rows are posted as entry.<id> fields and confirmed"""
+        engine = HttpFormEngine(stub_form_url(stub_server), MAPPING)
+        assert engine.resolve_entry_ids() is True
+        assert engine.entry_ids == {"Name": 1001, "Email Address": 1002, "Gender": 1004, "Age": 1006}
+        
+        row = pd.Series({"Name": "John", "Email Address": "john@test.com", "Gender": "Male", "Age ": 25})
+        assert engine.submit_row(row, 0) is True
+        
+        submitted = stub_server.submissions[0]
+        assert submitted["entry.1001"] == ["John"]
+        assert submitted["entry.1006"] == ["25"]
+        assert submitted["fbzx"] == ["-123456"]
+    
+    def test_labels_assigned_one_to_one(self):
+        """A relabelled "Age" field is not lost to "Age in Company (Years)" by partial matching"""
+        items = [item if item[0] != 106 else [106, "Age:", None, 0, [[1006, None, 0]]] for item in FORM_ITEMS]
+        html = VIEWFORM_HTML.replace(json.dumps(LOAD_DATA), json.dumps([None, [None, items], "/forms", "DMSReg"]))
+        http = Mock()
+        http.request.return_value = Mock(status=200, data=html.encode("utf-8"))
+        engine = HttpFormEngine("https://docs.google.com/forms/d/e/X/viewform", MAPPING, http=http)
+        
+        assert engine.resolve_entry_ids() is True
+        assert engine.entry_ids["Age"] == 1006
+    
+    def choice_engine(self):
+        """Engine on a form with a checkbox field, answering every POST with the confirmation page"""
+        items = FORM_ITEMS + [[107, "Languages", None, 4, [[1007, [["Python"], ["SQL"], ["Go"]], 0]]]]
+        html = VIEWFORM_HTML.replace(json.dumps(LOAD_DATA), json.dumps([None, [None, items], "/forms", "DMSReg"]))
+        http = Mock()
+        http.request.return_value = Mock(status=200, data=html.encode("utf-8"))
+        engine = HttpFormEngine("https://docs.google.com/forms/d/e/X/viewform", dict(MAPPING, Languages="Languages"), http=http)
+        assert engine.resolve_entry_ids() is True
+        http.request.return_value = Mock(status=200, data=b"Your response has been recorded.")
+        return engine, http
+    
+    def test_checkbox_values_posted_per_option(self):
+        """Several ticked boxes repeat entry.<id> once per option, with the options' own texts"""
+        engine, http = self.choice_engine()
+        
+        assert engine.submit_row(pd.Series({"Name": "John", "Gender": "female", "Languages": "python, SQL"}), 0) is True
+        
+        fields = http.request.call_args.kwargs["fields"]
+        assert [value for name, value in fields if name == "entry.1007"] == ["Python", "SQL"]
+        assert ("entry.1004", "Female") in fields
+    
+    def test_unknown_option_not_posted(self):
+        """A choice value the form does not list fails the row without a POST"""
+        engine, http = self.choice_engine()
+        http.request.reset_mock()
+        
+        assert engine.submit_row(pd.Series({"Name": "John", "Languages": "Python, Rust"}), 0) is False
+        
+        http.request.assert_not_called()
+        assert "Languages" in engine.last_rejection
+    
+    def test_connection_reused(self, stub_server):
+        """Submissions share one keep-alive connection"""
+        engine = HttpFormEngine(stub_form_url(stub_server), MAPPING)
+        engine.resolve_entry_ids()
+        row = pd.Series({"Name": "John", "Email Address": "john@test.com"})
+        for entry_num in range(5):
+            assert engine.submit_row(row, entry_num) is True
+        
+        assert len(stub_server.submissions) == 5
+        assert len(stub_server.client_ports) == 1
+    
+    def test_rejected_submission(self, stub_server):
+        """A non-confirmation response counts as a failure"""
+        engine = HttpFormEngine(stub_form_url(stub_server), MAPPING)
+        engine.resolve_entry_ids()
+        engine.entry_ids.pop("Name")
+        
+        assert engine.submit_row(pd.Series({"Email Address": "john@test.com"}), 0) is False
+
+
+class TestHttpModeRun:
+    """run_automation in browserless mode reuses the normal row loop"""
+    
+    def test_run_automation_http_mode(self, stub_server, run_settings):
+        """All rows in range are submitted without a browser"""
+        automation = RobustAutomation()
+        automation.pacer.sleep = Mock()  # no real pauses between entries
+        data = pd.DataFrame({
+            "Name": ["A", "B", "C"],
+            "Email Address": ["a@test.com", "b@test.com", "c@test.com"],
+        })
+        run_settings(
+            data,
+            SUBMISSION_ENGINE='http',
+            GOOGLE_FORM_URL=stub_form_url(stub_server),
+            MANUAL_FIELD_MAPPING=MAPPING,
+            PREFLIGHT_ENABLED=True,
+            JOURNAL_ENABLED=True,
+        )
+        
+        assert automation.run_automation() is True
+        
+        assert automation.driver is None
+        assert [fields["entry.1001"][0] for fields in stub_server.submissions] == ["A", "B", "C"]
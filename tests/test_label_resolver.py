@@ -0,0 +1,92 @@
+"""
+Tests for the compiled label resolver
+"""
+
+from unittest.mock import Mock
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from label_resolver import normalize_label, label_similarity, assign_labels, LabelResolver
+from robust_automation import RobustAutomation
+
+
+class TestAssignLabels:
+    """Test cases for normalization and one-to-one assignment"""
+
+    def test_normalize_label(self):
+        """Case, spacing, punctuation and the required asterisk are ignored"""
+        assert normalize_label("  Weight in Kgs. *") == "weight in kgs"
+        assert normalize_label("Age in Company (Years)") == "age in company years"
+
+    def test_similarity_prefers_close_labels(self):
+        """Near-identical wording scores higher than a shared first word"""
+        assert label_similarity("Age in Company", "Age in Company (Years)") > 0.75
+        assert label_similarity("Age", "Age in Company (Years)") < 0.75
+
+    def test_exact_before_fuzzy(self):
+        """'Age' takes the 'Age' field, never 'Age in Company (Years)'"""
+        assignment = assign_labels(["Age", "Age in Company (Years)"], ["Age in Company (Years)", "Age"])
+
+        assert assignment["Age"][0] == "Age"
+        assert assignment["Age in Company (Years)"][0] == "Age in Company (Years)"
+
+    def test_normalized_match(self):
+        """Stray spaces, case and punctuation still match exactly"""
+        assignment = assign_labels(["Registration Number", "Weight in Kgs."], [" registration number *", "Weight in Kgs"])
+
+        assert assignment["Registration Number"] == (" registration number *", 1.0)
+        assert assignment["Weight in Kgs."] == ("Weight in Kgs", 1.0)
+
+    def test_form_label_claimed_once(self):
+        """Two wanted labels never share one form field"""
+        assignment = assign_labels(["Current City", "City"], ["Current City Name"])
+
+        assert list(assignment) == ["Current City"]
+
+    def test_unmatched_label_left_out(self):
+        """Nothing close enough means no assignment instead of a wrong one"""
+        assert assign_labels(["Age"], ["Age in Company (Years)"]) == {}
+
+
+class TestLabelResolver:
+    """Test cases for LabelResolver and its use in find_indexed_field"""
+
+    def test_compiled_once_per_form(self):
+        """Rebuilt indexes with the same labels reuse the compiled map"""
+        resolver = LabelResolver(["Name", "Email Address"])
+        first = {"Name": 1, "Email address": 2}
+        second = {"Name": 3, "Email address": 4}
+
+        assert resolver.resolve("Email Address", first) == "Email address"
+        assert resolver.resolve("Name", first) == "Name"
+        assert resolver.resolve("Email Address", second) == "Email address"
+        assert resolver.compilations == 1
+
+    def test_new_labels_recompile(self):
+        """A form with different labels is compiled again"""
+        resolver = LabelResolver(["Name"])
+        resolver.resolve("Name", {"Name": 1})
+        resolver.resolve("Name", {"Full Name": 1})
+
+        assert resolver.compilations == 2
+
+    def test_unmapped_label_never_takes_a_claimed_field(self):
+        """A lookup outside the mapping only matches form labels the mapping left free"""
+        resolver = LabelResolver(["Age in Company (Years)"])
+        form_index = {"Age in Company (Years)": 1, "Region": 2}
+
+        assert resolver.resolve("Age in Company", form_index) is None
+        assert resolver.resolve("Age in Company (Years)", form_index) == "Age in Company (Years)"
+
+    def test_find_indexed_field_uses_resolver(self):
+        """The automation resolves mapping labels through the compiled map"""
+        automation = RobustAutomation()
+        age_entry = {"container": Mock(), "input": Mock(), "kind": "text", "required": False, "options": []}
+        company_entry = {"container": Mock(), "input": Mock(), "kind": "text", "required": False, "options": []}
+        automation.form_index = {"Age in Company (Years)": company_entry, "Age *": age_entry}
+
+        assert automation.find_indexed_field("Age") is age_entry
+        assert automation.find_indexed_field("Age in Company (Years)") is company_entry
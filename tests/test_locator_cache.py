@@ -0,0 +1,111 @@
+"""
+Tests for the locator cache and its use in element lookups
+"""
+
+from unittest.mock import Mock, patch
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from locator_cache import LocatorCache
+from robust_automation import RobustAutomation
+
+
+def make_element(text, displayed=True):
+    """Mock WebElement with visible text"""
+    element = Mock()
+    element.text = text
+    element.is_displayed.return_value = displayed
+    element.is_enabled.return_value = True
+    element.get_attribute.return_value = None
+    return element
+
+
+class TestLocatorCache:
+    """Test cases for LocatorCache"""
+    
+    def setup_method(self):
+        """Empty cache and a mocked driver"""
+        self.cache = LocatorCache()
+        self.driver = Mock()
+        self.driver.execute_script.return_value = "#submit"
+    
+    def test_unknown_target_is_a_miss(self):
+        """Nothing remembered yet means a miss and no driver call"""
+        assert self.cache.lookup(self.driver, "submit button") is None
+        self.driver.find_elements.assert_not_called()
+        assert self.cache.summary() == [("submit button", 0, 1)]
+    
+    def test_remembered_selector_is_a_hit(self):
+        """A remembered selector is tried with one find_elements call"""
+        button = make_element("Submit")
+        self.cache.remember(self.driver, "submit button", "text content", button)
+        self.driver.find_elements.return_value = [button]
+        
+        assert self.cache.lookup(self.driver, "submit button") is button
+        self.driver.find_elements.assert_called_once_with("css selector", "#submit")
+        assert self.cache.summary() == [("submit button", 1, 0)]
+    
+    def test_failed_validation_forgets_locator(self):
+        """An element that no longer validates is a miss and the locator is dropped"""
+        self.cache.remember(self.driver, "submit button", "text content", make_element("Submit"))
+        self.driver.find_elements.return_value = [make_element("Clear form")]
+        
+        assert self.cache.lookup(self.driver, "submit button", lambda element: "submit" in element.text.lower()) is None
+        assert self.cache.strategy_for("submit button") is None
+    
+    def test_strategy_without_element(self):
+        """Strategies can be remembered without a selector"""
+        self.cache.remember(self.driver, "field containers", "listitem selector")
+        assert self.cache.strategy_for("field containers") == "listitem selector"
+        self.driver.execute_script.assert_not_called()
+
+
+class TestCachedLookups:
+    """Test cases for the cached fast path in RobustAutomation"""
+    
+    def setup_method(self):
+        """Automation object with a mocked driver"""
+        self.automation = RobustAutomation()
+        self.automation.driver = Mock()
+        self.automation.driver.execute_script.return_value = "body > div > a"
+    
+    def test_another_response_link_cached_after_first_scan(self):
+        """The fallback chain runs once; later confirmation pages hit the cached selector"""
+        link = make_element("Submit another response")
+        self.automation.driver.find_elements.return_value = [make_element("Edit"), link]
+        
+        assert self.automation.find_another_response_button() is link
+        self.automation.driver.find_elements.reset_mock()
+        self.automation.driver.find_elements.return_value = [link]
+        
+        assert self.automation.find_another_response_button() is link
+        self.automation.driver.find_elements.assert_called_once_with("css selector", "body > div > a")
+        assert ("another response link", 1, 1) in self.automation.locator_cache.summary()
+    
+    def test_submit_button_cached(self):
+        """The submit button is found by the cached selector on the next entry"""
+        button = make_element("Submit")
+        self.automation.driver.find_elements.return_value = [button]
+        
+        assert self.automation.find_submit_button() is button
+        assert self.automation.find_submit_button() is button
+        assert ("submit button", 1, 1) in self.automation.locator_cache.summary()
+    
+    @patch.object(RobustAutomation, 'wait_for')
+    @patch.object(RobustAutomation, 'check_browser_active', return_value=True)
+    def test_field_strategy_remembered(self, mock_active, mock_wait):
+        """The field container strategy that worked is tried first next time"""
+        self.automation.find_fields_by_listitem = Mock(return_value=[])
+        self.automation.find_fields_by_answer_text = Mock(return_value=[make_element("Name")])
+        self.automation.find_fields_by_direct_inputs = Mock(return_value=[])
+        
+        self.automation.find_all_form_fields()
+        self.automation.find_fields_by_listitem.reset_mock()
+        self.automation.find_all_form_fields()
+        
+        self.automation.find_fields_by_listitem.assert_not_called()
+        assert self.automation.locator_cache.strategy_for("field containers") == "'Your answer' text"
+        assert ("field containers", 1, 1) in self.automation.locator_cache.summary()
@@ -0,0 +1,154 @@
+"""
+Tests for the adaptive (AIMD) pacing controller
+"""
+
+import pytest
+import pandas as pd
+from unittest.mock import Mock, patch
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pacing import PacingController
+from robust_automation import RobustAutomation
+
+
+def make_pacer(**overrides):
+    """Controller with the config.py defaults, no jitter and a recording sleep"""
+    settings = dict(step=0.05, backoff=2.0, ceiling=30.0, jitter=0, sleep=Mock())
+    settings.update(overrides)
+    return PacingController(0.05, 0.5, 1.0, 0.5, **settings)
+
+
+class TestPacingController:
+    """Test cases for additive speed-up and multiplicative back-off"""
+
+    def test_clean_submissions_speed_up_to_minimum(self):
+        """Each clean submission takes one step off, never below the minimum"""
+        pacer = make_pacer()
+
+        assert pacer.observe() == pytest.approx(0.95)
+        for _ in range(20):
+            pacer.observe()
+
+        assert pacer.delay == 0.5
+        assert pacer.speed_ups == 21
+
+    def test_trouble_multiplies_delay(self):
+        """A confirmation timeout doubles the delay"""
+        pacer = make_pacer()
+
+        assert pacer.observe("submission not confirmed") == 2.0
+        assert pacer.back_offs == {"submission not confirmed": 1}
+
+    def test_rate_limit_backs_off_harder_up_to_ceiling(self):
+        """Rate-limit pages count double and the delay stops at the ceiling"""
+        pacer = make_pacer(ceiling=10.0)
+
+        assert pacer.observe("rate limited") == 4.0
+        assert pacer.observe("rate limited") == 10.0
+
+    def test_error_details_grouped_by_reason(self):
+        """'fill error: ...' reasons are counted under one key"""
+        pacer = make_pacer()
+        pacer.observe("fill error: stale element")
+        pacer.observe("fill error: timeout")
+
+        assert pacer.back_offs == {"fill error": 2}
+
+    def test_slow_confirmation_holds_pace(self):
+        """A confirmation far slower than usual stops the speed-up for that entry"""
+        pacer = make_pacer()
+        for _ in range(3):
+            pacer.observe(latency=0.4)
+        delay = pacer.delay
+
+        assert pacer.observe(latency=2.0) == delay
+        assert pacer.holds == 1
+
+    def test_other_delays_scale_with_pace(self):
+        """Field and post-submission pauses shrink and grow with the submission delay"""
+        pacer = make_pacer()
+        for _ in range(10):
+            pacer.observe()
+
+        pacer.field_pause()
+        pacer.after_submission_pause()
+
+        assert pacer.sleep.call_args_list[0].args[0] == pytest.approx(0.025)
+        assert pacer.sleep.call_args_list[1].args[0] == pytest.approx(0.25)
+
+    def test_fixed_pacing_uses_configured_range(self):
+        """With adaptive pacing off the delays stay as configured"""
+        rng = Mock(return_value=0.7)
+        pacer = make_pacer(adaptive=False, rng=rng)
+
+        pacer.observe("rate limited")
+        pacer.submission_pause()
+
+        assert pacer.delay == 1.0
+        rng.assert_called_once_with(0.5, 1.0)
+
+
+class TestPacingSignals:
+    """Test cases for the signals the automation feeds to the controller"""
+
+    def setup_method(self):
+        """Create an automation instance with a recording pacer"""
+        self.automation = RobustAutomation()
+        self.automation.pacer = make_pacer()
+
+    def test_missing_fields_back_off(self):
+        """A submitted entry with unfilled fields still slows the pace"""
+        self.automation.missing_fields = 2
+
+        self.automation.pace_after_entry(True)
+
+        assert self.automation.pacer.back_offs == {"missing fields": 1}
+
+    def test_failed_entry_reports_reason(self):
+        """A failed entry backs off with its failure reason"""
+        self.automation.failure_reason = "rate limited"
+
+        self.automation.pace_after_entry(False)
+
+        assert self.automation.pacer.delay == 4.0
+
+    @patch('robust_automation.time.sleep')
+    def test_typing_has_no_hidden_delay(self, mock_sleep):
+        """Typing a value does not sleep per keystroke outside the pacer"""
+        input_element = Mock()
+
+        self.automation.type_value(input_element, "John")
+
+        assert input_element.send_keys.call_count == 4
+        mock_sleep.assert_not_called()
+
+    def test_rate_limit_page_detected(self):
+        """An unusual-traffic page is recognised as rate limiting"""
+        self.automation.driver = Mock()
+        self.automation.driver.find_element.return_value.text = "Our systems have detected unusual traffic"
+
+        assert self.automation.rate_limited() is True
+    
+    def test_skipped_rows_cost_no_pause(self, tmp_path, run_settings):
+        """Only rows that are actually submitted wait between submissions"""
+        data = pd.DataFrame({"Name": ["Asha", "Asha", "Asha", "Ravi"]})
+        
+        run_settings(
+            data,
+            JOURNAL_ENABLED=False,
+            RETRY_FAILED_ENTRIES=False,
+            DEDUP_ENABLED=True,
+            DEDUP_REPORT_PATH=str(tmp_path / "duplicates.csv"),
+        )
+        
+        with patch.object(self.automation, 'prepare_browser', return_value=True), \
+             patch.object(self.automation, 'ensure_form_loaded', return_value=True), \
+             patch.object(self.automation, 'fill_form', return_value=True), \
+             patch.object(self.automation.pacer, 'submission_pause') as pause:
+            assert self.automation.run_automation() is True
+        
+        pause.assert_called_once()
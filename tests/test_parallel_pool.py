@@ -0,0 +1,231 @@
+"""
+Tests for the parallel submission pool
+"""
+
+import pandas as pd
+import threading
+import time
+from unittest.mock import Mock, patch
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from parallel_pool import RateLimiter, WorkerPool
+from dedup_index import DedupIndex
+from checkpoint_journal import CheckpointJournal
+from robust_automation import RobustAutomation
+
+
+def frame_rows(data, start_index, end_index):
+    """(index, row) pairs of a DataFrame range, as the row sources yield them"""
+    return ((index, data.iloc[index]) for index in range(start_index, end_index))
+
+
+class FakeAutomation:
+    """Stand-in for RobustAutomation that records submitted rows"""
+    
+    submitted = []
+    lock = threading.Lock()
+    
+    def __init__(self):
+        self.driver = Mock()
+        self.data = None
+    
+    def setup_driver(self, **kwargs):
+        return True
+    
+    def load_form_page(self):
+        pass
+    
+    def wait_for_form_ready(self):
+        return True
+    
+    def ensure_form_loaded(self, entry_num, interactive=True):
+        return True
+    
+    def fill_form(self, row_data, entry_num):
+        with FakeAutomation.lock:
+            FakeAutomation.submitted.append(entry_num)
+        return entry_num % 5 != 0
+
+
+class AlwaysSubmits(FakeAutomation):
+    """FakeAutomation whose submissions never fail"""
+    
+    def fill_form(self, row_data, entry_num):
+        super().fill_form(row_data, entry_num)
+        return True
+
+
+class TestWorkerPool:
+    """Test cases for WorkerPool"""
+    
+    def setup_method(self):
+        """Reset the shared submission log"""
+        FakeAutomation.submitted = []
+        self.data = pd.DataFrame({"Name": [f"Person {i}" for i in range(40)]})
+    
+    @patch('parallel_pool.resolve_driver_path')
+    def test_each_row_submitted_exactly_once(self, mock_manager):
+        """Rows in the range are split across workers with no duplicates"""
+        pool = WorkerPool(4, automation_factory=FakeAutomation)
+        
+        results = pool.run(frame_rows(self.data, 5, 35))
+        
+        assert sorted(FakeAutomation.submitted) == list(range(5, 35))
+        assert list(results) == list(range(5, 35))
+        assert results[10] is False
+        assert results[11] is True
+    
+    @patch('parallel_pool.resolve_driver_path')
+    def test_workers_attach_to_debug_ports(self, mock_manager):
+        """With debug ports configured, workers attach instead of launching headless"""
+        pool = WorkerPool(2, automation_factory=FakeAutomation, debug_ports=[9222, 9223])
+        automation = Mock()
+        
+        pool.start_worker_driver(automation, 1)
+        
+        assert automation.setup_driver.call_args.kwargs["debugger_address"] == "127.0.0.1:9223"
+    
+    @patch('parallel_pool.resolve_driver_path')
+    def test_workers_capped_at_debug_ports(self, mock_manager):
+        """Extra workers are not attached to a Chrome another worker already drives"""
+        pool = WorkerPool(4, automation_factory=FakeAutomation, debug_ports=[9222, 9223])
+        ports = []
+        pool.start_worker_driver = lambda automation, worker_id: ports.append(pool.debug_ports[worker_id]) or True
+        
+        results = pool.run(frame_rows(self.data, 0, 10))
+        
+        assert pool.worker_count == 2
+        assert sorted(ports) == [9222, 9223]
+        assert list(results) == list(range(10))
+    
+    @patch('parallel_pool.resolve_driver_path')
+    def test_duplicate_content_submitted_once(self, mock_manager, tmp_path):
+        """With a dedup index, rows repeating earlier content are skipped across workers"""
+        data = pd.DataFrame({"Name": [f"Person {i % 10}" for i in range(30)]})
+        dedup = DedupIndex(str(tmp_path / "submitted.jsonl"), "https://docs.google.com/forms/d/e/abc/viewform")
+        pool = WorkerPool(4, automation_factory=AlwaysSubmits, dedup_index=dedup, row_hash=lambda row: row["Name"])
+        
+        results = pool.run(frame_rows(data, 0, 30))
+        
+        assert len(FakeAutomation.submitted) == 10
+        assert sorted(data.loc[FakeAutomation.submitted, "Name"]) == sorted(set(data["Name"]))
+        assert len(results) + len(dedup.duplicates) == 30
+    
+    @patch('parallel_pool.resolve_driver_path')
+    def test_results_reported_to_callback(self, mock_manager):
+        """Every outcome is passed to on_result together with its row"""
+        pool = WorkerPool(3, automation_factory=FakeAutomation)
+        reported = {}
+        
+        pool.run(frame_rows(self.data, 0, 12), lambda index, row, success: reported.update({index: (row["Name"], success)}))
+        
+        assert sorted(reported) == list(range(12))
+        assert reported[5] == ("Person 5", False)
+    
+    def test_claim_is_exclusive(self):
+        """A row can only be claimed once"""
+        pool = WorkerPool(2, automation_factory=FakeAutomation)
+        assert pool.claim(3) is True
+        assert pool.claim(3) is False
+
+
+class FlakyAutomation(AlwaysSubmits):
+    """Fails each row's first attempt when its index is divisible by 4"""
+    
+    attempts = {}
+    
+    def fill_form(self, row_data, entry_num):
+        super().fill_form(row_data, entry_num)
+        with FakeAutomation.lock:
+            FlakyAutomation.attempts[entry_num] = FlakyAutomation.attempts.get(entry_num, 0) + 1
+            return entry_num % 4 != 0 or FlakyAutomation.attempts[entry_num] > 1
+
+
+class TestParallelRun:
+    """run_automation with PARALLEL_WORKERS > 1 uses the same row pipeline as a single browser"""
+    
+    def setup_method(self):
+        FakeAutomation.submitted = []
+        FlakyAutomation.attempts = {}
+    
+    def run(self, run_settings, data, **overrides):
+        settings = {
+            'PARALLEL_WORKERS': 3,
+            'WORKER_DEBUG_PORTS': [],
+            'MAX_SUBMISSIONS_PER_MINUTE': None,
+            'SUBMISSION_ENGINE': 'browser',
+            'JOURNAL_ENABLED': True,
+            'AUTO_RESUME': True,
+            'RETRY_FAILED_ENTRIES': True,
+            'MAX_RETRIES': 2,
+            'RETRY_BASE_DELAY': 0,
+            'UNATTENDED_MODE': False,
+            'REPLAY_DEAD_LETTERS': False,
+        }
+        settings.update(overrides)
+        automation = RobustAutomation()
+        run_settings(data, RobustAutomation=FlakyAutomation, **settings)
+        with patch('parallel_pool.resolve_driver_path'):
+            assert automation.run_automation() is True
+        return automation
+    
+    def test_failures_retried_and_journaled(self, tmp_path, run_settings):
+        """Failed rows are retried on a fresh pool and every row ends up submitted in the journal"""
+        data = pd.DataFrame({"Name": [f"Person {i}" for i in range(10)]})
+        
+        automation = self.run(run_settings, data)
+        
+        assert sorted(FakeAutomation.submitted) == sorted(list(range(10)) + [0, 4, 8])
+        assert automation.retry_queue.recovered == 3
+        journal = CheckpointJournal(str(tmp_path / "journal.jsonl"))
+        assert journal.submitted_count() == 10
+        journal.close()
+    
+    def test_resume_skips_journaled_rows(self, run_settings):
+        """A second run only submits rows the journal has not confirmed"""
+        data = pd.DataFrame({"Name": [f"Person {i}" for i in range(6)]})
+        self.run(run_settings, data, END_INDEX=3)
+        FakeAutomation.submitted = []
+        
+        self.run(run_settings, data)
+        
+        assert sorted(set(FakeAutomation.submitted)) == [3, 4, 5]
+    
+    def test_stop_file_ends_the_run(self, tmp_path, run_settings):
+        """Unattended parallel runs hand out no rows once the stop file exists"""
+        (tmp_path / "STOP").write_text("")
+        data = pd.DataFrame({"Name": [f"Person {i}" for i in range(6)]})
+        
+        self.run(run_settings, data, UNATTENDED_MODE=True, STOP_FILE_PATH=str(tmp_path / "STOP"))
+        
+        assert FakeAutomation.submitted == []
+    
+    def test_non_browser_engine_rejected(self, tmp_path):
+        """The pool only drives browsers, so other engines are refused up front"""
+        automation = RobustAutomation()
+        with patch('robust_automation.PARALLEL_WORKERS', 2), patch('robust_automation.SUBMISSION_ENGINE', 'http'):
+            assert automation.run_automation() is False
+
+
+class TestRateLimiter:
+    """Test cases for the global rate limiter"""
+    
+    def test_spaces_calls(self):
+        """Calls are spaced by 60 / max_per_minute seconds"""
+        limiter = RateLimiter(1200)  # 50ms interval
+        start = time.monotonic()
+        for _ in range(4):
+            limiter.acquire()
+        assert time.monotonic() - start >= 0.14
+    
+    def test_disabled_limit(self):
+        """No limit configured means no waiting"""
+        limiter = RateLimiter(None)
+        start = time.monotonic()
+        for _ in range(100):
+            limiter.acquire()
+        assert time.monotonic() - start < 0.1
@@ -0,0 +1,127 @@
+"""
+Tests for the vectorized preflight pass
+"""
+
+import pandas as pd
+from unittest.mock import patch
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from preflight import match_columns, normalize_values, run_preflight
+from row_source import open_row_source
+from robust_automation import RobustAutomation
+
+RULES = {
+    "Email Address": {"pattern": r"[^@\s]+@[^@\s]+\.[^@\s]+", "remove_whitespace": True, "required": True},
+    "Mobile Number": {"pattern": r"[0-9*+\-]{10,15}", "remove_whitespace": True},
+    "Age ": {"min": 14, "max": 100},
+    "Weight in Kgs.": {"min": 20, "max": 300},
+}
+COLUMNS = [" Registration Number", "Name", "Email Address", "Age ", "Mobile Number", "Weight in Kgs."]
+
+
+def sample_frame():
+    """Rows covering each normalization and validation case"""
+    return pd.DataFrame({
+        "Registration Number": [488561.0, 565635.0, 100.0, 101.0, 102.0],
+        " Name ": ["  MOHD AHMED ", "Rajkumar", "Bad Email", "Old", None],
+        "Email Address": ["mohd@gmail.com", "raj_x000D_\n@gmail.com", "not-an-email", "old@test.com", "none@test.com"],
+        "Age": [26.0, 48.0, 30.0, 130.0, 40.0],
+        "Mobile Number": ["******3737", "9876543210", "9876543210", "9876543210", "12"],
+        "Weight in Kgs.": ["58.15", "53.18", "60", "58..45", "55"],
+    })
+
+
+class TestNormalization:
+    """Test cases for header matching and value normalization"""
+    
+    def test_match_columns_tolerates_whitespace_and_case(self):
+        """Mapped names match headers regardless of stray spaces"""
+        matched = match_columns(["Registration Number", "Age", "name"], [" Registration Number", "Age ", "Name", "Missing"])
+        assert matched == {" Registration Number": "Registration Number", "Age ": "Age", "Name": "name"}
+    
+    def test_normalize_values(self):
+        """Integral floats lose '.0', text is trimmed, empties become None"""
+        values = normalize_values(pd.Series([25.0, "  Pune ", None, "", 58.15, "a_x000D_\nb"]))
+        assert values.tolist()[:2] == ["25", "Pune"]
+        assert pd.isna(values[2]) and pd.isna(values[3])
+        assert values.tolist()[4:] == ["58.15", "a b"]
+    
+    def test_nan_text_is_kept(self):
+        """Cells whose text is 'Nan' are values, only real NaNs are empty"""
+        values = normalize_values(pd.Series(["Nan", "NAN", float("nan")]))
+        assert values.tolist()[:2] == ["Nan", "NAN"]
+        assert pd.isna(values[2])
+
+
+class TestRunPreflight:
+    """Test cases for run_preflight"""
+    
+    def test_clean_rows_and_report(self):
+        """Valid rows come back as strings, invalid ones land in the report"""
+        clean, report = run_preflight(sample_frame(), COLUMNS, RULES)
+        
+        assert list(clean.index) == [0, 1]
+        assert clean.loc[0].to_dict() == {
+            " Registration Number": "488561",
+            "Name": "MOHD AHMED",
+            "Email Address": "mohd@gmail.com",
+            "Age ": "26",
+            "Mobile Number": "******3737",
+            "Weight in Kgs.": "58.15",
+        }
+        assert clean.loc[1, "Email Address"] == "raj@gmail.com"
+        
+        reasons = dict(zip(report["entry"], report["reason"]))
+        assert reasons[3] == "invalid Email Address"
+        assert "invalid Age" in reasons[4] and "invalid Weight in Kgs." in reasons[4]
+        assert reasons[5] == "invalid Mobile Number"
+
+
+class TestPreflightRun:
+    """RobustAutomation only hands clean rows to the browser"""
+    
+    def test_run_preflight_checks(self, tmp_path):
+        """Rejected rows are reported and skipped by iter_rows"""
+        automation = RobustAutomation()
+        automation.data = sample_frame()
+        report_path = tmp_path / "rejected.csv"
+        
+        with patch('robust_automation.MANUAL_FIELD_MAPPING', {column.strip(): column for column in COLUMNS}), \
+             patch('robust_automation.VALIDATION_RULES', RULES), \
+             patch('robust_automation.PREFLIGHT_REPORT_PATH', str(report_path)):
+            rejected = automation.run_preflight_checks(0, 5)
+        
+        assert rejected == 3
+        assert report_path.exists()
+        assert [index for index, _ in automation.iter_rows(0, 5)] == [0, 1]
+    
+    def test_streaming_preflight_is_chunked(self, tmp_path):
+        """A streaming source is preflighted a chunk at a time and keeps its clean rows lazy"""
+        path = tmp_path / "data.csv"
+        sample_frame().to_csv(path, index=False)
+        automation = RobustAutomation()
+        automation.row_source = open_row_source(str(path), columns=sample_frame().columns)
+        chunk_sizes = []
+        
+        def recording_preflight(frame, columns, rules):
+            chunk_sizes.append(len(frame))
+            return run_preflight(frame, columns, rules)
+        
+        with patch('robust_automation.MANUAL_FIELD_MAPPING', {column.strip(): column for column in COLUMNS}), \
+             patch('robust_automation.VALIDATION_RULES', RULES), \
+             patch('robust_automation.PREFLIGHT_CHUNK_SIZE', 2), \
+             patch('robust_automation.PREFLIGHT_REPORT_PATH', str(tmp_path / "rejected.csv")), \
+             patch('preflight.run_preflight', side_effect=recording_preflight):
+            rejected = automation.run_preflight_checks(0, 5)
+            rows = dict(automation.iter_rows(0, 5))
+        
+        assert rejected == 3
+        assert max(chunk_sizes) == 2
+        assert list(rows) == [0, 1]
+        assert rows[0]["Name"] == "MOHD AHMED"
+        assert rows[0][" Registration Number"] == "488561"
+        assert rows[1]["Email Address"] == "raj@gmail.com"
@@ -0,0 +1,262 @@
+"""
+Tests for the retry queue and dead-letter file
+"""
+
+import json
+import pandas as pd
+import pytest
+from unittest.mock import Mock, patch
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from retry_queue import RetryQueue, load_dead_letters
+from cdp_engine import CDPError
+from robust_automation import RobustAutomation
+
+
+class TestRetryQueue:
+    """Test cases for RetryQueue"""
+    
+    @pytest.fixture(autouse=True)
+    def setup(self, clock):
+        """Queue with three retries and a 5s base delay"""
+        self.clock = clock
+        self.queue = RetryQueue(3, base_delay=5, clock=self.clock)
+    
+    def test_exponential_backoff(self):
+        """Each further failure doubles the wait"""
+        row = {"Name": "A"}
+        delays = []
+        for _ in range(3):
+            self.queue.add(0, row, "not confirmed")
+            delays.append(self.queue.seconds_until_next())
+            self.clock.now += delays[-1]
+            assert self.queue.due()[0][:3] == (0, row, len(delays))
+        
+        assert delays == [5, 10, 20]
+    
+    def test_due_only_after_backoff(self):
+        """Rows are not handed out before their backoff expires, oldest first"""
+        self.queue.add(3, {"Name": "C"}, "timeout")
+        self.clock.now += 1
+        self.queue.add(1, {"Name": "A"}, "timeout")
+        
+        assert self.queue.due() == []
+        self.clock.now += 10
+        assert [item[0] for item in self.queue.due()] == [3, 1]
+        assert len(self.queue) == 0
+    
+    def test_dead_letter_after_max_retries(self, tmp_path):
+        """A row failing more than max_retries times is written to the dead-letter file"""
+        path = tmp_path / "dead.jsonl"
+        queue = RetryQueue(1, base_delay=0, dead_letter_path=str(path), clock=self.clock)
+        row = pd.Series({"Name": "A", "Age ": 25, "Middle Initial": float("nan")})
+        
+        assert queue.add(7, row, "submit button not found") is True
+        queue.due()
+        assert queue.add(7, row, "submission not confirmed") is False
+        
+        record = json.loads(path.read_text())
+        assert record["index"] == 7
+        assert record["attempts"] == 2
+        assert record["reason"] == "submission not confirmed"
+        assert record["row"] == {"Name": "A", "Age ": "25", "Middle Initial": None}
+        assert load_dead_letters(str(path)) == [(7, {"Name": "A", "Age ": "25", "Middle Initial": None})]
+    
+    def test_abandon_dead_letters_pending(self, tmp_path):
+        """Rows still queued when the run stops are not lost"""
+        path = tmp_path / "dead.jsonl"
+        queue = RetryQueue(2, dead_letter_path=str(path), clock=self.clock)
+        queue.add(1, {"Name": "A"}, "timeout")
+        queue.abandon("run stopped")
+        
+        assert len(queue) == 0
+        assert [index for index, row in load_dead_letters(str(path))] == [1]
+
+
+class TestRetryRun:
+    """Retries inside run_automation"""
+    
+    def run(self, run_settings, fill_results, rows=4, max_retries=1, replay=False):
+        """Run the automation with a scripted fill_form outcome per call"""
+        automation = RobustAutomation()
+        automation.pacer.sleep = Mock()  # no real pauses between entries
+        data = pd.DataFrame({"Name": [f"Person {i}" for i in range(rows)]})
+        calls = []
+        
+        def fill_form(row_data, entry_num):
+            calls.append(entry_num)
+            return fill_results(entry_num, calls.count(entry_num))
+        
+        run_settings(
+            data,
+            RETRY_FAILED_ENTRIES=True,
+            MAX_RETRIES=max_retries,
+            RETRY_BASE_DELAY=0,
+            REPLAY_DEAD_LETTERS=replay,
+            JOURNAL_ENABLED=False,
+        )
+        
+        with patch.object(automation, 'prepare_browser', return_value=True), \
+             patch.object(automation, 'load_form_page'), \
+             patch.object(automation, 'ensure_form_loaded', return_value=True), \
+             patch.object(automation, 'fill_form', side_effect=fill_form):
+            assert automation.run_automation() is True
+        return automation, calls
+    
+    def test_failed_row_retried_between_entries(self, tmp_path, run_settings):
+        """A failed row is retried right after the next entry, not at the end"""
+        automation, calls = self.run(run_settings, lambda index, attempt: not (index == 1 and attempt == 1))
+        
+        assert calls == [0, 1, 1, 2, 3]
+        assert automation.retry_queue.recovered == 1
+        assert not (tmp_path / "dead.jsonl").exists()
+    
+    def test_persistent_failure_dead_lettered_and_replayed(self, tmp_path, run_settings):
+        """A row that keeps failing ends up in the dead-letter file, which can be replayed"""
+        automation, calls = self.run(run_settings, lambda index, attempt: index != 2)
+        
+        assert calls.count(2) == 2
+        assert [index for index, row in load_dead_letters(str(tmp_path / "dead.jsonl"))] == [2]
+        
+        automation, calls = self.run(run_settings, lambda index, attempt: True, replay=True)
+        assert calls == [2]
+        assert (tmp_path / "dead.jsonl.replayed").exists()
+    
+    def test_cdp_failures_retried_and_dead_lettered(self, tmp_path, run_settings):
+        """With the CDP engine failed rows are retried on fresh tabs and dead-lettered when they keep failing"""
+        automation = RobustAutomation()
+        data = pd.DataFrame({"Name": [f"Person {i}" for i in range(3)]})
+        calls = []
+        
+        class FakeEngine:
+            def __init__(self, *args, **kwargs):
+                pass
+            
+            async def run(self, rows, on_result=None):
+                results = {}
+                for index, row_data in rows:
+                    calls.append(index)
+                    results[index] = index != 2 and not (index == 1 and calls.count(1) == 1)
+                    on_result(index, results[index])
+                return results
+        
+        run_settings(
+            data,
+            SUBMISSION_ENGINE='cdp',
+            CDPFormEngine=FakeEngine,
+            RETRY_FAILED_ENTRIES=True,
+            MAX_RETRIES=1,
+            RETRY_BASE_DELAY=0,
+            JOURNAL_ENABLED=False,
+        )
+        
+        assert automation.run_automation() is True
+        
+        assert sorted(calls) == [0, 1, 1, 2, 2]
+        assert automation.retry_queue.recovered == 1
+        assert [index for index, row in load_dead_letters(str(tmp_path / "dead.jsonl"))] == [2]
+    
+    def test_cdp_rows_lost_by_a_tab_are_retried(self, run_settings):
+        """A row a tab took but never reported goes to the retry queue instead of being dropped"""
+        automation = RobustAutomation()
+        data = pd.DataFrame({"Name": [f"Person {i}" for i in range(2)]})
+        calls = []
+        
+        class FakeEngine:
+            def __init__(self, *args, **kwargs):
+                pass
+            
+            async def run(self, rows, on_result=None):
+                results = {}
+                for index, row_data in rows:
+                    calls.append(index)
+                    if index == 1 and calls.count(1) == 1:
+                        continue  # the tab died with this row staged
+                    results[index] = True
+                    on_result(index, True)
+                return results
+        
+        run_settings(
+            data,
+            SUBMISSION_ENGINE='cdp',
+            CDPFormEngine=FakeEngine,
+            RETRY_FAILED_ENTRIES=True,
+            MAX_RETRIES=1,
+            RETRY_BASE_DELAY=0,
+            JOURNAL_ENABLED=False,
+        )
+        
+        assert automation.run_automation() is True
+        
+        assert calls == [0, 1, 1]
+        assert automation.retry_queue.recovered == 1
+    
+    def test_cdp_retries_dead_lettered_when_no_tab_starts(self, tmp_path, run_settings):
+        """The retry loop stops and dead-letters its rows once fresh tabs cannot start"""
+        automation = RobustAutomation()
+        data = pd.DataFrame({"Name": ["Person 0"]})
+        passes = []
+        
+        class FakeEngine:
+            def __init__(self, *args, **kwargs):
+                pass
+            
+            async def run(self, rows, on_result=None):
+                passes.append(1)
+                if len(passes) > 1:
+                    raise CDPError("None of the 2 tabs could be started")
+                for index, row_data in rows:
+                    on_result(index, False)
+                return {index: False for index in [0]}
+        
+        run_settings(
+            data,
+            SUBMISSION_ENGINE='cdp',
+            CDPFormEngine=FakeEngine,
+            RETRY_FAILED_ENTRIES=True,
+            MAX_RETRIES=5,
+            RETRY_BASE_DELAY=0,
+            JOURNAL_ENABLED=False,
+        )
+        
+        automation.run_automation()
+        
+        assert len(passes) == 2
+        assert automation.retry_queue.dead_lettered == 1
+        assert "could not be started" in (tmp_path / "dead.jsonl").read_text()
+    
+    def test_cdp_replays_dead_letters(self, tmp_path, run_settings):
+        """REPLAY_DEAD_LETTERS feeds the dead-lettered rows to the CDP engine instead of the Excel range"""
+        automation = RobustAutomation()
+        dead_letters = tmp_path / "dead.jsonl"
+        queue = RetryQueue(0, 0, str(dead_letters))
+        queue.add(7, {"Name": "Person 7"}, "timeout")
+        data = pd.DataFrame({"Name": [f"Person {i}" for i in range(3)]})
+        submitted = []
+        
+        class FakeEngine:
+            def __init__(self, *args, **kwargs):
+                pass
+            
+            async def run(self, rows, on_result=None):
+                for index, row_data in rows:
+                    submitted.append((index, row_data["Name"]))
+                    on_result(index, True)
+                return {index: True for index, _ in submitted}
+        
+        run_settings(
+            data,
+            SUBMISSION_ENGINE='cdp',
+            CDPFormEngine=FakeEngine,
+            REPLAY_DEAD_LETTERS=True,
+            DEAD_LETTER_PATH=str(dead_letters),
+            JOURNAL_ENABLED=False,
+        )
+        
+        assert automation.run_automation() is True
+        
+        assert submitted == [(7, "Person 7")]
@@ -0,0 +1,105 @@
+"""
+Tests for the streaming row sources
+"""
+
+import pytest
+import pandas as pd
+from unittest.mock import patch
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from row_source import open_row_source
+from robust_automation import RobustAutomation
+
+SAMPLE_FRAME = pd.DataFrame({
+    " Registration Number": [100, 101, 102, 103, 104],
+    "Name": ["A", "B", "C", "D", "E"],
+    "Age ": [20, 21, 22, 23, 24],
+    "Unmapped": ["x", "y", "z", "w", "v"],
+})
+
+
+@pytest.fixture(params=[".xlsx", ".csv"])
+def data_file(request, tmp_path):
+    """Write the sample frame as xlsx and csv"""
+    path = tmp_path / f"data{request.param}"
+    if request.param == ".xlsx":
+        SAMPLE_FRAME.to_excel(path, index=False)
+    else:
+        SAMPLE_FRAME.to_csv(path, index=False)
+    return str(path)
+
+
+class TestRowSources:
+    """Test cases shared by the xlsx and csv sources"""
+    
+    def test_length(self, data_file):
+        """The source reports the number of data rows"""
+        source = open_row_source(data_file, columns=["Name"])
+        assert len(source) == 5
+        source.close()
+    
+    def test_rows_start_at_index_with_mapped_columns_only(self, data_file):
+        """Rows start at start_index and only carry the requested columns"""
+        source = open_row_source(data_file, columns=[" Registration Number", "Name", "Age ", "Missing"])
+        rows = list(source.rows(3))
+        source.close()
+        
+        assert [index for index, _ in rows] == [3, 4]
+        assert set(rows[0][1]) == {" Registration Number", "Name", "Age "}
+        assert rows[0][1]["Name"] == "D"
+        assert str(rows[0][1]["Age "]) == "23"
+    
+    def test_rows_stop_at_end_index(self, data_file):
+        """end_index is exclusive"""
+        source = open_row_source(data_file, columns=["Name"])
+        assert [row["Name"] for _, row in source.rows(1, 3)] == ["B", "C"]
+        source.close()
+    
+    def test_xlsx_drops_trailing_formatted_rows(self, tmp_path):
+        """Trailing empty rows that only carry formatting are dropped like pandas does"""
+        from openpyxl import Workbook
+        from openpyxl.styles import Font
+        path = tmp_path / "formatted.xlsx"
+        workbook = Workbook()
+        sheet = workbook.active
+        sheet.append(["Name", "Age "])
+        sheet.append(["A", 20])
+        sheet.append([None, None])
+        sheet.append(["B", 21])
+        sheet.cell(row=6, column=1).font = Font(bold=True)  # trailing formatted blank row
+        workbook.save(path)
+        
+        source = open_row_source(str(path), columns=["Name"])
+        rows = list(source.rows())
+        assert len(source) == len(pd.read_excel(path)) == 3
+        source.close()
+        
+        assert rows == [(0, {"Name": "A"}), (1, {"Name": None}), (2, {"Name": "B"})]
+    
+    def test_unsupported_extension(self, tmp_path):
+        """Unknown file types are rejected"""
+        with pytest.raises(ValueError):
+            open_row_source(str(tmp_path / "data.json"))
+
+
+class TestStreamingRun:
+    """RobustAutomation reads rows through the streaming source"""
+    
+    def test_load_rows_and_iterate(self, tmp_path):
+        """Stream mode does not build a DataFrame"""
+        path = tmp_path / "data.xlsx"
+        SAMPLE_FRAME.to_excel(path, index=False)
+        automation = RobustAutomation()
+        
+        with patch('robust_automation.ROW_SOURCE_MODE', 'stream'), \
+             patch('robust_automation.DATASET_CACHE_DIR', str(tmp_path / "cache")), \
+             patch('robust_automation.EXCEL_FILE_PATH', str(path)):
+            assert automation.load_rows() is True
+        
+        assert automation.data is None
+        assert automation.total_rows == 5
+        assert [row["Name"] for _, row in automation.iter_rows(2, 5)] == ["C", "D", "E"]
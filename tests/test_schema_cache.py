@@ -0,0 +1,144 @@
+"""
+Tests for the on-disk form schema cache
+"""
+
+import json
+from unittest.mock import Mock
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from schema_cache import FormSchemaCache, form_key, schema_fingerprint
+from robust_automation import RobustAutomation, FORM_FINGERPRINT_SCRIPT, CACHED_INDEX_SCRIPT, MANUAL_FIELD_MAPPING
+
+FORM_URL = "https://docs.google.com/forms/d/e/abc/viewform"
+
+
+class TestFormSchemaCache:
+    """Test cases for keys, fingerprints and the cache file"""
+
+    def test_form_key_ignores_query(self):
+        """Share links with different query strings are the same form"""
+        assert form_key(FORM_URL + "?usp=sf_link") == form_key(FORM_URL)
+
+    def test_fingerprint_changes_with_labels(self):
+        """A renamed or added field changes the fingerprint"""
+        original = schema_fingerprint(["Name", "Age"])
+
+        assert original["count"] == 2
+        assert schema_fingerprint(["Name", "Age"]) == original
+        assert schema_fingerprint(["Name", "Age (Years)"]) != original
+        assert schema_fingerprint(["Name", "Age", "City"])["count"] == 3
+
+    def test_save_and_reload(self, tmp_path):
+        """A saved schema is found by a fresh cache object"""
+        path = str(tmp_path / "schema.json")
+        fields = [{"label": "Name", "position": 0, "kind": "text", "required": True, "options": []}]
+        FormSchemaCache(path).save(FORM_URL, schema_fingerprint(["Name"]), fields, {"Name": "Name"})
+
+        entry = FormSchemaCache(path).get(FORM_URL + "?usp=sf_link")
+
+        assert entry["fields"] == fields
+        assert entry["label_map"] == {"Name": "Name"}
+
+    def test_unreadable_file_is_empty_cache(self, tmp_path):
+        """A corrupt cache file is ignored"""
+        path = tmp_path / "schema.json"
+        path.write_text("{not json")
+
+        assert FormSchemaCache(str(path)).get(FORM_URL) is None
+
+
+class TestCachedFormIndex:
+    """Test cases for validating and using the cached schema"""
+
+    def setup_method(self):
+        """Set up an automation object with a cached two-field schema"""
+        self.automation = RobustAutomation()
+        self.automation.driver = Mock()
+        self.fields = [
+            {"label": "Name", "position": 1, "kind": "text", "required": True, "options": []},
+            {"label": "Gender", "position": 2, "kind": "radio", "required": False,
+             "options": [{"text": "Male", "value": "Male", "index": 0}, {"text": "Female", "value": "Female", "index": 1}]},
+        ]
+        self.headings = ["Intro", "Name", "Gender"]
+        self.automation.schema_cache = Mock()
+        self.automation.schema_cache.get.return_value = {
+            "fingerprint": schema_fingerprint(self.headings),
+            "fields": self.fields,
+            "label_map": {wanted: (wanted if wanted in ("Name", "Gender") else None) for wanted in MANUAL_FIELD_MAPPING},
+        }
+
+    def test_valid_fingerprint_uses_cache(self):
+        """A matching fingerprint enables the cached schema"""
+        self.automation.driver.execute_script.return_value = self.headings
+
+        assert self.automation.validate_form_schema() is True
+        self.automation.driver.execute_script.assert_called_once_with(FORM_FINGERPRINT_SCRIPT)
+
+    def test_incomplete_label_map_is_rediscovered(self):
+        """A cached map missing a mapped label is not restored; discovery caches a complete one"""
+        self.automation.driver.execute_script.return_value = self.headings
+        self.automation.schema_cache.get.return_value["label_map"] = {"Name": "Name"}
+
+        assert self.automation.validate_form_schema() is False
+        assert self.automation.form_schema is None
+        assert self.automation.label_resolver.form_labels is None
+
+    def test_changed_form_is_rediscovered(self):
+        """A different fingerprint drops the cached schema"""
+        self.automation.driver.execute_script.return_value = ["Intro", "Full Name", "Gender"]
+
+        assert self.automation.validate_form_schema() is False
+        assert self.automation.form_schema is None
+
+    def test_cached_index_is_one_call(self):
+        """With a valid schema each page is indexed by position in one script call"""
+        self.automation.form_schema = self.automation.schema_cache.get.return_value
+        name_input, male, female = Mock(name="name"), Mock(name="male"), Mock(name="female")
+        self.automation.driver.execute_script.return_value = [
+            {"container": Mock(), "input": name_input, "options": []},
+            {"container": Mock(), "input": None, "options": [male, female]},
+        ]
+        self.automation.introspect_form_js = Mock()
+
+        index = self.automation.build_form_index()
+
+        self.automation.introspect_form_js.assert_not_called()
+        script, positions, count = self.automation.driver.execute_script.call_args[0]
+        assert script == CACHED_INDEX_SCRIPT
+        assert positions == [[1, "text"], [2, "radio"]]
+        assert count == 3
+        assert index["Name"]["input"] is name_input
+        assert index["Gender"]["option_index"]["female"]["element"] is female
+
+    def test_layout_mismatch_falls_back(self):
+        """A page that no longer matches the schema runs full discovery"""
+        self.automation.form_schema = self.automation.schema_cache.get.return_value
+        self.automation.driver.execute_script.return_value = None
+        self.automation.introspect_form_js = Mock(return_value=[
+            {"container": Mock(), "input": Mock(), "label": "Name", "kind": "text", "required": True, "options": [], "heading": "Name"},
+        ])
+
+        index = self.automation.build_form_index()
+
+        assert list(index) == ["Name"]
+        assert self.automation.form_schema is None
+
+    def test_discovery_is_saved(self, tmp_path):
+        """The schema of a full discovery is written once the form is detected"""
+        self.automation.schema_cache = FormSchemaCache(str(tmp_path / "schema.json"))
+        self.automation.introspect_form_js = Mock(return_value=[
+            {"container": Mock(), "input": None, "label": "", "kind": "unknown", "required": False, "options": [], "heading": ""},
+            {"container": Mock(), "input": Mock(), "label": "Name", "kind": "text", "required": True, "options": [], "heading": "Name"},
+        ])
+        self.automation.build_form_index_js()
+
+        assert self.automation.save_form_schema() is True
+
+        saved = json.loads((tmp_path / "schema.json").read_text())["forms"]
+        entry = next(iter(saved.values()))
+        assert entry["fingerprint"] == schema_fingerprint(["", "Name"])
+        assert entry["fields"][0]["position"] == 1
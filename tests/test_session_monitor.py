@@ -0,0 +1,207 @@
+"""
+Tests for the background session health monitor and reconnect
+"""
+
+import io
+import json
+import pandas as pd
+import pytest
+from unittest.mock import Mock, PropertyMock, patch
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from session_monitor import SessionMonitor
+from robust_automation import RobustAutomation
+
+
+class FakeEndpoints:
+    """urlopen replacement answering chromedriver /status and Chrome /json/version"""
+    
+    def __init__(self):
+        self.driver_alive = True
+        self.chrome_alive = True
+        self.urls = []
+    
+    def __call__(self, url, timeout=None):
+        self.urls.append(url)
+        if url.endswith("/status"):
+            if not self.driver_alive:
+                raise ConnectionRefusedError("connection refused")
+            return io.BytesIO(json.dumps({"value": {"ready": True}}).encode())
+        if not self.chrome_alive:
+            raise ConnectionRefusedError("connection refused")
+        return io.BytesIO(json.dumps({"Browser": "Chrome/120"}).encode())
+
+
+class TestSessionMonitor:
+    """Test cases for SessionMonitor"""
+    
+    @pytest.fixture(autouse=True)
+    def setup(self, clock):
+        """Monitor probing fake endpoints"""
+        self.endpoints = FakeEndpoints()
+        self.clock = clock
+        self.abort = Mock()
+        self.monitor = SessionMonitor(
+            "127.0.0.1:9222", "http://127.0.0.1:55555", hang_timeout=60,
+            abort=self.abort, opener=self.endpoints, clock=self.clock
+        )
+    
+    def test_healthy_session(self):
+        """Both endpoints answering means healthy, without any WebDriver command"""
+        assert self.monitor.check_now() is True
+        assert self.endpoints.urls == ["http://127.0.0.1:55555/status", "http://127.0.0.1:9222/json/version"]
+    
+    def test_dead_chromedriver(self):
+        """A chromedriver that refuses connections is reported"""
+        self.endpoints.driver_alive = False
+        assert self.monitor.check_now() is False
+        assert "chromedriver" in self.monitor.reason
+    
+    def test_dead_chrome(self):
+        """Chrome gone from the debug port is reported"""
+        self.endpoints.chrome_alive = False
+        assert self.monitor.check_now() is False
+        assert self.monitor.chrome_reachable() is False
+    
+    def test_hung_entry_aborts_session(self):
+        """An entry running past hang_timeout marks the session hung and aborts it"""
+        self.monitor.entry_started()
+        self.clock.now += 30
+        assert self.monitor.check_hang() is False
+        self.clock.now += 31
+        assert self.monitor.check_hang() is True
+        
+        assert self.monitor.healthy is False
+        self.abort.assert_called_once()
+    
+    def test_idle_time_is_not_a_hang(self):
+        """Time between entries (cooldowns, prompts) never counts as a hang"""
+        self.monitor.entry_started()
+        self.monitor.entry_finished()
+        self.clock.now += 3600
+        assert self.monitor.check_hang() is False
+        self.abort.assert_not_called()
+    
+    def test_reset_after_reconnect(self):
+        """A reset clears the failure and takes the new chromedriver URL"""
+        self.endpoints.driver_alive = False
+        self.monitor.check_now()
+        self.monitor.reset("http://127.0.0.1:60000")
+        
+        assert self.monitor.healthy is True
+        assert self.monitor.driver_url == "http://127.0.0.1:60000"
+
+
+class TestSessionRecovery:
+    """Test cases for reconnecting RobustAutomation"""
+    
+    def setup_method(self):
+        """Automation with a mocked driver and monitor"""
+        self.automation = RobustAutomation()
+        self.automation.pacer.sleep = Mock()  # no real pauses between entries
+        self.automation.driver = Mock()
+        self.automation.monitor = Mock()
+        self.automation.monitor.chrome_reachable.return_value = True
+    
+    def test_hot_path_uses_monitor_verdict(self):
+        """find_all_form_fields no longer sends a current_url check when monitored"""
+        current_url = PropertyMock(return_value="https://docs.google.com/forms/d/e/x/viewform")
+        type(self.automation.driver).current_url = current_url
+        self.automation.monitor.healthy = False
+        
+        assert self.automation.find_all_form_fields() == []
+        assert self.automation.session_healthy() is False
+        current_url.assert_not_called()
+    
+    def test_healthy_lookup_skips_url_round_trip(self):
+        """A monitored, healthy session detects fields without asking for current_url"""
+        current_url = PropertyMock(return_value="https://docs.google.com/forms/d/e/x/viewform")
+        type(self.automation.driver).current_url = current_url
+        self.automation.monitor.healthy = True
+        self.automation.wait_for = Mock()
+        self.automation.find_fields_by_listitem = Mock(return_value=[])
+        self.automation.find_fields_by_answer_text = Mock(return_value=[])
+        self.automation.find_fields_by_direct_inputs = Mock(return_value=[])
+        
+        assert self.automation.find_all_form_fields() == []
+        current_url.assert_not_called()
+    
+    @patch('robust_automation.time.sleep')
+    def test_recover_session_reconnects(self, mock_sleep):
+        """The driver is recreated, the form reloaded and the monitor reset"""
+        self.automation.setup_driver = Mock(side_effect=[False, True])
+        self.automation.load_form_page = Mock()
+        self.automation.wait_for_form_ready = Mock(return_value=True)
+        self.automation.build_form_index = Mock(return_value={"Name": {}})
+        
+        assert self.automation.recover_session() is True
+        assert self.automation.setup_driver.call_count == 2
+        self.automation.load_form_page.assert_called_once()
+        self.automation.monitor.reset.assert_called_once()
+    
+    @patch('robust_automation.time.sleep')
+    def test_recover_session_relaunches_dead_chrome(self, mock_sleep):
+        """Chrome is relaunched when the debug port is gone"""
+        self.automation.monitor.chrome_reachable.side_effect = [False, True]
+        self.automation.setup_driver = Mock(return_value=True)
+        self.automation.load_form_page = Mock()
+        self.automation.wait_for_form_ready = Mock(return_value=True)
+        self.automation.build_form_index = Mock(return_value={"Name": {}})
+        
+        with patch('robust_automation.CHROME_LAUNCH_COMMAND', ["chrome", "--remote-debugging-port=9222"]), \
+             patch('robust_automation.subprocess.Popen') as mock_popen:
+            assert self.automation.recover_session() is True
+        mock_popen.assert_called_once()
+    
+    def test_run_resumes_current_row_after_reconnect(self, run_settings):
+        """A row that failed because the browser died is filled again after reconnecting"""
+        data = pd.DataFrame({"Name": ["A", "B", "C"]})
+        monitor = Mock()
+        monitor.healthy = True
+        monitor.check_now.return_value = False
+        outcomes = iter([True, False, True, True])
+        
+        def start_monitor():
+            self.automation.monitor = monitor
+        
+        run_settings(data, HEALTH_MONITOR_ENABLED=True, RETRY_FAILED_ENTRIES=False, JOURNAL_ENABLED=False)
+        
+        with patch.object(self.automation, 'prepare_browser', return_value=True), \
+             patch.object(self.automation, 'start_session_monitor', side_effect=start_monitor), \
+             patch.object(self.automation, 'recover_session', return_value=True) as recover, \
+             patch.object(self.automation, 'ensure_form_loaded', return_value=True), \
+             patch.object(self.automation, 'fill_form', side_effect=lambda row, index: next(outcomes)) as fill:
+            assert self.automation.run_automation() is True
+        
+        assert [call.args[1] for call in fill.call_args_list] == [0, 1, 1, 2]
+        recover.assert_called_once()
+        monitor.stop.assert_called_once()
+    
+    def test_form_reload_prompt_is_not_a_hang(self, run_settings, clock):
+        """Waiting in ensure_form_loaded (e.g. for Enter) past the hang timeout does not abort the session"""
+        data = pd.DataFrame({"Name": ["A", "B"]})
+        abort = Mock()
+        monitor = SessionMonitor(None, None, hang_timeout=120, abort=abort, opener=FakeEndpoints(), clock=clock)
+        
+        def start_monitor():
+            self.automation.monitor = monitor
+        
+        def slow_reload(entry_num, interactive=True):
+            clock.now += 600  # the person takes ten minutes to fix the page
+            return not monitor.check_hang()
+        
+        run_settings(data, HEALTH_MONITOR_ENABLED=True, RETRY_FAILED_ENTRIES=False, JOURNAL_ENABLED=False)
+        
+        with patch.object(self.automation, 'prepare_browser', return_value=True), \
+             patch.object(self.automation, 'start_session_monitor', side_effect=start_monitor), \
+             patch.object(self.automation, 'ensure_form_loaded', side_effect=slow_reload) as reload, \
+             patch.object(self.automation, 'fill_form', return_value=True):
+            assert self.automation.run_automation() is True
+        
+        reload.assert_called_once()
+        abort.assert_not_called()
+        assert monitor.healthy is True
@@ -0,0 +1,120 @@
+"""
+Tests for the pre-loaded form tab pool
+"""
+
+from unittest.mock import Mock, patch
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tab_pool import FormTabPool, OPEN_TAB_SCRIPT, RECYCLE_TAB_SCRIPT
+from robust_automation import RobustAutomation
+
+FORM_URL = "https://docs.google.com/forms/d/e/x/viewform"
+
+
+class FakeTabDriver:
+    """Driver stand-in that tracks window handles and script calls"""
+    
+    def __init__(self):
+        self.window_handles = ["main"]
+        self.current_window_handle = "main"
+        self.scripts = []
+        self.switch_to = Mock()
+        self.switch_to.window.side_effect = self.switch
+    
+    def switch(self, handle):
+        self.current_window_handle = handle
+    
+    def execute_script(self, script, *args):
+        self.scripts.append((self.current_window_handle, script, args))
+        if script == OPEN_TAB_SCRIPT:
+            self.window_handles.append(f"tab{len(self.window_handles)}")
+    
+    def close(self):
+        self.window_handles.remove(self.current_window_handle)
+
+
+class TestFormTabPool:
+    """Test cases for FormTabPool"""
+    
+    def setup_method(self):
+        """Pool of three tabs on a fake driver"""
+        self.driver = FakeTabDriver()
+        self.pool = FormTabPool(self.driver, FORM_URL, 3)
+    
+    def test_open_preloads_extra_tabs(self):
+        """Two extra tabs are opened and the driver stays on the original"""
+        assert self.pool.open() == 3
+        assert self.driver.window_handles == ["main", "tab1", "tab2"]
+        assert self.driver.current_window_handle == "main"
+    
+    def test_rotate_recycles_spent_tab(self):
+        """The spent tab is reloaded without blocking and goes to the back of the queue"""
+        self.pool.open()
+        visited = [self.pool.rotate() for _ in range(4)]
+        
+        assert visited == ["tab1", "tab2", "main", "tab1"]
+        recycled = [(handle, args) for handle, script, args in self.driver.scripts if script == RECYCLE_TAB_SCRIPT]
+        assert recycled[0] == ("main", (FORM_URL,))
+        assert [handle for handle, args in recycled] == ["main", "tab1", "tab2", "main"]
+    
+    def test_single_tab_does_not_rotate(self):
+        """With one tab rotate is a no-op"""
+        pool = FormTabPool(self.driver, FORM_URL, 1)
+        pool.open()
+        assert pool.rotate() == "main"
+        assert self.driver.scripts == []
+    
+    def test_close_keeps_original_tab(self):
+        """Only the pool's tabs are closed, wherever the rotation stopped"""
+        self.pool.open()
+        self.pool.rotate()
+        self.pool.close()
+        
+        assert self.driver.window_handles == ["main"]
+        assert self.driver.current_window_handle == "main"
+
+
+class TestPreloadedTabSubmit:
+    """Test cases for submit_form in multi-tab mode"""
+    
+    @patch('robust_automation.confirmation_page_visible')
+    def test_confirmed_submit_switches_tab(self, mock_confirmation):
+        """After confirmation the next tab is used instead of 'Submit another response'"""
+        automation = RobustAutomation()
+        automation.pacer.sleep = Mock()  # no real pauses between entries
+        automation.driver = Mock()
+        automation.tab_pool = Mock()
+        automation.find_submit_button = Mock()
+        automation.wait_for = Mock(return_value=True)
+        automation.wait_for_form_ready = Mock(return_value=True)
+        automation.build_form_index = Mock(return_value={"Name": {}})
+        
+        assert automation.submit_form() is True
+        automation.tab_pool.rotate.assert_called_once()
+        automation.build_form_index.assert_called_once()
+        automation.driver.find_elements.assert_not_called()
+    
+    @patch('robust_automation.time.sleep')
+    def test_recovery_replaces_tab_pool(self, mock_sleep):
+        """Reconnecting closes the old pool's tabs through the new session before opening a new pool"""
+        automation = RobustAutomation()
+        automation.driver = Mock()
+        old_pool = Mock()
+        old_pool.close.side_effect = RuntimeError("tab already gone")
+        automation.tab_pool = old_pool
+        automation.setup_driver = Mock(return_value=True)
+        automation.load_form_page = Mock()
+        automation.wait_for_form_ready = Mock(return_value=True)
+        automation.build_form_index = Mock(return_value={"Name": {}})
+        
+        with patch('robust_automation.FormTabPool') as pool_class:
+            assert automation.recover_session() is True
+        
+        old_pool.close.assert_called_once()
+        assert old_pool.driver is automation.driver
+        assert automation.tab_pool is pool_class.return_value
+        pool_class.return_value.open.assert_called_once()